@@ -0,0 +1,98 @@
+# Compares the integer-based implementation of the numeric helpers with the
+# previous float-based one (`math.log10`, quantize patterns built from strings).
+#
+# Run from the root directory of the package (after `pip3 install -e .`):
+#   python3 ./benchmarks/helpers_benchmark.py
+
+import math
+import random
+import timeit
+from decimal import Decimal
+
+from application.helpers import Helpers
+from domain.value import Value
+
+
+def legacy_get_exponent(value: Decimal) -> int:
+    if value == 0:
+        return 0
+    return math.floor(math.log10(abs(value)))
+
+
+def legacy_get_first_digit(value: Decimal) -> int:
+    # The original used the int `10` here, which fails for values < 1
+    n = abs(value) * Decimal(10) ** (-legacy_get_exponent(value))
+    return math.floor(n)
+
+
+def legacy_round_to_n_decimal_places(value: Decimal, n: int) -> str:
+    decimal_value = value.quantize(Decimal(f"1.{'0' * n}"))
+    return f"{decimal_value:.{n}f}"
+
+
+def legacy_rounds_to_zero(value: Decimal, min_exponent: int) -> bool:
+    return Decimal(legacy_round_to_n_decimal_places(value, -min_exponent)) == 0
+
+
+def legacy_value(value: Decimal, sigfigs: int):
+    max_exponent = legacy_get_exponent(value)
+    min_exponent = max_exponent - sigfigs + 1
+    return legacy_round_to_n_decimal_places(abs(value), max(-min_exponent, 0))
+
+
+def new_value(value: Decimal, sigfigs: int):
+    v = Value(value)
+    v.set_sigfigs(sigfigs)
+    return Helpers.round_to_n_decimal_places(v.get_abs(), max(v.get_decimal_place(), 0))
+
+
+def main():
+    random.seed(42)
+    values = [Decimal(random.uniform(-1, 1) * 10 ** random.randint(-8, 8)) for _ in range(2_000)]
+    number = 20
+
+    cases = [
+        (
+            "get_exponent",
+            lambda: [legacy_get_exponent(v) for v in values],
+            lambda: [Helpers.get_exponent(v) for v in values],
+        ),
+        (
+            "get_first_digit",
+            lambda: [legacy_get_first_digit(v) for v in values],
+            lambda: [Helpers.get_first_digit(v) for v in values],
+        ),
+        (
+            "round_to_n_decimal_places",
+            lambda: [legacy_round_to_n_decimal_places(v, 12) for v in values],
+            lambda: [Helpers.round_to_n_decimal_places(v, 12) for v in values],
+        ),
+        (
+            "rounds_to_zero",
+            lambda: [legacy_rounds_to_zero(v, -3) for v in values],
+            lambda: [Helpers.rounds_to_zero(v, -3) for v in values],
+        ),
+        (
+            "value + sigfigs + rounding",
+            lambda: [legacy_value(v, 3) for v in values],
+            lambda: [new_value(v, 3) for v in values],
+        ),
+    ]
+
+    print(f"{'case':<30}{'legacy [µs]':>14}{'new [µs]':>12}{'speedup':>10}")
+    for name, legacy, new in cases:
+        t_legacy = min(timeit.repeat(legacy, number=number, repeat=5))
+        t_new = min(timeit.repeat(new, number=number, repeat=5))
+        per_call = 1e6 / (number * len(values))
+        print(
+            f"{name:<30}{t_legacy * per_call:>14.3f}{t_new * per_call:>12.3f}"
+            f"{t_legacy / t_new:>9.1f}x"
+        )
+
+    # Correctness near powers of ten and outside of the float range
+    for s in ["999.9999999999999999", "1e-400", "1e400", "0.001"]:
+        print(f"get_exponent({s}) = {Helpers.get_exponent(Decimal(s))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Measures how long `import resultwizard` takes, based on `python -X importtime`.
+# Every run uses a fresh interpreter, the time of an empty interpreter start
+# (site, encodings, ...) is subtracted. Additionally measures the first use of
+# `wiz.res`, which imports the rest of the package.
+#
+# Run from the root directory of the package (after `pip3 install -e .`):
+#   python3 ./benchmarks/import_benchmark.py
+#   python3 ./benchmarks/import_benchmark.py --max-ms 5  # exit code 1 if slower
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import List
+
+SCENARIOS = {
+    "import resultwizard": "import resultwizard",
+    "first use of wiz.res": "import resultwizard; resultwizard.res",
+}
+
+
+def import_time_ms(code: str) -> float:
+    """Returns the total time of all top-level imports of the code in ms."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not name.startswith("  "):  # top-level import
+            total_us += int(cumulative)
+    return total_us / 1000
+
+
+def measure(code: str, runs: int) -> List[float]:
+    return [import_time_ms(code) - import_time_ms("pass") for _ in range(runs)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--max-ms", type=float, help="maximum median of `import resultwizard`")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<24}{'median [ms]':>14}{'min [ms]':>12}")
+    medians = {}
+    for scenario, code in SCENARIOS.items():
+        times = measure(code, args.runs)
+        medians[scenario] = statistics.median(times)
+        print(f"{scenario:<24}{medians[scenario]:>14.2f}{min(times):>12.2f}")
+
+    if args.max_ms is not None and medians["import resultwizard"] > args.max_ms:
+        print(f"`import resultwizard` takes longer than {args.max_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Measures the memory used per result:
+# - objects: the Result objects themselves (kept in a plain list), e.g. to see
+#   the effect of `__slots__` on Value, Uncertainty and Result.
+# - caches: per cached result, for the default dict-based cache and for the
+#   columnar store.
+#
+# Run from the root directory of the package (after `pip3 install -e .`):
+#   python3 ./benchmarks/memory_benchmark.py [--mode objects|caches]
+
+import argparse
+import gc
+import random
+import tracemalloc
+from decimal import Decimal
+
+from application.columnar_store import ColumnarResultsStore
+from application.rounder import Rounder, RoundingConfig
+from domain.result import Result
+from domain.uncertainty import Uncertainty
+from domain.value import Value
+
+NUM_RESULTS = {"objects": 100_000, "caches": 20_000}
+
+
+def create_result(i: int, num_uncertainties: int, config: RoundingConfig) -> Result:
+    uncertainties = [
+        Uncertainty(Value(Decimal(random.uniform(0.01, 0.1))), "sys" if j == 0 else "stat")
+        for j in range(num_uncertainties)
+    ]
+    result = Result(
+        f"result{i}", Value(Decimal(random.uniform(1, 10))), r"\m", uncertainties, None, None
+    )
+    Rounder.round_result(result, config)
+    return result
+
+
+def create_results(num_results: int, num_uncertainties: int, container: str):
+    config = RoundingConfig(-1, -1, 2, -1)
+    if container == "list":
+        return [create_result(i, num_uncertainties, config) for i in range(num_results)]
+
+    results = ColumnarResultsStore() if container == "columnar" else {}
+    for i in range(num_results):
+        result = create_result(i, num_uncertainties, config)
+        results[result.name] = result
+    return results
+
+
+def measure(num_results: int, num_uncertainties: int, container: str) -> float:
+    gc.collect()
+    tracemalloc.start()
+    results = create_results(num_results, num_uncertainties, container)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return size / num_results
+
+
+def measure_objects():
+    num_results = NUM_RESULTS["objects"]
+    print(f"Result objects ({num_results} results)")
+    print(f"{'uncertainties':<16}{'bytes per result':>18}")
+    for num_uncertainties in [0, 1, 2]:
+        size = measure(num_results, num_uncertainties, "list")
+        print(f"{num_uncertainties:<16}{size:>18.0f}")
+
+
+def measure_caches():
+    num_results = NUM_RESULTS["caches"]
+    print(f"Cached results ({num_results} results)")
+    print(f"{'uncertainties':<16}{'dict [bytes/result]':>22}{'columnar [bytes/result]':>26}")
+    for num_uncertainties in [0, 1, 2]:
+        dict_size = measure(num_results, num_uncertainties, "dict")
+        columnar_size = measure(num_results, num_uncertainties, "columnar")
+        print(f"{num_uncertainties:<16}{dict_size:>22.0f}{columnar_size:>26.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--mode", choices=["objects", "caches"], help="Only run one of the measurements"
+    )
+    args = parser.parse_args()
+
+    random.seed(42)
+    if args.mode in (None, "objects"):
+        measure_objects()
+    if args.mode is None:
+        print()
+    if args.mode in (None, "caches"):
+        measure_caches()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+# Times the stages of the pipeline from `wiz.res()` to `wiz.export()`:
+# parsing, rounding, stringifying (every stringifier), creating the LaTeX
+# commands and exporting. Every stage is run for different numbers of results,
+# with and without uncertainties and (where it matters) in both siunitx modes.
+#
+# Run from the root directory of the package (after `pip3 install -e .`):
+#   python3 ./benchmarks/pipeline_benchmark.py --output before.json
+#   ... change something ...
+#   python3 ./benchmarks/pipeline_benchmark.py --output after.json --compare before.json
+#
+# Use `--sizes 10 1000` to skip the (slow) run with 100k results.
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Callable, List, Union
+
+import resultwizard as wiz
+from api import parsers
+from api.console_stringifier import ConsoleStringifier
+from api.export import export
+from api.res import _res_cache
+from application.latex_better_siunitx_stringifier import LatexBetterSiunitxStringifier
+from application.latex_commandifier import LatexCommandifier
+from application.latex_stringifier import LatexStringifier
+from application.rounder import Rounder, RoundingConfig
+from application.stringifier import StringifierConfig
+from domain.result import Result
+from domain.uncertainty import Uncertainty
+from domain.value import Value
+
+DEFAULT_SIZES = [10, 1_000, 100_000]
+ROUNDING_CONFIG = RoundingConfig(-1, -1, 2, -1)
+STRINGIFIER_CONFIG = StringifierConfig(-2, 3, "result")
+
+
+def create_inputs(num_results: int, uncertainties: bool) -> List[dict]:
+    """Returns the (random but reproducible) arguments of `wiz.res()` calls."""
+    rng = random.Random(42)
+    inputs = []
+    for i in range(num_results):
+        exponent = rng.randint(-4, 4)
+        value = rng.uniform(1, 10) * 10**exponent
+        uncerts = []
+        if uncertainties:
+            uncerts = [
+                (rng.uniform(0.01, 0.5) * 10**exponent, "sys"),
+                (rng.uniform(0.01, 0.5) * 10**exponent, "stat"),
+            ]
+        name = f"result {parsers.format_index(i)}"  # numbers in names must be < 1000
+        inputs.append({"name": name, "value": value, "uncerts": uncerts})
+    return inputs
+
+
+def create_results(inputs: List[dict]) -> List[Result]:
+    """Returns unrounded results for the inputs."""
+    return [
+        Result(
+            parsers.parse_name(i["name"]),
+            Value(Decimal(i["value"])),
+            r"\m",
+            [Uncertainty(Value(Decimal(u)), name) for u, name in i["uncerts"]],
+            None,
+            None,
+        )
+        for i in inputs
+    ]
+
+
+def create_rounded_results(inputs: List[dict]) -> List[Result]:
+    results = create_results(inputs)
+    for result in results:
+        Rounder.round_result(result, ROUNDING_CONFIG)
+    return results
+
+
+def measure(run: Callable[[object], None], setup: Callable[[], object], repeats: int) -> dict:
+    """
+    Runs `setup` and then times `run` with its return value, `repeats` times.
+    """
+    timings = []
+    for _ in range(repeats):
+        arg = setup()
+        start = time.perf_counter()
+        run(arg)
+        timings.append(time.perf_counter() - start)
+    return {"best_s": min(timings), "mean_s": sum(timings) / len(timings)}
+
+
+def bench_parse_value(inputs, _):
+    def run(values):
+        for value in values:
+            parsers.parse_value(value)
+
+    return run, lambda: [i["value"] for i in inputs]
+
+
+def bench_parse_name(warm: bool):
+    """
+    Names are memoized, so the cold benchmark clears the cache before every run
+    and the warm one parses all names once beforehand (which only helps as long
+    as they fit into the cache).
+    """
+
+    def bench(inputs, _):
+        def run(names):
+            for name in names:
+                parsers.parse_name(name)
+
+        def setup():
+            names = [i["name"] for i in inputs]
+            parsers._normalize_name.cache_clear()  # pylint: disable=protected-access
+            if warm:
+                run(names)
+            return names
+
+        return run, setup
+
+    return bench
+
+
+def bench_round_result(inputs, _):
+    def run(results):
+        for result in results:
+            Rounder.round_result(result, ROUNDING_CONFIG)
+
+    return run, lambda: create_results(inputs)
+
+
+def bench_create_str(stringifier_class):
+    def bench(inputs, _):
+        stringifier = stringifier_class(STRINGIFIER_CONFIG)
+        results = create_rounded_results(inputs)
+
+        def run(results):
+            for result in results:
+                stringifier.create_str(result.value, result.uncertainties, result.unit)
+
+        return run, lambda: results
+
+    return bench
+
+
+def bench_result_to_latex_cmd(inputs, siunitx_fallback):
+    stringifier_class = LatexStringifier if siunitx_fallback else LatexBetterSiunitxStringifier
+    latexer = LatexCommandifier(stringifier_class(STRINGIFIER_CONFIG))
+    results = create_rounded_results(inputs)
+
+    def run(results):
+        for result in results:
+            latexer.result_to_latex_cmd(result)
+
+    return run, lambda: results
+
+
+def bench_export(inputs, siunitx_fallback):
+    # Without the render cache, every export has to render all results
+    wiz.config_init(siunitx_fallback=siunitx_fallback, render_cache_size=0)
+    results = create_rounded_results(inputs)
+    directory = tempfile.mkdtemp()
+    filepath = os.path.join(directory, "results.tex")
+
+    def setup():
+        _res_cache.clear()
+        _res_cache.add_many(results)
+        # The file must not be skipped as unchanged
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
+    def run(_):
+        with contextlib.redirect_stdout(io.StringIO()):
+            export(filepath)
+
+    return run, setup
+
+
+# (stage, benchmark, whether the stage depends on `siunitx_fallback`)
+STAGES = [
+    ("parse_value", bench_parse_value, False),
+    ("parse_name (cold)", bench_parse_name(warm=False), False),
+    ("parse_name (warm)", bench_parse_name(warm=True), False),
+    ("round_result", bench_round_result, False),
+    ("ConsoleStringifier.create_str", bench_create_str(ConsoleStringifier), False),
+    ("LatexStringifier.create_str", bench_create_str(LatexStringifier), False),
+    (
+        "LatexBetterSiunitxStringifier.create_str",
+        bench_create_str(LatexBetterSiunitxStringifier),
+        False,
+    ),
+    ("result_to_latex_cmd", bench_result_to_latex_cmd, True),
+    ("export", bench_export, True),
+]
+
+
+def run_benchmarks(sizes: List[int]) -> List[dict]:
+    entries = []
+    for num_results in sizes:
+        repeats = max(3, min(100, 10_000 // num_results))
+        for uncertainties in [False, True]:
+            inputs = create_inputs(num_results, uncertainties)
+            for stage, bench, depends_on_siunitx in STAGES:
+                modes: List[Union[bool, None]] = [False, True] if depends_on_siunitx else [None]
+                for siunitx_fallback in modes:
+                    run, setup = bench(inputs, siunitx_fallback)
+                    timing = measure(run, setup, repeats)
+                    entry = {
+                        "stage": stage,
+                        "num_results": num_results,
+                        "uncertainties": uncertainties,
+                        "siunitx_fallback": siunitx_fallback,
+                        "repeats": repeats,
+                        **timing,
+                        "per_result_us": timing["best_s"] / num_results * 1e6,
+                    }
+                    entries.append(entry)
+                    print_entry(entry)
+    wiz.config_init()
+    return entries
+
+
+def entry_key(entry: dict) -> tuple:
+    return (
+        entry["stage"],
+        entry["num_results"],
+        entry["uncertainties"],
+        entry["siunitx_fallback"],
+    )
+
+
+def print_entry(entry: dict, baseline: Union[dict, None] = None):
+    siunitx = {None: "", False: "siunitx", True: "fallback"}[entry["siunitx_fallback"]]
+    line = (
+        f"{entry['stage']:<42}{entry['num_results']:>8}"
+        f"{'uncert' if entry['uncertainties'] else '':>8}{siunitx:>10}"
+        f"{entry['per_result_us']:>12.2f} us/result"
+    )
+    if baseline is not None:
+        line += f"{entry['best_s'] / baseline['best_s']:>8.2f}x"
+    print(line)
+
+
+def git_commit() -> Union[str, None]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare against")
+    args = parser.parse_args()
+
+    entries = run_benchmarks(args.sizes)
+
+    if args.output:
+        report = {
+            "commit": git_commit(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "benchmarks": entries,
+        }
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = {entry_key(e): e for e in json.load(file)["benchmarks"]}
+        print(f"\nCompared to {args.compare} (time relative to baseline):")
+        for entry in entries:
+            if entry_key(entry) in baseline:
+                print_entry(entry, baseline[entry_key(entry)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+# The api modules import each other. Importing `api.config` first resolves these
+# circular imports, no matter which api module is imported first.
+import api.config  # pylint: disable=unused-import
@@ -1,18 +1,33 @@
-import decimal
-from typing import Union, cast
-from dataclasses import dataclass
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, TypeVar, Union, cast
+from dataclasses import dataclass, field, replace
 
 from api.res import _res_cache
+from api.rendering import _render_cache
+from api.profiling import _profiler
 from application.stringifier import StringifierConfig
 from application.rounder import RoundingConfig
+from application.helpers import Helpers
 from application import error_messages
 
+KEYWORD_DISPATCH_STYLES = ("ifthenelse", "csname")
 
-@dataclass
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
 # pylint: disable-next=too-many-instance-attributes
 class Config:
     """Configuration settings for the application.
 
+    A configuration is immutable (and hashable); changing a setting creates a new
+    configuration. The rounding and stringifier configurations are only built once
+    per configuration and are shared by all results declared with it. The same
+    holds for the objects created from the configuration, e.g. the stringifiers
+    (see `get_derived()`): they are only created again once a setting changes.
+
     Args:
         sigfigs (int): The number of significant figures to round to.
         decimal_places (int): The number of decimal places to round to.
@@ -36,14 +51,45 @@ class Config:
         siunitx_fallback (bool): Whether to use a fallback logic such that LaTeX
             commands still work with an older version of siunitx. See
             the docs for more information: TODO.
-        precision (int): The precision to use for the decimal module. Defaults to
-            40 in ResultsWizard. You may have to increase this if you get the error
-            "Your precision is set too low".
+        precision (int): The minimum number of digits ResultWizard uses for inexact
+            calculations, e.g. the total uncertainty. All other calculations are
+            carried out exactly with as many digits as needed. ResultWizard uses
+            its own decimal context, i.e. the precision of your decimal context
+            (`decimal.getcontext()`) is neither used nor changed.
         ignore_result_overwrite (bool): If True, you won't get any warnings if you
             overwrite a result with the same name. Defaults to False. This option
             might be useful for Jupyter notebooks when you want to re-run cells
             without getting any warnings that a result with the same name already
             exists.
+        render_cache_size (int): The maximum number of rendered strings (console
+            output and LaTeX commands) that are kept in memory such that
+            printing or exporting an unchanged result again is cheap. Set to 0 to
+            disable this cache.
+        export_auto_async (bool): If True, the automatic exports (see `export_auto_to`)
+            are written to the file in a background thread, such that `res()` returns
+            right away. Use `flush()` to wait until the file is written; this
+            is done automatically when the Python interpreter exits.
+        columnar_cache (bool): If True, results are stored in a memory-efficient
+            columnar store (packed arrays instead of one object per result). This
+            is useful for millions of results, but makes accessing individual
+            results slower.
+        profile (bool): If True, the time spent in every stage of declaring and
+            exporting results (parsing, rounding, printing, exporting) is measured.
+            See `profile_report()` and `profile_dump()`. Enabling (or disabling)
+            profiling discards all previously collected timings.
+        keyword_dispatch (str): How the exported LaTeX commands select the output
+            for a keyword like `\\resultName[value]`. "ifthenelse" compares the
+            keyword with every possible keyword one after another. "csname" looks
+            up the output directly, which compiles faster for documents that use
+            results very often. Both support the same keywords.
+        persist_to (str): Path to an SQLite database file the results are stored in.
+            The results declared in previous runs are loaded from this file when
+            they are first needed, such that you can export them again without
+            re-running your analysis. Empty string (default) to not persist results.
+        export_shared (bool): If True, multiple processes can export to the same
+            file (e.g. parallel jobs with the same `export_auto_to`). Every process
+            writes its results to its own fragment next to the file and the file
+            then contains the results of all processes.
     """
 
     sigfigs: int
@@ -58,24 +104,71 @@ class Config:
     siunitx_fallback: bool
     precision: int
     ignore_result_overwrite: bool
+    render_cache_size: int
+    export_auto_async: bool
+    columnar_cache: bool
+    profile: bool
+    keyword_dispatch: str
+    persist_to: str
+    export_shared: bool
 
-    def to_stringifier_config(self) -> StringifierConfig:
-        return StringifierConfig(
+    _stringifier_config: StringifierConfig = field(init=False, repr=False, compare=False)
+    _rounding_config: RoundingConfig = field(init=False, repr=False, compare=False)
+    _derived: Dict[str, Any] = field(init=False, repr=False, compare=False, default_factory=dict)
+
+    def __post_init__(self):
+        stringifier_config = StringifierConfig(
             self.min_exponent_for_non_scientific_notation,
             self.max_exponent_for_non_scientific_notation,
             self.identifier,
         )
-
-    def to_rounding_config(self) -> RoundingConfig:
-        return RoundingConfig(
+        rounding_config = RoundingConfig(
             self.sigfigs,
             self.decimal_places,
             self.sigfigs_fallback,
             self.decimal_places_fallback,
         )
+        # The dataclass is frozen, so we have to bypass its __setattr__
+        object.__setattr__(self, "_stringifier_config", stringifier_config)
+        object.__setattr__(self, "_rounding_config", rounding_config)
+
+    def to_stringifier_config(self) -> StringifierConfig:
+        return self._stringifier_config
+
+    def to_rounding_config(self) -> RoundingConfig:
+        return self._rounding_config
+
+    def get_derived(self, key: str, create: Callable[[], T]) -> T:
+        """Returns the object stored under the key, e.g. a stringifier that uses this
+        configuration. It is created (with `create()`) on first use only."""
+        derived = self._derived.get(key)
+        if derived is None:
+            # Concurrent calls might create it twice, which is harmless
+            derived = create()
+            self._derived[key] = derived
+        return derived
+
+
+def current_config() -> Config:
+    """Returns the configuration in effect, i.e. the one of the innermost
+    `config_scope()` of the current thread/task or the global configuration."""
+    scoped = _scoped_configuration.get()
+    if scoped is not None:
+        return scoped
+    return _global_config()
 
 
-def _check_config() -> None:
+def _global_config() -> Config:
+    """Returns the global configuration. If `config_init()` wasn't called yet,
+    the default configuration is created on first use (and not on import)."""
+    if configuration is None:
+        with _init_lock:
+            if configuration is None:
+                config_init()
+    return cast(Config, configuration)
+
+
+def _check_config(configuration: Config) -> None:  # pylint: disable=redefined-outer-name
     if configuration.sigfigs > -1 and configuration.decimal_places > -1:
         raise ValueError(error_messages.SIGFIGS_AND_DECIMAL_PLACES_AT_SAME_TIME)
 
@@ -93,8 +186,18 @@ def _check_config() -> None:
     if configuration.sigfigs_fallback == 0:
         raise ValueError(error_messages.CONFIG_SIGFIGS_FALLBACK_VALID_RANGE)
 
+    if configuration.keyword_dispatch not in KEYWORD_DISPATCH_STYLES:
+        raise ValueError(
+            error_messages.KEYWORD_DISPATCH_INVALID.format(value=configuration.keyword_dispatch)
+        )
 
-# pylint: disable-next=too-many-arguments
+    if configuration.render_cache_size < 0:
+        raise ValueError(
+            error_messages.FIELD_MUST_BE_NON_NEGATIVE.format(field="render_cache_size")
+        )
+
+
+# pylint: disable-next=too-many-arguments, too-many-locals
 def config_init(
     sigfigs: int = -1,  # -1: "per default use rounding rules instead"
     decimal_places: int = -1,  # -1: "per default use rounding rules instead"
@@ -108,12 +211,16 @@ def config_init(
     siunitx_fallback: bool = False,
     precision: int = 100,
     ignore_result_overwrite: bool = False,
+    render_cache_size: int = 10_000,
+    export_auto_async: bool = False,
+    columnar_cache: bool = False,
+    profile: bool = False,
+    keyword_dispatch: str = "ifthenelse",
+    persist_to: str = "",
+    export_shared: bool = False,
 ) -> None:
     global configuration  # pylint: disable=global-statement
 
-    decimal.DefaultContext.prec = precision
-    decimal.setcontext(decimal.DefaultContext)
-
     configuration = Config(
         sigfigs,
         decimal_places,
@@ -127,15 +234,29 @@ def config_init(
         siunitx_fallback,
         precision,
         ignore_result_overwrite,
+        render_cache_size,
+        export_auto_async,
+        columnar_cache,
+        profile,
+        keyword_dispatch,
+        persist_to,
+        export_shared,
     )
 
-    _res_cache.configure(not ignore_result_overwrite)
+    _res_cache.configure(not ignore_result_overwrite, columnar_cache, persist_to)
+
+    _check_config(configuration)
 
-    _check_config()
+    _render_cache.resize(render_cache_size)
+    Helpers.set_min_precision(precision)
+    _profiler.configure(profile)
 
 
-configuration = cast(Config, None)  # pylint: disable=invalid-name
-config_init()
+configuration: Union[Config, None] = None  # pylint: disable=invalid-name
+_init_lock = threading.Lock()
+_scoped_configuration: ContextVar[Union[Config, None]] = ContextVar(
+    "resultwizard_configuration", default=None
+)
 
 
 def config(
@@ -145,25 +266,91 @@ def config(
     sigfigs_fallback: Union[int, None] = None,
     decimal_places_fallback: Union[int, None] = None,
 ):
+    global configuration  # pylint: disable=global-statement
+
+    updated = _updated_config(
+        current_config(),
+        sigfigs,
+        decimal_places,
+        print_auto,
+        sigfigs_fallback,
+        decimal_places_fallback,
+    )
+
+    # Within a `config_scope()`, only the scope is changed
+    if _scoped_configuration.get() is not None:
+        _scoped_configuration.set(updated)
+    else:
+        configuration = updated
+
+
+@contextmanager
+def config_scope(
+    sigfigs: Union[int, None] = None,
+    decimal_places: Union[int, None] = None,
+    print_auto: Union[bool, None] = None,
+    sigfigs_fallback: Union[int, None] = None,
+    decimal_places_fallback: Union[int, None] = None,
+) -> Iterator[None]:
+    """
+    Changes the given settings (see `config()`) only inside the `with` block:
+
+    ```python
+    with wiz.config_scope(sigfigs=3):
+        wiz.res("a", 1.23456)  # rounded to 3 significant figures
+    ```
+
+    The settings only apply to the current thread (or asyncio task), such that
+    concurrent code can use different settings at the same time. Scopes can be nested.
+    """
+    updated = _updated_config(
+        current_config(),
+        sigfigs,
+        decimal_places,
+        print_auto,
+        sigfigs_fallback,
+        decimal_places_fallback,
+    )
+    token = _scoped_configuration.set(updated)
+    try:
+        yield
+    finally:
+        _scoped_configuration.reset(token)
+
+
+# pylint: disable-next=too-many-arguments
+def _updated_config(
+    base: Config,
+    sigfigs: Union[int, None],
+    decimal_places: Union[int, None],
+    print_auto: Union[bool, None],
+    sigfigs_fallback: Union[int, None],
+    decimal_places_fallback: Union[int, None],
+) -> Config:
+    """Returns a copy of the configuration with the given settings changed."""
+    changes = {}
+
     if sigfigs is not None:
-        configuration.sigfigs = sigfigs
+        changes["sigfigs"] = sigfigs
         if sigfigs > -1 and decimal_places is None:
-            configuration.decimal_places = -1
+            changes["decimal_places"] = -1
     if decimal_places is not None:
-        configuration.decimal_places = decimal_places
+        changes["decimal_places"] = decimal_places
         if decimal_places > -1 and sigfigs is None:
-            configuration.sigfigs = -1
+            changes["sigfigs"] = -1
 
     if print_auto is not None:
-        configuration.print_auto = print_auto
+        changes["print_auto"] = print_auto
 
     if sigfigs_fallback is not None:
-        configuration.sigfigs_fallback = sigfigs_fallback
+        changes["sigfigs_fallback"] = sigfigs_fallback
         if sigfigs_fallback > -1 and decimal_places_fallback is None:
-            configuration.decimal_places_fallback = -1
+            changes["decimal_places_fallback"] = -1
     if decimal_places_fallback is not None:
-        configuration.decimal_places_fallback = decimal_places_fallback
+        changes["decimal_places_fallback"] = decimal_places_fallback
         if decimal_places_fallback > -1 and sigfigs_fallback is None:
-            configuration.sigfigs_fallback = -1
+            changes["sigfigs_fallback"] = -1
 
-    _check_config()
+    updated = replace(base, **changes)
+    _check_config(updated)
+    return updated
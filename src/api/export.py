@@ -1,61 +1,366 @@
-from typing import Set
+import atexit
+import os
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
+from api import parsers
 from api.latexer import get_latexer
+from api.rendering import _latex_render_key, _result_to_latex_cmd, _results_to_latex_cmds
+from api.profiling import _profiler
 from api.res import _res_cache
 import api.config as c
 from application.helpers import Helpers
+from application import error_messages
+from application.background_writer import BackgroundWriter
+from application.file_writer import write_file_if_changed
+from application.shared_export import FileLock, SharedExport, fragment_content
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
-def export(filepath: str):
+
+def export(
+    filepath: Union[str, TextIO],
+    workers: Union[int, None] = None,
+    executor: Union["Executor", None] = None,
+):
     """
     Rounds all results according to the significant figures and writes them
     to a .tex file at the given filepath.
+
+    Instead of a filepath, any text stream (e.g. an open file, `io.StringIO`
+    or `sys.stdout`) can be passed. The document is then written to it
+    line by line without building it in memory first.
+
+    For many results, the LaTeX commands can be rendered in parallel by passing
+    the number of worker processes (`workers`) or an existing executor
+    (`executor`), e.g. a `ProcessPoolExecutor` that is reused across exports.
+    When passing an executor, `workers` may additionally tell how many workers
+    it has, such that the results are split into suitably many chunks.
+    The exported file is the same as without parallel rendering.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError(error_messages.WORKERS_MUST_BE_POSITIVE)
+
+    # Make sure an older automatic export in the background doesn't overwrite this one
+    flush()
+
+    if executor is not None:
+        return _export(filepath, print_completed=True, executor=executor, workers=workers)
+    if workers is None or workers == 1:
+        return _export(filepath, print_completed=True)
+
+    # Imported here since it takes long to import and is rarely needed
+    from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _export(filepath, print_completed=True, executor=pool, workers=workers)
+
+
+def export_sharded(directory: str, prefixes: Union[Sequence[str], None] = None):
+    """
+    Writes the results into one .tex file per group in the given directory,
+    plus an `index.tex` file with the required packages and siunitx setup.
+    Every chapter of your document can then `\\input` only the groups it needs.
+
+    Results declared with `group=...` are written to the file of that group.
+    All other results are grouped by the first of the given `prefixes`
+    their name starts with (e.g. "mechanics" for "mechanics speed") and are
+    otherwise written to `results.tex`. Only files whose content changed are
+    written again. Files of groups (listed in the previous `index.tex`) that
+    no longer have any results are deleted.
+    """
+    groups_by_prefix = [
+        (parsers.parse_name(prefix), parsers.parse_group(prefix, "Each prefix"))
+        for prefix in prefixes or []
+    ]
+    # Longest prefix first, such that the most specific one wins
+    groups_by_prefix.sort(key=lambda p: len(p[0]), reverse=True)
+
+    # Make sure an older automatic export in the background doesn't interfere
+    flush()
+
+    with _profiler.stage("export"):
+        print(f"Processing {len(_res_cache)} result(s)")
+
+        shards: Dict[str, List[str]] = {}
+        with _profiler.stage("export.render"):
+            uncertainty_names, rendered = _rendered_results(None, None)
+            for name, cmd in rendered:
+                group = _res_cache.get_group(name) or _group_by_prefix(name, groups_by_prefix)
+                shards.setdefault(group, []).append(cmd)
+
+        with _profiler.stage("export.write"):
+            os.makedirs(directory, exist_ok=True)
+            for group, cmds in shards.items():
+                content = "\n".join(_shard_lines(group, cmds))
+                write_file_if_changed(os.path.join(directory, f"{group}.tex"), content)
+
+            index_path = os.path.join(directory, "index.tex")
+            previous_groups = _indexed_groups(index_path)
+            index_content = "\n".join(_index_lines(list(shards), uncertainty_names))
+            write_file_if_changed(index_path, index_content)
+
+            # Remove the files of groups that no longer have any results
+            for group in previous_groups:
+                if group not in shards:
+                    _remove_if_exists(os.path.join(directory, f"{group}.tex"))
+
+    print(f'Exported {len(shards)} group(s) to "{directory}"')
+
+
+def flush():
     """
-    return _export(filepath, print_completed=True)
+    Waits until all automatic exports running in the background are written
+    to their files. Only needed if `export_auto_async` is enabled; this is also
+    done automatically when the Python interpreter exits.
+    """
+    _background_writer.flush()
+    _shared_background_writer.flush()
+
+
+def _export(
+    target: Union[str, TextIO],
+    print_completed: bool,
+    asynchronous: bool = False,
+    executor: Union["Executor", None] = None,
+    workers: Union[int, None] = None,
+):
+    with _profiler.stage("export"):
+        if not isinstance(target, str):
+            # No messages here, they would end up in the output if streaming to stdout
+            lines = _export_lines(_stream_input_name(target), executor, workers)
+            _write_lines(target, lines)
+            return
+
+        if print_completed:
+            print(f"Processing {len(_res_cache)} result(s)")
+
+        # In the shared mode, only this process's fragment is created here
+        shared = c.current_config().export_shared
+        with _profiler.stage("export.render"):
+            if shared:
+                content = _fragment_content(executor, workers)
+            else:
+                content = "\n".join(_export_lines(_input_name(target), executor, workers))
+
+        # Write to file
+        if asynchronous:
+            writer = _shared_background_writer if shared else _background_writer
+            writer.submit(target, content)
+            return
+
+        with _profiler.stage("export.write"):
+            if shared:
+                _write_shared(target, content)
+            else:
+                write_file_if_changed(target, content)
+        if print_completed:
+            print(f'Exported to "{target}"')
 
 
-def _export(filepath: str, print_completed: bool):
-    results = _res_cache.get_all_results()
+def _input_name(filepath: str) -> str:
+    """Returns the name for the `\\input{}` hint in the header of an export."""
+    return filepath.split("/")[-1].split(".")[0]
 
-    if print_completed:
-        print(f"Processing {len(results)} result(s)")
 
-    # Round and convert to LaTeX commands
-    lines = [
+def _export_lines(
+    input_name: str, executor: Union["Executor", None], workers: Union[int, None]
+) -> Iterator[str]:
+    """
+    Yields the lines of the exported document one at a time.
+    """
+    uncertainty_names, rendered = _rendered_results(executor, workers)
+    return _document_lines(input_name, uncertainty_names, (cmd for _, cmd in rendered))
+
+
+def _document_lines(
+    input_name: str, uncertainty_names: Set[str], commands: Iterable[str]
+) -> Iterator[str]:
+    yield from [
         r"%",
         r"% In your `main.tex` file, put this line directly before `\begin{document}`:",
-        r"%   \input{" + filepath.split("/")[-1].split(".")[0] + r"}",
+        r"%   \input{" + input_name + r"}",
         r"%",
         r"",
-        r"% Import required package:",
-        r"\usepackage{siunitx}",
-        r"\usepackage{ifthen}",
-        r"",
     ]
+    yield from _setup_lines(uncertainty_names)
+    yield "% Commands to print the results. Use them in your document."
+    yield from commands
 
-    latexer = get_latexer()
 
-    uncertainty_names = set()
-    result_lines = []
-    for result in results:
-        uncertainty_names.update(u.name for u in result.uncertainties if u.name != "")
-        result_str = latexer.result_to_latex_cmd(result)
-        result_lines.append(result_str)
+def _setup_lines(uncertainty_names: Set[str]) -> Iterator[str]:
+    """
+    Yields the required packages and the siunitx setup for the uncertainties.
+    """
+    yield r"% Import required package:"
+    yield r"\usepackage{siunitx}"
+    configuration = c.current_config()
+    # The csname-based commands don't need the ifthen package
+    if configuration.keyword_dispatch == "ifthenelse":
+        yield r"\usepackage{ifthen}"
+    yield ""
 
-    if not c.configuration.siunitx_fallback:
+    if not configuration.siunitx_fallback:
         siunitx_setup = _uncertainty_names_to_siunitx_setup(uncertainty_names)
         if siunitx_setup != "":
-            lines.append("% Commands to correctly print the uncertainties in siunitx:")
-            lines.append(siunitx_setup)
-            lines.append("")
+            yield "% Commands to correctly print the uncertainties in siunitx:"
+            yield siunitx_setup
+            yield ""
+
+
+def _fragment_content(executor: Union["Executor", None], workers: Union[int, None]) -> str:
+    """Returns the fragment of this process for a shared export."""
+    uncertainty_names, rendered = _rendered_results(executor, workers)
+    return fragment_content(uncertainty_names, list(rendered))
+
+
+def _write_shared(filepath: str, fragment: str):
+    """
+    Writes the fragment of this process and merges the fragments of all
+    processes into the target file.
+    """
+    shared_export = SharedExport(filepath)
+    shared_export.write_fragment(fragment)
+    with FileLock(shared_export.lock_path):
+        uncertainty_names, commands = shared_export.merge_fragments()
+        lines = _document_lines(_input_name(filepath), uncertainty_names, commands)
+        write_file_if_changed(filepath, "\n".join(lines))
+
+
+def _rendered_results(
+    executor: Union["Executor", None], workers: Union[int, None]
+) -> Tuple[Set[str], Iterator[Tuple[str, str]]]:
+    """
+    Returns the uncertainty names of all results and an iterator over their names
+    and LaTeX commands (in insertion order), both from the same snapshot of the results.
+    Only results that were added or shadowed since the last export are rendered.
+    """
+    latexer = get_latexer()
+    render_key = _latex_render_key()
+    render_many = None
+    if executor is not None:
+        render_many = partial(
+            _results_to_latex_cmds,
+            latexer=latexer,
+            render_key=render_key,
+            executor=executor,
+            workers=workers,
+        )
+    return _res_cache.get_named_rendered_snapshot(
+        lambda result: _result_to_latex_cmd(result, latexer, render_key), render_key, render_many
+    )
+
+
+def _write_lines(stream: TextIO, lines: Iterable[str]):
+    """
+    Writes the lines to the stream, separated (but not terminated) by newlines,
+    i.e. exactly like the content of an exported file.
+    """
+    for i, line in enumerate(lines):
+        if i > 0:
+            stream.write("\n")
+        stream.write(line)
+    stream.flush()
+
+
+def _stream_input_name(stream: TextIO) -> str:
+    """
+    Returns the name for the `\\input{}` hint in the header of a streamed export.
+    """
+    name = getattr(stream, "name", None)
+    # Streams like sys.stdout are named "<stdout>"
+    if not isinstance(name, str) or name.startswith("<"):
+        return "results"
+    return os.path.splitext(os.path.basename(name))[0]
+
+
+def _group_by_prefix(name: str, groups_by_prefix: List[Tuple[str, str]]) -> str:
+    for prefix, group in groups_by_prefix:
+        if name.startswith(prefix):
+            return group
+    return _DEFAULT_GROUP
+
+
+_DEFAULT_GROUP = "results"
+_INDEX_GROUPS_HEADER = (
+    r"% Then input the groups of results you need, e.g. at the start of a chapter:"
+)
+
+
+def _index_lines(groups: List[str], uncertainty_names: Set[str]) -> Iterator[str]:
+    yield from [
+        r"%",
+        r"% In your `main.tex` file, put this line directly before `\begin{document}`:",
+        r"%   \input{index}",
+        _INDEX_GROUPS_HEADER,
+    ]
+    yield from [r"%   \input{" + group + r"}" for group in groups]
+    yield r"%"
+    yield r""
+    yield from _setup_lines(uncertainty_names)
+
+
+def _indexed_groups(index_path: str) -> List[str]:
+    """
+    Returns the groups listed in an `index.tex` written by a previous sharded
+    export, i.e. the group files written by it.
+    """
+    try:
+        with open(index_path, "r", encoding="utf-8") as file:
+            lines = file.read().split("\n")
+    except FileNotFoundError:
+        return []
+
+    groups = []
+    in_groups = False
+    for line in lines:
+        if line == _INDEX_GROUPS_HEADER:
+            in_groups = True
+        elif in_groups:
+            if not (line.startswith(r"%   \input{") and line.endswith("}")):
+                break
+            group = line[len(r"%   \input{") : -1]
+            # Never touch anything outside of the directory (or the index itself)
+            try:
+                groups.append(parsers.parse_group(group))
+            except ValueError:
+                pass
+    return groups
+
+
+def _remove_if_exists(filepath: str):
+    try:
+        os.remove(filepath)
+    except FileNotFoundError:
+        pass
+
+
+def _shard_lines(group: str, cmds: List[str]) -> Iterator[str]:
+    yield from [
+        r"%",
+        rf"% Results of the group `{group}`. This file requires `index.tex`, see there.",
+        r"%",
+        r"",
+        r"% Commands to print the results. Use them in your document.",
+    ]
+    yield from cmds
 
-    lines.append("% Commands to print the results. Use them in your document.")
-    lines.extend(result_lines)
 
-    # Write to file
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-    if print_completed:
-        print(f'Exported to "{filepath}"')
+_background_writer = BackgroundWriter(write_file_if_changed)
+_shared_background_writer = BackgroundWriter(_write_shared)
+atexit.register(_background_writer.flush)
+atexit.register(_shared_background_writer.flush)
 
 
 def _uncertainty_names_to_siunitx_setup(uncert_names: Set[str]) -> str:
@@ -67,7 +372,8 @@ def _uncertainty_names_to_siunitx_setup(uncert_names: Set[str]) -> str:
 
     cmd_names = []
     cmds = []
-    for name in uncert_names:
+    # Sorted such that the output is the same in every run
+    for name in sorted(uncert_names):
         cmd_name = f"\\Uncert{Helpers.capitalize(name)}"
         cmd_names.append(cmd_name)
         cmds.append(rf"\NewDocumentCommand{{{cmd_name}}}{{}}{{_{{\text{{{name}}}}}}}")
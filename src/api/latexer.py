@@ -6,12 +6,19 @@ from application.stringifier import Stringifier
 
 
 def get_latexer() -> LatexCommandifier:
-    return LatexCommandifier(_choose_latex_stringifier())
+    """Returns the latexer for the current configuration (created once per configuration)."""
+    configuration = c.current_config()
+    return configuration.get_derived(
+        "latexer",
+        lambda: LatexCommandifier(
+            _choose_latex_stringifier(configuration), configuration.keyword_dispatch
+        ),
+    )
 
 
-def _choose_latex_stringifier() -> Stringifier:
-    use_fallback = c.configuration.siunitx_fallback
-    stringifier_config = c.configuration.to_stringifier_config()
+def _choose_latex_stringifier(configuration: "c.Config") -> Stringifier:
+    use_fallback = configuration.siunitx_fallback
+    stringifier_config = configuration.to_stringifier_config()
 
     if use_fallback:
         return LatexStringifier(stringifier_config)
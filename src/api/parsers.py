@@ -1,3 +1,5 @@
+import re
+from functools import lru_cache
 from typing import Union, List, Tuple
 from decimal import Decimal
 
@@ -6,6 +8,9 @@ from application import error_messages
 from domain.value import Value
 from domain.uncertainty import Uncertainty
 
+# Maximum number of normalized names that are memoized
+_NAME_CACHE_SIZE = 4096
+
 
 def check_if_number_string(value: str) -> None:
     """Raises a ValueError if the string is not a valid number."""
@@ -23,6 +28,51 @@ def parse_name(name: str) -> str:
     if name == "":
         raise ValueError(error_messages.FIELD_MUST_NOT_BE_EMPTY.format(field="`name`"))
 
+    parsed_name, ignored_chars = _normalize_name(name)
+
+    if ignored_chars != "":
+        print(error_messages.INVALID_CHARS_IGNORED.format(chars=ignored_chars))
+
+    if parsed_name == "":
+        raise ValueError(error_messages.STRING_EMPTY_AFTER_IGNORING_INVALID_CHARS)
+
+    return parsed_name
+
+
+def format_index(index: int) -> Union[int, str]:
+    """
+    Returns the index as it is inserted into name templates like `"channel {i}"`.
+
+    Numbers in names are only allowed up to 999, so larger indices are split into
+    groups of three digits followed by "thousand", "million" etc., e.g. 1021 is
+    "1 thousand 21", which is parsed to `OneThousandTwentyOne`.
+    """
+    if index < 1000:
+        return index
+
+    groups = []
+    rest = index
+    for word in _GROUP_WORDS:
+        rest, group = divmod(rest, 1000)
+        if group != 0:
+            groups.append(f"{group} {word}".rstrip())
+        if rest == 0:
+            return " ".join(reversed(groups))
+    raise ValueError(error_messages.INDEX_TOO_LARGE.format(index=index))
+
+
+_GROUP_WORDS = ["", "thousand", "million", "billion", "trillion"]
+
+
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
+def _normalize_name(name: str) -> Tuple[str, str]:
+    """
+    Converts the name to camelCase consisting of letters only (numbers are spelled
+    out) and returns it together with the ignored characters (comma-separated).
+
+    Names are often declared again and again (e.g. in loops or when re-running
+    a Jupyter cell), so the most recent ones are memoized.
+    """
     name = (
         name.replace("ä", "ae")
         .replace("Ä", "Ae")
@@ -36,53 +86,39 @@ def parse_name(name: str) -> str:
         .replace("ẞ", "SS")
     )
 
-    parsed_name = ""
+    parts: List[str] = []
     next_char_upper = False
     ignored_chars = set()
 
-    while name != "":
-        char = name[0]
+    i = 0
+    while i < len(name):
+        char = name[i]
 
         if char.isalpha():
             if next_char_upper:
-                parsed_name += char.upper()
+                parts.append(char.upper())
                 next_char_upper = False
             else:
-                parsed_name += char
+                parts.append(char)
         elif char.isdigit():
-            num_digits = _greedily_count_digits_at_start_of_str(name)
-            word = Helpers.number_to_word(int(name[:num_digits]))
-            if parsed_name != "":
+            end = i + 1
+            while end < len(name) and name[end].isdigit():
+                end += 1
+            word = Helpers.number_to_word(int(name[i:end]))
+            if len(parts) > 0:
                 word = Helpers.capitalize(word)
-            parsed_name += word
+            parts.append(word)
             next_char_upper = True
-            name = name[num_digits:]  # Skip the parsed digits
+            i = end  # Skip the parsed digits
             continue
         elif char in [" ", "_", "-"]:
             next_char_upper = True
         else:
             ignored_chars.add(char)
 
-        name = name[1:]
+        i += 1
 
-    if len(ignored_chars) > 0:
-        print(error_messages.INVALID_CHARS_IGNORED.format(chars=", ".join(ignored_chars)))
-
-    if parsed_name == "":
-        raise ValueError(error_messages.STRING_EMPTY_AFTER_IGNORING_INVALID_CHARS)
-
-    return parsed_name
-
-
-def _greedily_count_digits_at_start_of_str(word: str) -> int:
-    """Counts the number of digits at the start of the string."""
-    num_digits = 0
-    for c in word:
-        if c.isdigit():
-            num_digits += 1
-        else:
-            break
-    return num_digits
+    return "".join(parts), ", ".join(ignored_chars)
 
 
 def parse_unit(unit: str) -> str:
@@ -98,6 +134,26 @@ def parse_unit(unit: str) -> str:
     return unit
 
 
+def parse_group(group: Union[str, None], field: str = "`group`") -> Union[str, None]:
+    """Parses the group, which is used as filename in sharded exports."""
+    if group is None:
+        return None
+
+    if not isinstance(group, str):
+        raise TypeError(error_messages.FIELD_MUST_BE_STRING.format(field=field, type=type(group)))
+
+    if _GROUP_PATTERN.fullmatch(group) is None:
+        raise ValueError(error_messages.GROUP_INVALID.format(field=field, group=group))
+
+    if group == "index":
+        raise ValueError(error_messages.GROUP_RESERVED)
+
+    return group
+
+
+_GROUP_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+
+
 def parse_sigfigs(sigfigs: Union[int, None]) -> Union[int, None]:
     """Parses the number of sigfigs."""
     if sigfigs is None:
@@ -1,6 +1,6 @@
-from api.console_stringifier import ConsoleStringifier
-import api.config as c
-from api.latexer import get_latexer
+from typing import List
+
+from api.rendering import _result_to_console_str, _result_to_latex_str
 from domain.result import Result
 
 
@@ -10,8 +10,7 @@ class PrintableResult:
 
     def print(self):
         """Prints the result to the console."""
-        stringifier = ConsoleStringifier(c.configuration.to_stringifier_config())
-        print(stringifier.result_to_str(self._result))
+        print(_result_to_console_str(self._result))
 
     def to_latex_str(self) -> str:
         """Converts the result to a string that can be used in LaTeX documents.
@@ -20,5 +19,10 @@ class PrintableResult:
         all your results to a file, which can then be included in your LaTeX
         document.
         """
-        latexer = get_latexer()
-        return latexer.result_to_latex_str(self._result)
+        return _result_to_latex_str(self._result)
+
+
+def _print_all(printable_results: List["PrintableResult"]):
+    """Prints multiple results to the console at once."""
+    # pylint: disable-next=protected-access
+    print("\n".join(_result_to_console_str(p._result) for p in printable_results))
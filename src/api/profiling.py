@@ -0,0 +1,24 @@
+from typing import List
+
+from application.profiler import Profiler, StageStats
+
+_profiler = Profiler()
+
+
+def profile_report() -> List[StageStats]:
+    """
+    Prints how often and how long the stages of declaring and exporting
+    results (parsing, rounding, stringifying, printing, exporting, ...) took and returns
+    these statistics. Profiling needs to be enabled with `config_init(profile=True)`.
+    """
+    print(_profiler.report())
+    return _profiler.stats()
+
+
+def profile_dump(filepath: str):
+    """
+    Writes every measured stage to a JSON file in the Chrome trace format.
+    Open it with `chrome://tracing` or https://ui.perfetto.dev to see when
+    and for how long each stage ran.
+    """
+    _profiler.dump_chrome_trace(filepath)
@@ -0,0 +1,156 @@
+from typing import Any, Callable, List, Sequence, Tuple, Union
+
+from api.printable_result import PrintableResult
+from api.res import (
+    _create_result,
+    _declare_many,
+    _expand_int_or_array,
+    _expand_names,
+    _is_named_array,
+    _is_scalar,
+)
+from api import parsers
+import api.config as c
+from application import error_messages
+from domain.result import Result
+
+
+# pylint: disable-next=too-many-arguments, too-many-locals
+def propagate(
+    name: Union[str, Sequence[str]],
+    func: Callable[..., Any],
+    values: Sequence[Any],
+    uncerts: Union[Sequence[Any], None] = None,
+    unit: str = "",
+    jacobian: Union[Callable[..., Sequence[Any]], None] = None,
+    sigfigs: Union[int, Sequence[int], None] = None,
+    decimal_places: Union[int, Sequence[int], None] = None,
+    group: Union[str, None] = None,
+) -> List[PrintableResult]:
+    """
+    Declares results derived from other quantities, e.g. a resistance `U / I`
+    from arrays of measured voltages and currents. The uncertainties are
+    propagated to first order (assuming independent quantities) for all
+    elements of the arrays at once. This requires NumPy.
+
+    `values` contains one entry per argument of `func`: a number, an array,
+    a result returned by `res()` or a list of results (e.g. from `res_array()`).
+    `func` is called with NumPy arrays and has to work element-wise, e.g.
+    `lambda u, i: u / i` or `np.sin`. The uncertainties of numbers and arrays are
+    given in `uncerts` (one entry per argument, `None` for exact quantities), in
+    the same format as in `res_array()`. Results bring their own uncertainties.
+
+    Uncertainties with the same name (e.g. "sys") are propagated together,
+    such that the derived results have one uncertainty per name. By default,
+    the partial derivatives are computed numerically. For exact derivatives,
+    pass a `jacobian` that takes the same arguments as `func` and returns one
+    partial derivative per argument.
+
+    `name`, `unit`, `sigfigs`, `decimal_places` and `group` work as in
+    `res_array()`. The derived results are rounded and declared like any other
+    result and returned in the same way.
+    """
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        from application.propagation import propagate_uncertainties
+    except ModuleNotFoundError as exc:
+        raise ModuleNotFoundError(error_messages.NUMPY_REQUIRED) from exc
+
+    group = parsers.parse_group(group)
+    if uncerts is None:
+        uncerts = [None] * len(values)
+    if len(uncerts) != len(values):
+        raise ValueError(
+            error_messages.PROPAGATION_UNCERTS_LENGTH.format(
+                expected=len(values), actual=len(uncerts)
+            )
+        )
+
+    inputs = [_to_input(value, uncert) for value, uncert in zip(values, uncerts)]
+    derived, propagated = propagate_uncertainties(
+        func, [value for value, _ in inputs], [u for _, u in inputs], jacobian
+    )
+    derived = derived.ravel()
+    propagated = [(sigma.ravel(), u_name) for sigma, u_name in propagated]
+
+    length = len(derived)
+    names = _expand_names(name, length)
+    sigfigs_list = _expand_int_or_array(sigfigs, length, "`sigfigs`")
+    decimal_places_list = _expand_int_or_array(decimal_places, length, "`decimal_places`")
+
+    configuration = c.current_config()
+    results = []
+    for i, value in enumerate(derived.tolist()):
+        # Uncertainties that vanish (e.g. a derivative of 0) are left out
+        uncerts_i = [
+            (sigma_i, u_name) if u_name else sigma_i
+            for sigma_i, u_name in ((float(sigma[i]), u_name) for sigma, u_name in propagated)
+            if sigma_i > 0
+        ]
+        results.append(
+            _create_result(
+                names[i],
+                value,
+                uncerts_i,
+                unit,
+                None,
+                None,
+                sigfigs_list[i],
+                decimal_places_list[i],
+                configuration,
+            )
+        )
+
+    return _declare_many(results, group, names)
+
+
+def _to_input(value: Any, uncert: Any) -> Tuple[Any, List[Tuple[Any, str]]]:
+    """Returns the value (number or array) and the (array, name) tuples of its
+    uncertainties for one argument of the propagated function."""
+    results = _to_results(value)
+    if results is None:
+        return value, _to_named_uncertainties(uncert)
+
+    if uncert is not None:
+        raise ValueError(error_messages.PROPAGATION_UNCERTS_OF_RESULT)
+
+    values = [float(result.value.get()) for result in results]
+
+    # One array per uncertainty name, with 0 for results without that uncertainty
+    sigmas: dict[str, List[float]] = {}
+    for i, result in enumerate(results):
+        for u in result.uncertainties:
+            sigma = sigmas.setdefault(u.name, [0.0] * len(results))
+            # Uncertainties of one result with the same name are combined
+            sigma[i] = (sigma[i] ** 2 + float(u.uncertainty.get()) ** 2) ** 0.5
+
+    if isinstance(value, PrintableResult):
+        return values[0], [(sigma[0], u_name) for u_name, sigma in sigmas.items()]
+    return values, [(sigma, u_name) for u_name, sigma in sigmas.items()]
+
+
+def _to_results(value: Any) -> Union[List[Result], None]:
+    """Returns the results if the value is a result or a list of results."""
+    # pylint: disable=protected-access
+    if isinstance(value, PrintableResult):
+        return [value._result]
+    if (
+        isinstance(value, (list, tuple))
+        and len(value) > 0
+        and all(isinstance(v, PrintableResult) for v in value)
+    ):
+        return [v._result for v in value]
+    return None
+
+
+def _to_named_uncertainties(uncert: Any) -> List[Tuple[Any, str]]:
+    """Converts the uncertainties of one argument (as in `res_array()`: an array,
+    an (array, name) tuple or a list of those) to (array, name) tuples."""
+    if uncert is None:
+        return []
+    if _is_named_array(uncert):
+        return [uncert]
+    if not isinstance(uncert, list) or len(uncert) == 0 or _is_scalar(uncert[0]):
+        # a single array (or number) of uncertainties
+        return [(uncert, "")]
+    return [u if _is_named_array(u) else (u, "") for u in uncert]
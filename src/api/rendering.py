@@ -0,0 +1,119 @@
+from typing import TYPE_CHECKING, Callable, Hashable, List, Union
+
+import api.config as c
+from api.console_stringifier import ConsoleStringifier
+from api.latexer import get_latexer
+from api.profiling import _profiler
+from application.latex_commandifier import LatexCommandifier
+from application.render_cache import RenderCache, RenderCacheInfo
+from domain.result import Result
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+_render_cache = RenderCache(maxsize=10_000)
+
+# Parallel rendering: minimum number of results sent to a worker at once, and
+# the number of chunks if the number of workers of an executor is not known
+_MIN_CHUNK_SIZE = 256
+_DEFAULT_NUM_CHUNKS = 16
+
+
+def render_cache_info() -> RenderCacheInfo:
+    """
+    Returns statistics (hits, misses, maximum and current size) of the cache
+    that holds the console strings and LaTeX commands of already rendered results.
+    """
+    return _render_cache.info()
+
+
+def _latex_render_key() -> Hashable:
+    """Returns a key that captures all settings the LaTeX representation depends on."""
+    configuration = c.current_config()
+    return (
+        configuration.siunitx_fallback,
+        configuration.keyword_dispatch,
+        configuration.to_stringifier_config(),
+    )
+
+
+def _result_to_console_str(result: Result) -> str:
+    configuration = c.current_config()
+    return _render_cache.get_or_render(
+        ("console", configuration.to_stringifier_config(), result.content_key()),
+        lambda: _stringify(lambda: _console_stringifier(configuration).result_to_str(result)),
+    )
+
+
+def _console_stringifier(configuration: "c.Config") -> ConsoleStringifier:
+    """Returns the console stringifier for the configuration (created once per configuration)."""
+    return configuration.get_derived(
+        "console_stringifier",
+        lambda: ConsoleStringifier(configuration.to_stringifier_config()),
+    )
+
+
+def _result_to_latex_str(result: Result) -> str:
+    return _render_cache.get_or_render(
+        ("latex_str", _latex_render_key(), result.content_key()),
+        lambda: _stringify(lambda: get_latexer().result_to_latex_str(result)),
+    )
+
+
+def _result_to_latex_cmd(result: Result, latexer: LatexCommandifier, render_key: Hashable) -> str:
+    return _render_cache.get_or_render(
+        ("latex_cmd", render_key, result.content_key()),
+        lambda: _stringify(lambda: latexer.result_to_latex_cmd(result)),
+    )
+
+
+def _stringify(render: Callable[[], str]) -> str:
+    """Calls the stringifier (or latexer) in `render`, measured as "stringify" stage."""
+    with _profiler.stage("stringify"):
+        return render()
+
+
+def _results_to_latex_cmds(
+    results: List[Result],
+    latexer: LatexCommandifier,
+    render_key: Hashable,
+    executor: "Executor",
+    workers: Union[int, None],
+) -> List[str]:
+    """
+    Returns the LaTeX commands of the results (in the same order). Results that
+    are not in the render cache are rendered in chunks across the executor,
+    which has the given number of workers (if known).
+    """
+    keys = [("latex_cmd", render_key, result.content_key()) for result in results]
+    rendered = [_render_cache.get(key) for key in keys]
+    misses = [i for i, result_str in enumerate(rendered) if result_str is None]
+
+    chunk_size = _chunk_size(len(misses), workers)
+    chunks = [misses[i : i + chunk_size] for i in range(0, len(misses), chunk_size)]
+
+    if len(chunks) <= 1:
+        # Not worth the overhead of sending the results to other processes
+        for i in misses:
+            with _profiler.stage("stringify"):
+                rendered[i] = latexer.result_to_latex_cmd(results[i])
+    else:
+        futures = [
+            executor.submit(latexer.results_to_latex_cmds, [results[i] for i in chunk])
+            for chunk in chunks
+        ]
+        for chunk, future in zip(chunks, futures):
+            for i, result_str in zip(chunk, future.result()):
+                rendered[i] = result_str
+
+    for i in misses:
+        _render_cache.put(keys[i], rendered[i])
+
+    return rendered  # type: ignore
+
+
+def _chunk_size(num_results: int, workers: Union[int, None]) -> int:
+    # Few but large chunks such that the pickling overhead stays small,
+    # yet enough chunks such that all workers are kept busy
+    num_chunks = _DEFAULT_NUM_CHUNKS if workers is None else 4 * workers
+    return max(_MIN_CHUNK_SIZE, -(-num_results // num_chunks))
@@ -1,8 +1,13 @@
+import numbers
+import string
+import threading
+from contextlib import contextmanager
 from decimal import Decimal
-from typing import Union, List, Tuple
+from typing import Any, Iterator, Union, List, Sequence, Tuple
 
-from api.printable_result import PrintableResult
+from api.printable_result import PrintableResult, _print_all
 from api import parsers
+from api.profiling import _profiler
 from application.cache import ResultsCache
 from application.rounder import Rounder
 from application import error_messages
@@ -10,6 +15,18 @@ from domain.result import Result
 
 _res_cache = ResultsCache()
 
+
+class _Batches(threading.local):
+    """Results whose automatic printing/exporting is deferred, one list per open
+    `batch()`. Every thread has its own stack of batches."""
+
+    def __init__(self):
+        super().__init__()
+        self.stack: List[List[PrintableResult]] = []
+
+
+_batches = _Batches()
+
 # "Wrong" import position to avoid circular imports
 from api.export import _export  # pylint: disable=wrong-import-position,ungrouped-imports
 import api.config as c  # pylint: disable=wrong-import-position,ungrouped-imports
@@ -33,6 +50,7 @@ def res(
     stat: Union[float, int, str, Decimal, None] = None,
     sigfigs: Union[int, None] = None,
     decimal_places: Union[int, None] = None,
+    group: Union[str, None] = None,
 ) -> PrintableResult:
     """
     Declares your result. Give it a name and a value. You may also optionally provide
@@ -41,8 +59,166 @@ def res(
     You may additionally specify the number of significant figures or decimal places
     to round this specific result to, irrespective of your global configuration.
 
+    `group` assigns the result to a group, which determines the file it is
+    written to by `export_sharded()`.
+
     TODO: provide a link to the docs for more information and examples.
     """
+    group = parsers.parse_group(group)
+    result = _create_result(
+        name, value, uncerts, unit, sys, stat, sigfigs, decimal_places, c.current_config()
+    )
+    _res_cache.add(result.name, result, group, name)
+
+    printable_result = PrintableResult(result)
+    _auto_print_and_export([printable_result])
+
+    return printable_result
+
+
+# pylint: disable-next=too-many-arguments, too-many-locals
+def res_array(
+    name: Union[str, Sequence[str]],
+    values: Any,
+    uncerts: Any = None,
+    unit: str = "",
+    sys: Any = None,
+    stat: Any = None,
+    sigfigs: Union[int, Sequence[int], None] = None,
+    decimal_places: Union[int, Sequence[int], None] = None,
+    group: Union[str, None] = None,
+) -> List[PrintableResult]:
+    """
+    Declares many results at once, e.g. one result per channel of a measurement.
+
+    `values` may be a list, a NumPy array or any other object supporting the
+    buffer protocol (e.g. `array.array`). `name` is either a list of names or
+    a template that is formatted with the index of each element, e.g.
+    `"channel {i}"` or `"channel {}"`. Indices from 1000 on are inserted as
+    "1 thousand 21" etc., since names only allow numbers up to 999. Format specs
+    like `"{i:03d}"` can therefore only be used for up to 1000 elements.
+
+    `uncerts`, `sys` and `stat` take arrays of the same length as `values`.
+    Multiple uncertainties are passed in as a list of arrays, named ones as
+    tuples `(array, "name")`. `sigfigs` and `decimal_places` may either be
+    a single int for all results or one int per result. All results are
+    assigned to the same `group` (see `res()`).
+
+    Every element is parsed and rounded on its own, exactly like `res()` does;
+    this is not vectorized. Auto-printing works as with `res()`, but an automatic
+    export is only triggered once after all results have been declared.
+    """
+    group = parsers.parse_group(group)
+    values_list = _to_list(values, "`values`")
+    length = len(values_list)
+
+    names = _expand_names(name, length)
+    uncerts_lists = _expand_uncertainties(uncerts, length)
+    sys_list = _expand_array(sys, length, "`sys`")
+    stat_list = _expand_array(stat, length, "`stat`")
+    sigfigs_list = _expand_int_or_array(sigfigs, length, "`sigfigs`")
+    decimal_places_list = _expand_int_or_array(decimal_places, length, "`decimal_places`")
+
+    configuration = c.current_config()
+    results = []
+    for i in range(length):
+        uncerts_i = None
+        if uncerts_lists is not None:
+            uncerts_i = [(u[i], u_name) if u_name else u[i] for u, u_name in uncerts_lists]
+        results.append(
+            _create_result(
+                names[i],
+                values_list[i],
+                uncerts_i,
+                unit,
+                None if sys_list is None else sys_list[i],
+                None if stat_list is None else stat_list[i],
+                sigfigs_list[i],
+                decimal_places_list[i],
+                configuration,
+            )
+        )
+
+    return _declare_many(results, group, names)
+
+
+def _declare_many(
+    results: List[Result], group: Union[str, None], names: List[str]
+) -> List[PrintableResult]:
+    """Adds the results (declared with the given names) to the cache and prints and
+    exports them automatically if configured to do so (exporting only once)."""
+    _res_cache.add_many(results, group, names)
+
+    printable_results = [PrintableResult(result) for result in results]
+    _auto_print_and_export(printable_results)
+
+    return printable_results
+
+
+@contextmanager
+def batch(print_results: bool = True) -> Iterator[None]:
+    """
+    Defers the automatic printing (`print_auto`) and exporting (`export_auto_to`)
+    of all results declared inside the `with` block until the block is left:
+
+        with wiz.batch():
+            for i, value in enumerate(values):
+                wiz.res(f"value {i}", value)
+
+    On exit (also if an exception was raised), all results are exported only once
+    and printed together. Pass `print_results=False` to skip printing them.
+    Batches may be nested, in which case only the outermost batch triggers
+    the deferred printing and exporting. A batch only applies to results
+    declared in the thread that opened it.
+    """
+    stack = _batches.stack
+    stack.append([])
+    try:
+        yield
+    finally:
+        printable_results = stack.pop()
+        if len(stack) > 0:
+            stack[-1].extend(printable_results)
+        else:
+            _auto_print_and_export(printable_results, print_results)
+
+
+def _auto_print_and_export(
+    printable_results: List[PrintableResult], print_results: bool = True
+) -> None:
+    """
+    Prints and exports the given results if configured to do so automatically.
+    Inside a `batch()`, this is deferred until the batch is left.
+    """
+    if len(_batches.stack) > 0:
+        _batches.stack[-1].extend(printable_results)
+        return
+
+    if len(printable_results) == 0:
+        return
+
+    configuration = c.current_config()
+
+    # Print automatically
+    if configuration.print_auto and print_results:
+        with _profiler.stage("print"):
+            _print_all(printable_results)
+
+    # Export automatically
+    immediate_export_path = configuration.export_auto_to
+    if immediate_export_path != "":
+        _export(
+            immediate_export_path,
+            print_completed=False,
+            asynchronous=configuration.export_auto_async,
+        )
+
+
+# pylint: disable-next=too-many-arguments, too-many-locals
+def _create_result(
+    name, value, uncerts, unit, sys, stat, sigfigs, decimal_places, configuration: "c.Config"
+) -> Result:
+    """Verifies and parses the user input, assembles the result and rounds it."""
     # Verify user input
     if sigfigs is not None and decimal_places is not None:
         raise ValueError(error_messages.SIGFIGS_AND_DECIMAL_PLACES_AT_SAME_TIME)
@@ -68,28 +244,119 @@ def res(
         uncerts = []
 
     # Parse user input
-    name_res = parsers.parse_name(name)
-    value_res = parsers.parse_value(value)
-    uncertainties_res = parsers.parse_uncertainties(uncerts)
-    unit_res = parsers.parse_unit(unit)
-    sigfigs_res = parsers.parse_sigfigs(sigfigs)
-    decimal_places_res = parsers.parse_decimal_places(decimal_places)
+    with _profiler.stage("parse"):
+        name_res = parsers.parse_name(name)
+        value_res = parsers.parse_value(value)
+        uncertainties_res = parsers.parse_uncertainties(uncerts)
+        unit_res = parsers.parse_unit(unit)
+        sigfigs_res = parsers.parse_sigfigs(sigfigs)
+        decimal_places_res = parsers.parse_decimal_places(decimal_places)
 
     # Assemble the result
-    result = Result(
-        name_res, value_res, unit_res, uncertainties_res, sigfigs_res, decimal_places_res
-    )
-    Rounder.round_result(result, c.configuration.to_rounding_config())
-    _res_cache.add(name_res, result)
+    with _profiler.stage("round"):
+        result = Result(
+            name_res, value_res, unit_res, uncertainties_res, sigfigs_res, decimal_places_res
+        )
+        Rounder.round_result(result, configuration.to_rounding_config())
 
-    # Print automatically
-    printable_result = PrintableResult(result)
-    if c.configuration.print_auto:
-        printable_result.print()
+    return result
 
-    # Export automatically
-    immediate_export_path = c.configuration.export_auto_to
-    if immediate_export_path != "":
-        _export(immediate_export_path, print_completed=False)
 
-    return printable_result
+def _to_list(array: Any, field: str) -> list:
+    """Converts a list, a NumPy array or a buffer-protocol object to a list
+    of native Python numbers."""
+    if isinstance(array, (str, bytes)):
+        raise TypeError(error_messages.FIELD_MUST_BE_ARRAY.format(field=field))
+    if isinstance(array, list):
+        return array
+    if hasattr(array, "tolist"):
+        # NumPy arrays, `array.array` & `memoryview`
+        return array.tolist()
+    try:
+        return memoryview(array).tolist()
+    except TypeError:
+        pass
+    try:
+        return list(array)
+    except TypeError as exc:
+        raise TypeError(error_messages.FIELD_MUST_BE_ARRAY.format(field=field)) from exc
+
+
+def _check_length(array: list, length: int, field: str) -> None:
+    if len(array) != length:
+        raise ValueError(
+            error_messages.ARRAY_LENGTH_MISMATCH.format(
+                field=field, expected=length, actual=len(array)
+            )
+        )
+
+
+def _expand_names(name: Union[str, Sequence[str]], length: int) -> List[str]:
+    if isinstance(name, str):
+        if length > 1000 and _has_format_spec(name):
+            raise ValueError(error_messages.NAME_TEMPLATE_FORMAT_SPEC.format(length=length))
+        indices = [parsers.format_index(i) for i in range(length)]
+        return [name.format(index, i=index) for index in indices]
+    names = list(name)
+    _check_length(names, length, "`name`")
+    return names
+
+
+def _has_format_spec(template: str) -> bool:
+    return any(spec for _, _, spec, _ in string.Formatter().parse(template))
+
+
+def _expand_array(array: Any, length: int, field: str) -> Union[list, None]:
+    if array is None:
+        return None
+    array_list = _to_list(array, field)
+    _check_length(array_list, length, field)
+    return array_list
+
+
+def _expand_int_or_array(
+    value: Union[int, Sequence[int], None], length: int, field: str
+) -> List[Union[int, None]]:
+    if value is None or isinstance(value, numbers.Integral):
+        return [_to_int(value)] * length
+    array_list = _to_list(value, field)
+    _check_length(array_list, length, field)
+    return [_to_int(v) for v in array_list]
+
+
+def _to_int(value: Any) -> Any:
+    """Converts integers of other types (e.g. NumPy integers) to int. Other values
+    are returned unchanged and rejected later by the parsers."""
+    if isinstance(value, numbers.Integral) and not isinstance(value, int):
+        return int(value)
+    return value
+
+
+def _expand_uncertainties(uncerts: Any, length: int) -> Union[List[Tuple[list, str]], None]:
+    """Returns a list of (uncertainty array, uncertainty name) tuples.
+    Unnamed uncertainties have an empty name."""
+    if uncerts is None:
+        return None
+
+    if _is_named_array(uncerts):
+        uncerts = [uncerts]
+    elif not isinstance(uncerts, list) or len(uncerts) == 0 or _is_scalar(uncerts[0]):
+        # a single array of uncertainties
+        uncerts = [uncerts]
+
+    uncerts_lists = []
+    for u in uncerts:
+        u_array, u_name = u if _is_named_array(u) else (u, "")
+        u_list = _to_list(u_array, "Each uncertainty array")
+        _check_length(u_list, length, "Each uncertainty array")
+        uncerts_lists.append((u_list, u_name))
+
+    return uncerts_lists
+
+
+def _is_named_array(obj: Any) -> bool:
+    return isinstance(obj, tuple) and len(obj) == 2 and isinstance(obj[1], str)
+
+
+def _is_scalar(obj: Any) -> bool:
+    return isinstance(obj, (float, int, str, Decimal))
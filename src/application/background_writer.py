@@ -0,0 +1,63 @@
+import threading
+from typing import Callable, Union
+
+
+class BackgroundWriter:
+    """
+    Writes text files in a single background thread such that the caller
+    does not have to wait for (possibly slow) file system operations.
+
+    Write requests for the same file are coalesced: if a file is requested
+    to be written multiple times before the thread gets to it, only the latest
+    content is written ("latest snapshot wins").
+    """
+
+    def __init__(self, write: Callable[[str, str], None]):
+        self._write = write
+        self._pending: dict[str, str] = {}
+        self._num_writing = 0
+        self._error: Union[BaseException, None] = None
+        self._condition = threading.Condition()
+        self._thread: Union[threading.Thread, None] = None
+
+    def submit(self, filepath: str, content: str):
+        """Schedules the content to be written to the given file and returns immediately."""
+        with self._condition:
+            self._pending[filepath] = content
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="resultwizard-export", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self):
+        """
+        Blocks until all scheduled writes are completed. If a write failed
+        in the background, its exception is raised here.
+        """
+        with self._condition:
+            while len(self._pending) > 0 or self._num_writing > 0:
+                self._condition.wait()
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while len(self._pending) == 0:
+                    self._condition.wait()
+                filepath = next(iter(self._pending))
+                content = self._pending.pop(filepath)
+                self._num_writing += 1
+
+            try:
+                self._write(filepath, content)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                with self._condition:
+                    self._error = exc
+            finally:
+                with self._condition:
+                    self._num_writing -= 1
+                    self._condition.notify_all()
@@ -1,27 +1,396 @@
-from application.error_messages import RESULT_SHADOWED
+import threading
+from typing import TYPE_CHECKING, Callable, Hashable, Iterator, List, MutableMapping, Tuple, Union
+
+from application.columnar_store import ColumnarResultsStore
+from application.error_messages import RESULT_NAME_COLLISION, RESULT_SHADOWED
 from domain.result import Result
 
+if TYPE_CHECKING:
+    from application.results_database import ResultsDatabase
+
 
+# pylint: disable-next=too-many-instance-attributes
 class ResultsCache:
     """
     A cache for all user-defined results. Results are hashed by their name.
     If the user tries to add a result with a name that already exists in the cache,
     the new result will replace the old one ("shadowing").
+
+    The cache also keeps the rendered representation (e.g. the LaTeX command)
+    of every result. Results that were added or shadowed since the last rendering
+    are considered "dirty" and are the only ones that have to be rendered again.
+
+    For very large numbers of results, the cache can be backed by a
+    `ColumnarResultsStore` instead of a dict. It needs much less memory but
+    results are materialized on every access and rendered strings are not kept.
+
+    Results can additionally be persisted to an SQLite database (see
+    `ResultsDatabase`). The results stored there are loaded lazily, i.e. only
+    once the cache is accessed for the first time. Redeclaring a loaded result
+    doesn't issue a shadowing warning.
+
+    Results are stored by their (normalized) name, i.e. the name of their LaTeX
+    command. Different names given by the user can result in the same command
+    name (e.g. "a_b" and "aB"), so the cache additionally keeps the name every
+    result was declared with. Such collisions are reported instead of silently
+    overwriting the other result.
+
+    The cache is thread-safe: results may be added from multiple threads while
+    other threads export them. All methods hold an internal lock only briefly.
+    Rendering works on a snapshot of the results taken when it starts, such
+    that adding results doesn't have to wait for a running export. A result that
+    is added while it is being rendered is still considered dirty afterwards.
     """
 
     def __init__(self):
-        self.cache: dict[str, Result] = {}
+        self.cache: MutableMapping[str, Result] = {}
         self.issue_result_overwrite_warning = True
 
-    def configure(self, issue_result_overwrite_warning: bool):
-        self.issue_result_overwrite_warning = issue_result_overwrite_warning
+        self._lock = threading.RLock()
+        # Incremented on every change of a result, such that rendered strings
+        # of a result that changed while rendering it are discarded
+        self._versions: dict[str, int] = {}
+        self._version_counter = 0
+
+        self._rendered: dict[str, str] = {}
+        self._render_key: Hashable = None
+
+        # Explicit groups of results (for sharded exports), by result name
+        self._groups: dict[str, str] = {}
+
+        # The names the results were declared with, by result name. Only names
+        # that differ from the result name are stored to save memory.
+        self._original_names: dict[str, str] = {}
+
+        self._database: Union["ResultsDatabase", None] = None
+        self._database_loaded = True
+        # Results loaded from the database that were not declared again yet
+        self._loaded_names: set[str] = set()
+        # Rendered strings loaded from the database, with the render key they were rendered with
+        self._stored_rendered: dict[str, tuple[str, str]] = {}
+
+    def configure(
+        self, issue_result_overwrite_warning: bool, columnar: bool = False, persist_to: str = ""
+    ):
+        with self._lock:
+            self.issue_result_overwrite_warning = issue_result_overwrite_warning
+
+            if columnar != self.is_columnar():
+                store: MutableMapping[str, Result] = ColumnarResultsStore() if columnar else {}
+                store.update(self.cache.items())
+                self.cache = store
+                self._rendered.clear()
+
+            current_path = self._database.path if self._database is not None else ""
+            if persist_to != current_path:
+                self._load()  # don't lose results of the previous database
+                if self._database is not None:
+                    self._database.close()
+                    self._database = None
+                if persist_to != "":
+                    # Imported here such that sqlite3 is only loaded if needed
+                    # pylint: disable-next=import-outside-toplevel
+                    from application.results_database import ResultsDatabase
+
+                    self._database = ResultsDatabase(persist_to)
+                    self._database_loaded = False
+                    # Results declared so far are stored as well
+                    for name, result in self.cache.items():
+                        self._database.save(name, result, self._groups.get(name))
+
+    def _load(self):
+        """Loads the results of the database, if that didn't happen yet.
+        Must be called with the lock held."""
+        if self._database_loaded or self._database is None:
+            return
+        self._database_loaded = True
+        for name, result, group, stored_rendered in self._database.load():
+            if name in self.cache:
+                continue  # declared in this session before the database was loaded
+            self.cache[name] = result
+            self._bump_version(name)
+            if group is not None:
+                self._groups[name] = group
+            if stored_rendered is not None:
+                self._stored_rendered[name] = stored_rendered
+            self._loaded_names.add(name)
+
+    def _bump_version(self, name: str):
+        self._version_counter += 1
+        self._versions[name] = self._version_counter
+
+    def is_columnar(self) -> bool:
+        return isinstance(self.cache, ColumnarResultsStore)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self.cache)
+
+    def add(
+        self,
+        name,
+        result: Result,
+        group: Union[str, None] = None,
+        original_name: Union[str, None] = None,
+    ):
+        """Adds the result under the given (normalized) name. `original_name` is the
+        name the user declared the result with (if different)."""
+        if original_name is None:
+            original_name = name
+
+        with self._lock:
+            self._load()
+
+            if name in self._loaded_names:
+                self._loaded_names.discard(name)
+            elif name in self.cache:
+                other_name = self.get_original_name(name)
+                if other_name != original_name:
+                    print(
+                        RESULT_NAME_COLLISION.format(
+                            name=original_name, other_name=other_name, command_name=name
+                        )
+                    )
+                elif self.issue_result_overwrite_warning:
+                    print(RESULT_SHADOWED.format(name=name))
+
+            if original_name == name:
+                self._original_names.pop(name, None)
+            else:
+                self._original_names[name] = original_name
+
+            self.cache[name] = result
+            self._bump_version(name)
+            self._rendered.pop(name, None)  # mark as dirty
+            self._stored_rendered.pop(name, None)
 
-    def add(self, name, result: Result):
+            if group is None:
+                self._groups.pop(name, None)
+            else:
+                self._groups[name] = group
 
-        if self.issue_result_overwrite_warning and name in self.cache:
-            print(RESULT_SHADOWED.format(name=name))
+            if self._database is not None:
+                self._database.save(name, result, group)
 
-        self.cache[name] = result
+    def add_many(
+        self,
+        results: list[Result],
+        group: Union[str, None] = None,
+        original_names: Union[list[str], None] = None,
+    ):
+        if original_names is None:
+            original_names = [result.name for result in results]
+
+        with self._lock:
+            if self._database is None:
+                for result, original_name in zip(results, original_names):
+                    self.add(result.name, result, group, original_name)
+                return
+
+            self._load()
+            with self._database.transaction():
+                for result, original_name in zip(results, original_names):
+                    self.add(result.name, result, group, original_name)
+
+    def get_original_name(self, name: str) -> str:
+        """Returns the name the result with the given (normalized) name was declared with."""
+        with self._lock:
+            return self._original_names.get(name, name)
+
+    def get_group(self, name: str) -> Union[str, None]:
+        """Returns the group the result was explicitly assigned to (if any)."""
+        with self._lock:
+            self._load()
+            return self._groups.get(name)
+
+    def iter_names(self) -> Iterator[str]:
+        """Iterates over (a snapshot of) the names of all results (in insertion order)."""
+        with self._lock:
+            self._load()
+            return iter(list(self.cache))
+
+    def clear(self):
+        """Removes all results (and their rendered strings) from the cache
+        and from the database (if results are persisted)."""
+        with self._lock:
+            self.cache.clear()
+            self._versions.clear()
+            self._rendered.clear()
+            self._groups.clear()
+            self._original_names.clear()
+            self._loaded_names.clear()
+            self._stored_rendered.clear()
+            self._database_loaded = True
+            if self._database is not None:
+                self._database.clear()
 
     def get_all_results(self) -> list[Result]:
-        return list(self.cache.values())
+        with self._lock:
+            self._load()
+            return list(self.cache.values())
+
+    def iter_results(self) -> Iterator[Result]:
+        """Iterates over all results. For the columnar store, only one result
+        at a time is materialized."""
+        for name in self.iter_names():
+            result = self._get(name)
+            if result is not None:
+                yield result
+
+    def _get(self, name: str) -> Union[Result, None]:
+        with self._lock:
+            return self.cache.get(name)
+
+    def get_uncertainty_names(self) -> set[str]:
+        """Returns the names of all (named) uncertainties of all results."""
+        with self._lock:
+            self._load()
+            return self._uncertainty_names()
+
+    def _uncertainty_names(self) -> set[str]:
+        # Must be called with the lock held
+        if isinstance(self.cache, ColumnarResultsStore):
+            names = self.cache.get_uncertainty_names()
+        else:
+            names = {u.name for result in self.cache.values() for u in result.uncertainties}
+        names.discard("")
+        return names
+
+    def get_all_rendered(
+        self,
+        render: Callable[[Result], str],
+        render_key: Hashable,
+        render_many: Union[Callable[[List[Result]], List[str]], None] = None,
+    ) -> List[str]:
+        """
+        Returns the rendered strings of all results (in insertion order).
+
+        Only dirty results are passed to `render`, for all others the previously
+        rendered string is reused. `render_key` identifies the rendering settings;
+        if it differs from the one of the previous call, all results are rendered again.
+
+        If `render_many` is given, all dirty results are passed to it at once
+        instead, e.g. to render them in parallel. It must return the rendered
+        strings in the same order.
+        """
+        return list(self.iter_rendered(render, render_key, render_many))
+
+    def iter_rendered(
+        self,
+        render: Callable[[Result], str],
+        render_key: Hashable,
+        render_many: Union[Callable[[List[Result]], List[str]], None] = None,
+    ) -> Iterator[str]:
+        """
+        Like `get_all_rendered()`, but yields the rendered strings one at a time
+        such that they don't have to be held in memory all at once
+        (unless `render_many` is given).
+        """
+        return (
+            result_str
+            for _, result_str in self.iter_named_rendered(render, render_key, render_many)
+        )
+
+    def iter_named_rendered(
+        self,
+        render: Callable[[Result], str],
+        render_key: Hashable,
+        render_many: Union[Callable[[List[Result]], List[str]], None] = None,
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Like `iter_rendered()`, but yields (result name, rendered string) pairs.
+        """
+        with self._lock:
+            snapshot, dirty = self._take_render_snapshot(render_key, render_many)
+        yield from self._render_snapshot(snapshot, dirty, render, render_key, render_many)
+
+    def get_named_rendered_snapshot(
+        self,
+        render: Callable[[Result], str],
+        render_key: Hashable,
+        render_many: Union[Callable[[List[Result]], List[str]], None] = None,
+    ) -> Tuple[set[str], Iterator[Tuple[str, str]]]:
+        """
+        Like `iter_named_rendered()`, but takes the snapshot of the results right
+        away and also returns the uncertainty names (see `get_uncertainty_names()`)
+        of the very same results, e.g. for the siunitx setup of an export.
+        """
+        with self._lock:
+            snapshot, dirty = self._take_render_snapshot(render_key, render_many)
+            uncertainty_names = self._uncertainty_names()
+        rendered = self._render_snapshot(snapshot, dirty, render, render_key, render_many)
+        return uncertainty_names, rendered
+
+    def _take_render_snapshot(
+        self,
+        render_key: Hashable,
+        render_many: Union[Callable[[List[Result]], List[str]], None],
+    ) -> Tuple[List[Tuple[str, int, Union[str, None]]], List[Tuple[str, Result]]]:
+        # Must be called with the lock held
+        self._load()
+        if render_key != self._render_key:
+            self._rendered.clear()
+            self._render_key = render_key
+
+        # Strings rendered in a previous session can be reused if the settings match
+        stored_render_key = repr(render_key)
+        for name, (key, result_str) in self._stored_rendered.items():
+            if key == stored_render_key and name not in self._rendered:
+                self._rendered[name] = result_str
+        self._stored_rendered.clear()
+
+        snapshot = [(name, self._versions[name], self._rendered.get(name)) for name in self.cache]
+        dirty = []
+        if render_many is not None:
+            dirty = [(name, self.cache[name]) for name, _, s in snapshot if s is None]
+        return snapshot, dirty
+
+    # pylint: disable-next=too-many-arguments
+    def _render_snapshot(
+        self,
+        snapshot: List[Tuple[str, int, Union[str, None]]],
+        dirty: List[Tuple[str, Result]],
+        render: Callable[[Result], str],
+        render_key: Hashable,
+        render_many: Union[Callable[[List[Result]], List[str]], None],
+    ) -> Iterator[Tuple[str, str]]:
+        # Rendering happens without holding the lock
+        fresh: dict[str, str] = {}
+        if dirty:
+            fresh = dict(zip([name for name, _ in dirty], render_many([r for _, r in dirty])))
+
+        newly_rendered = []
+        for name, version, result_str in snapshot:
+            if result_str is None:
+                result_str = fresh.get(name)
+                if result_str is None:
+                    # Only materialize the result if it has to be rendered
+                    result = self._get(name)
+                    if result is None:
+                        continue  # removed in the meantime
+                    result_str = render(result)
+                self._store_rendered(name, version, render_key, result_str, newly_rendered)
+            yield name, result_str
+
+        if self._database is not None and newly_rendered:
+            with self._lock:
+                self._database.save_rendered(newly_rendered, repr(render_key))
+
+    # pylint: disable-next=too-many-arguments
+    def _store_rendered(
+        self,
+        name: str,
+        version: int,
+        render_key: Hashable,
+        result_str: str,
+        newly_rendered: List[Tuple[str, str]],
+    ):
+        with self._lock:
+            # The result (or the render key) might have changed while it was rendered
+            if self._versions.get(name) != version or self._render_key != render_key:
+                return
+            if not self.is_columnar():
+                self._rendered[name] = result_str
+            if self._database is not None:
+                newly_rendered.append((name, result_str))
@@ -0,0 +1,360 @@
+from array import array
+from collections.abc import MutableMapping
+from decimal import Decimal
+from typing import Iterator, Tuple, Union
+
+from domain.result import Result
+from domain.uncertainty import Uncertainty
+from domain.value import Value
+
+_NONE = -(2**63)  # sentinel for "not set" in the int64 columns
+_MAX_INT64_DIGITS = 18  # every mantissa with up to 18 digits fits into an int64
+
+# How the decimal of a value is stored
+_KIND_MANTISSA = 0  # int64 mantissa & exponent, e.g. exact values like "3.14"
+_KIND_FLOAT = 1  # a double that exactly represents the decimal, i.e. values passed as float
+_KIND_OBJECT = 2  # anything else is kept as Decimal object
+
+
+# A value packed for the columns: kind, mantissa (or float bits), exponent,
+# Decimal object (only for _KIND_OBJECT), is_exact, min_exponent, max_exponent
+_PackedValue = Tuple[int, int, int, Union[Decimal, None], bool, int, int]
+
+
+def _pack_value(value: Value) -> _PackedValue:
+    decimal_value, is_exact, min_exponent, max_exponent = value.content_key()
+    min_exponent = _NONE if min_exponent is None else min_exponent
+
+    # Exponents of finite decimals always fit into an int64 (see decimal.MIN_ETINY)
+    sign, digits, exponent = decimal_value.as_tuple()
+    if len(digits) <= _MAX_INT64_DIGITS and isinstance(exponent, int):
+        mantissa = int("".join(map(str, digits)))
+        mantissa = -mantissa if sign else mantissa
+        return _KIND_MANTISSA, mantissa, exponent, None, is_exact, min_exponent, max_exponent
+    if decimal_value.is_finite() and Decimal(float(decimal_value)) == decimal_value:
+        bits = _float_to_bits(float(decimal_value))
+        return _KIND_FLOAT, bits, 0, None, is_exact, min_exponent, max_exponent
+    return _KIND_OBJECT, 0, 0, decimal_value, is_exact, min_exponent, max_exponent
+
+
+class _ValueColumns:
+    """Packed columns for many `Value`s, addressed by their index."""
+
+    def __init__(self):
+        self.kinds = array("b")
+        self.mantissas = array("q")  # mantissa, or the bits of the float
+        self.exponents = array("q")
+        self.is_exact = array("b")
+        self.min_exponents = array("q")
+        self.max_exponents = array("q")
+        self.objects: dict[int, Decimal] = {}
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def append(self, packed: _PackedValue) -> int:
+        index = len(self.kinds)
+        kind, mantissa, exponent, obj, is_exact, min_exponent, max_exponent = packed
+        self.kinds.append(kind)
+        self.mantissas.append(mantissa)
+        self.exponents.append(exponent)
+        self.is_exact.append(is_exact)
+        self.min_exponents.append(min_exponent)
+        self.max_exponents.append(max_exponent)
+        if obj is not None:
+            self.objects[index] = obj
+        return index
+
+    def set(self, index: int, packed: _PackedValue):
+        kind, mantissa, exponent, obj, is_exact, min_exponent, max_exponent = packed
+        self.kinds[index] = kind
+        self.mantissas[index] = mantissa
+        self.exponents[index] = exponent
+        self.is_exact[index] = is_exact
+        self.min_exponents[index] = min_exponent
+        self.max_exponents[index] = max_exponent
+        self.release(index)
+        if obj is not None:
+            self.objects[index] = obj
+
+    def release(self, index: int):
+        """Frees the Decimal object of an index that isn't used anymore."""
+        self.objects.pop(index, None)
+
+    def packed(self, index: int) -> _PackedValue:
+        return (
+            self.kinds[index],
+            self.mantissas[index],
+            self.exponents[index],
+            self.objects.get(index),
+            bool(self.is_exact[index]),
+            self.min_exponents[index],
+            self.max_exponents[index],
+        )
+
+    def get(self, index: int) -> Value:
+        kind = self.kinds[index]
+        if kind == _KIND_MANTISSA:
+            decimal_value = Decimal(f"{self.mantissas[index]}e{self.exponents[index]}")
+        elif kind == _KIND_FLOAT:
+            decimal_value = Decimal(_bits_to_float(self.mantissas[index]))
+        else:
+            decimal_value = self.objects[index]
+
+        min_exponent = self.min_exponents[index]
+        return Value.from_content_key(
+            (
+                decimal_value,
+                bool(self.is_exact[index]),
+                None if min_exponent == _NONE else min_exponent,
+                self.max_exponents[index],
+            )
+        )
+
+
+class _Dictionary:
+    """Dictionary encoding of strings that occur many times, e.g. units."""
+
+    def __init__(self):
+        self.strings: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def encode(self, string: str) -> int:
+        code = self._codes.get(string)
+        if code is None:
+            code = len(self.strings)
+            self.strings.append(string)
+            self._codes[string] = code
+        return code
+
+    def decode(self, code: int) -> str:
+        return self.strings[code]
+
+
+class _RowColumns:
+    """Packed columns for everything of a result except its uncertainties."""
+
+    # Entries per row in `rounding`: sigfigs, decimal places and the rounding
+    # state (min & max exponent) of the total uncertainty
+    ROUNDING_STRIDE = 4
+
+    def __init__(self):
+        self.values = _ValueColumns()
+        self.units = array("I")
+        self.unit_dictionary = _Dictionary()
+        self.rounding = array("q")
+        self.uncert_start = array("Q")
+        self.uncert_count = array("I")
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, packed: _PackedValue) -> int:
+        row = self.values.append(packed)
+        self.units.append(0)
+        self.rounding.extend([_NONE] * self.ROUNDING_STRIDE)
+        self.uncert_start.append(0)
+        self.uncert_count.append(0)
+        return row
+
+
+class _UncertaintyColumns:
+    """Packed columns for the uncertainties of all results."""
+
+    def __init__(self):
+        self.values = _ValueColumns()
+        self.names = array("I")
+        self.name_dictionary = _Dictionary()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, packed: _PackedValue, name_code: int):
+        self.values.append(packed)
+        self.names.append(name_code)
+
+    def set(self, index: int, packed: _PackedValue, name_code: int):
+        self.values.set(index, packed)
+        self.names[index] = name_code
+
+
+class ColumnarResultsStore(MutableMapping):
+    """
+    A memory-efficient mapping from result names to results, stored as
+    struct of arrays instead of many individual `Result` objects:
+
+    - the names in an index (name -> row)
+    - values and uncertainties as packed mantissa/exponent (or float) columns
+    - units and uncertainty names dictionary-encoded
+    - the rounding metadata in int columns
+
+    A `Result` is only materialized when it's accessed, e.g. while iterating
+    over the store, so that an export doesn't need all results in memory at once.
+    The uncertainties of a row are stored consecutively (`uncert_start` and
+    `uncert_count` point into the uncertainty columns). When a result is
+    shadowed, the row is overwritten and its new uncertainties reuse the old
+    slots if they fit. Rows of deleted results are reused for new results and
+    the uncertainty columns are compacted once more than half of them are unused.
+    """
+
+    def __init__(self):
+        self._index: dict[str, int] = {}
+        self._free_rows: list[int] = []
+        self._rows = _RowColumns()
+        self._uncerts = _UncertaintyColumns()
+        self._num_unused_uncerts = 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __getitem__(self, name: str) -> Result:
+        return self._materialize(name, self._index[name])
+
+    def __delitem__(self, name: str):
+        row = self._index.pop(name)
+        self._num_unused_uncerts += self._rows.uncert_count[row]
+        self._rows.uncert_count[row] = 0
+        self._rows.values.release(row)
+        self._free_rows.append(row)
+        self._compact_if_needed()
+
+    def __setitem__(self, name: str, result: Result):
+        # Pack everything first, such that an error can't leave a half-written row
+        packed_value = _pack_value(result.value)
+        packed_uncerts = [
+            (_pack_value(u.uncertainty), self._uncerts.name_dictionary.encode(u.name))
+            for u in result.uncertainties
+        ]
+        rounding = _pack_rounding(result)
+        unit_code = self._rows.unit_dictionary.encode(result.unit)
+
+        rows = self._rows
+        row = self._index.get(name)
+        if row is None and self._free_rows:
+            row = self._free_rows.pop()
+        if row is None:
+            row = rows.append(packed_value)
+        else:
+            rows.values.set(row, packed_value)
+
+        rows.units[row] = unit_code
+        stride = _RowColumns.ROUNDING_STRIDE
+        rows.rounding[row * stride : (row + 1) * stride] = rounding
+        self._store_uncertainties(row, packed_uncerts)
+
+        self._index[name] = row
+        self._compact_if_needed()
+
+    def clear(self):
+        self._index = {}
+        self._free_rows = []
+        self._rows = _RowColumns()
+        self._uncerts = _UncertaintyColumns()
+        self._num_unused_uncerts = 0
+
+    def get_uncertainty_names(self) -> set[str]:
+        """Returns the names of all uncertainties without materializing any result."""
+        codes = set()
+        for row in self._index.values():
+            start = self._rows.uncert_start[row]
+            codes.update(self._uncerts.names[start : start + self._rows.uncert_count[row]])
+        return {self._uncerts.name_dictionary.decode(code) for code in codes}
+
+    def _store_uncertainties(self, row: int, packed_uncerts: list[Tuple[_PackedValue, int]]):
+        """Stores the uncertainties of a row, reusing the slots of its previous
+        uncertainties if they fit."""
+        old_start, old_count = self._rows.uncert_start[row], self._rows.uncert_count[row]
+        count = len(packed_uncerts)
+        if count <= old_count:
+            start = old_start
+            for i, (packed, name_code) in enumerate(packed_uncerts):
+                self._uncerts.set(start + i, packed, name_code)
+            unused = range(old_start + count, old_start + old_count)
+        else:
+            start = len(self._uncerts)
+            for packed, name_code in packed_uncerts:
+                self._uncerts.append(packed, name_code)
+            unused = range(old_start, old_start + old_count)
+
+        for i in unused:
+            self._uncerts.values.release(i)
+        self._num_unused_uncerts += len(unused)
+        self._rows.uncert_start[row] = start
+        self._rows.uncert_count[row] = count
+
+    def _compact_if_needed(self):
+        """Copies the uncertainties that are still used to new columns once
+        more than half of the uncertainty columns are unused."""
+        if self._num_unused_uncerts * 2 <= len(self._uncerts):
+            return
+
+        old = self._uncerts
+        self._uncerts = _UncertaintyColumns()
+        self._uncerts.name_dictionary = old.name_dictionary
+        for row in self._index.values():
+            start = self._rows.uncert_start[row]
+            self._rows.uncert_start[row] = len(self._uncerts)
+            for i in range(start, start + self._rows.uncert_count[row]):
+                self._uncerts.append(old.values.packed(i), old.names[i])
+        self._num_unused_uncerts = 0
+
+    def _materialize(self, name: str, row: int) -> Result:
+        rows = self._rows
+        start = rows.uncert_start[row]
+        uncertainties = [
+            Uncertainty(
+                self._uncerts.values.get(i),
+                self._uncerts.name_dictionary.decode(self._uncerts.names[i]),
+            )
+            for i in range(start, start + rows.uncert_count[row])
+        ]
+
+        stride = _RowColumns.ROUNDING_STRIDE
+        sigfigs, decimal_places, min_exponent, max_exponent = rows.rounding[
+            row * stride : (row + 1) * stride
+        ]
+        result = Result(
+            name,
+            rows.values.get(row),
+            rows.unit_dictionary.decode(rows.units[row]),
+            uncertainties,
+            None if sigfigs == _NONE else sigfigs,
+            None if decimal_places == _NONE else decimal_places,
+        )
+
+        if result.total_uncertainty is not None:
+            result.total_uncertainty.uncertainty.restore_rounding(
+                None if min_exponent == _NONE else min_exponent,
+                max_exponent,
+            )
+
+        return result
+
+
+def _pack_rounding(result: Result) -> array:
+    """Returns sigfigs, decimal places and the rounding state of the total uncertainty."""
+    rounding = array("q", [_NONE] * _RowColumns.ROUNDING_STRIDE)
+    if result.sigfigs is not None:
+        rounding[0] = result.sigfigs
+    if result.decimal_places is not None:
+        rounding[1] = result.decimal_places
+    if result.total_uncertainty is not None:
+        _, _, min_exponent, max_exponent = result.total_uncertainty.uncertainty.content_key()
+        if min_exponent is not None:
+            rounding[2] = min_exponent
+        rounding[3] = max_exponent
+    return rounding
+
+
+def _float_to_bits(value: float) -> int:
+    return array("q", array("d", [value]).tobytes())[0]
+
+
+def _bits_to_float(bits: int) -> float:
+    return array("d", array("q", [bits]).tobytes())[0]
@@ -22,6 +22,24 @@ UNCERT_AND_SYS_STAT_AT_SAME_TIME = (
     "You can't set uncertainties and systematic/statistical uncertainties at the same time. "
     "Please provide either the `uncert` param or the `sys`/`stat` params."
 )
+KEYWORD_DISPATCH_INVALID = "keyword_dispatch must be 'ifthenelse' or 'csname', not '{value}'."
+WORKERS_MUST_BE_POSITIVE = "workers must be greater than 0."
+NUMPY_REQUIRED = "propagate() requires NumPy. Please install it, e.g. with `pip install numpy`."
+PROPAGATION_UNCERTS_LENGTH = (
+    "`uncerts` must contain one entry per element of `values` ({expected}), not {actual}"
+)
+PROPAGATION_UNCERTS_OF_RESULT = (
+    "The uncertainties of results in `values` are taken from the results themselves, "
+    "so their entry in `uncerts` must be None."
+)
+PROPAGATION_JACOBIAN_LENGTH = (
+    "`jacobian` must return one partial derivative per element of `values` "
+    "({expected}), not {actual}"
+)
+PROPAGATION_NOT_FINITE = (
+    "The derived value or its propagated uncertainty is not finite (NaN or infinity) "
+    "for at least one result."
+)
 
 # Parser error messages (generic)
 STRING_MUST_BE_NUMBER = "String value must be a valid number, not {value}"
@@ -30,11 +48,22 @@ FIELD_MUST_BE_INT = "{field} must be an int, not {type}"
 FIELD_MUST_NOT_BE_EMPTY = "{field} must not be empty"
 FIELD_MUST_BE_POSITIVE = "{field} must be positive"
 FIELD_MUST_BE_NON_NEGATIVE = "{field} must be non-negative"
+FIELD_MUST_BE_ARRAY = "{field} must be a list, a NumPy array or support the buffer protocol"
+ARRAY_LENGTH_MISMATCH = "{field} must have the same length as `values` ({expected}), not {actual}"
+NAME_TEMPLATE_FORMAT_SPEC = (
+    "Format specs in name templates (like `{{i:03d}}`) only work for up to 1000 values, "
+    'since larger indices are inserted as words, e.g. "1 thousand 21". Got {length} values. '
+    "Use `{{i}}` or pass a list of names instead."
+)
 
 # Parser error messages (specific)
 STRING_EMPTY_AFTER_IGNORING_INVALID_CHARS = (
     "After ignoring invalid characters, the specified name is empty."
 )
+GROUP_INVALID = (
+    "{field} may only contain letters, digits, '-' and '_' (it is used as filename), not '{group}'"
+)
+GROUP_RESERVED = "The group name 'index' is reserved for the index file of sharded exports."
 VALUE_TYPE = "{field} must be a float, int, Decimal or string, not {type}"
 UNCERTAINTIES_MUST_BE_TUPLES_OR = (
     "Each uncertainty must be a tuple or a float/int/Decimal/str, not {type}"
@@ -49,6 +78,7 @@ PRECISION_TOO_LOW = (
     "precision. Set a higher precision via: `wiz.config_init (precision=<a-high-enough-number>)`."
 )
 NUMBER_TO_WORD_TOO_HIGH = "For variable names, only use numbers between 0 and 999. Got {number}."
+INDEX_TOO_LARGE = "Indices in name templates must be smaller than 10^15. Got {index}."
 
 # Runtime errors
 SHORT_RESULT_IS_NONE = "Short result is None, but there should be at least two uncertainties."
@@ -64,4 +94,12 @@ NUM_OF_DECIMAL_PLACES_TOO_LOW = (
     "Warning: At least one of the specified values is out of range of the specified "
     "number of decimal places. Thus, the exported value will be 0."
 )
+RESULTS_DATABASE_VERSION = (
+    "The results database '{path}' was created by an incompatible version"
+    " of ResultWizard (schema version {version}). Please choose another file."
+)
 RESULT_SHADOWED = "Warning: A result with the name '{name}' already exists and will be overwritten."
+RESULT_NAME_COLLISION = (
+    "Warning: The names '{name}' and '{other_name}' both result in the LaTeX command "
+    "name '{command_name}'. The result '{other_name}' will be overwritten."
+)
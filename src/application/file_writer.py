@@ -0,0 +1,62 @@
+import hashlib
+import os
+import shutil
+from typing import Union
+
+
+def write_file_if_changed(filepath: str, content: str) -> bool:
+    """
+    Writes the content to the file unless the file already has exactly this content.
+    This way, build tools (e.g. latexmk) don't see a modified file if nothing changed.
+
+    The file is replaced atomically: the content is first written to a temporary
+    file in the same directory, which is then renamed to the target file. Readers
+    (e.g. a LaTeX build running at the same time) thus see either the old or the
+    new file, but never a half-written one. If the file is a symlink, the file it
+    points to is replaced (keeping the symlink), and the permissions of an existing
+    file are kept.
+
+    Returns whether the file was written.
+    """
+    # The bytes that end up on disk when writing in text mode
+    data = content.replace("\n", os.linesep).encode("utf-8")
+
+    if _file_size(filepath) == len(data) and _file_hash(filepath) == hashlib.sha256(data).digest():
+        return False
+
+    target = os.path.realpath(filepath)
+    directory, filename = os.path.split(target)
+    tmp_path = os.path.join(directory, f".{filename}.{os.urandom(16).hex()}.tmp")
+    try:
+        with open(tmp_path, "xb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(target):
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return True
+
+
+def _file_size(filepath: str) -> Union[int, None]:
+    try:
+        return os.path.getsize(filepath)
+    except OSError:
+        return None
+
+
+def _file_hash(filepath: str) -> Union[bytes, None]:
+    """Returns the SHA-256 digest of the file or None if it can't be read."""
+    sha256 = hashlib.sha256()
+    try:
+        with open(filepath, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                sha256.update(chunk)
+    except OSError:
+        return None
+    return sha256.digest()
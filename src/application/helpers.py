@@ -1,6 +1,6 @@
-import math
 import decimal
 from decimal import Decimal
+from functools import lru_cache
 
 from application import error_messages
 
@@ -36,29 +36,150 @@ _NUMBER_TO_WORD = {
 }
 
 
+# ResultWizard does all its arithmetic in private decimal contexts which are passed
+# explicitly to every operation. Thus, the decimal context of the user (thread) is
+# neither used nor modified. Exact operations (quantize, scaleb, sums and products)
+# use a context with the maximum precision, so they never round. The inexact square
+# root uses a context with at least `_min_precision` digits. Both contexts are only
+# created once (or when the precision changes) as configuring them per call is
+# about as expensive as the operations themselves.
+def _new_context(precision: int) -> decimal.Context:
+    return decimal.Context(
+        prec=precision,
+        rounding=decimal.ROUND_HALF_EVEN,
+        Emin=decimal.MIN_EMIN,
+        Emax=decimal.MAX_EMAX,
+        traps=[decimal.InvalidOperation, decimal.DivisionByZero, decimal.Overflow],
+    )
+
+
+_EXACT_CONTEXT = _new_context(decimal.MAX_PREC)
+_min_precision = 100  # pylint: disable=invalid-name
+_sqrt_context = _new_context(_min_precision)  # pylint: disable=invalid-name
+
+
+# Decimals with more significant digits than floats have, all of them nines,
+# come from floats that stand for a power of ten (see `Helpers.get_exponent()`)
+_FLOAT_DIGITS = 15
+
+
+@lru_cache(maxsize=None)
+def _largest_float_digits_nines(exponent: int) -> Decimal:
+    """Returns 9.99...9 * 10^exponent with as many nines as floats have digits."""
+    return Decimal((0, (9,) * _FLOAT_DIGITS, exponent - _FLOAT_DIGITS + 1))
+
+
+def _is_just_below_power_of_ten(value: Decimal) -> bool:
+    # Comparisons are exact and, unlike `as_tuple()`, don't copy all the digits
+    return value.copy_abs() > _largest_float_digits_nines(value.adjusted())
+
+
 class Helpers:
+    @classmethod
+    def set_min_precision(cls, precision: int):
+        """Sets the precision used for inexact operations, e.g. square roots."""
+        global _min_precision, _sqrt_context  # pylint: disable=global-statement
+        if precision != _min_precision:
+            _min_precision = precision
+            _sqrt_context = _new_context(precision)
+
     @classmethod
     def get_exponent(cls, value: Decimal) -> int:
+        """
+        Returns the exponent of the most significant digit, i.e. floor(log10(|value|)).
+
+        This is computed from the integer exponent and number of digits of the
+        decimal (`adjusted()`) and not via floats, so it also works for values that
+        are out of range for floats.
+
+        Values passed as float are the exact binary expansion of the float, which
+        for powers of ten lies just below them, e.g. Decimal(1e-6) is
+        9.99999999999999954748e-7. Such values are treated as the power of ten
+        they stand for, i.e. the exponent of Decimal(1e-6) is -6.
+        """
         if value == 0:
             return 0
-        return math.floor(math.log10(abs(value)))
+        if _is_just_below_power_of_ten(value):
+            return value.adjusted() + 1
+        return value.adjusted()
 
     @classmethod
     def get_first_digit(cls, value: Decimal) -> int:
-        n = abs(value) * 10 ** (-cls.get_exponent(value))
-        return math.floor(n)
+        if value == 0:
+            return 0
+        if _is_just_below_power_of_ten(value):
+            return 1
+        return value.as_tuple().digits[0]
 
     @classmethod
     def round_to_n_decimal_places(cls, value: Decimal, n: int) -> str:
+        return f"{cls.round_decimal(value, n):.{n}f}"
+
+    @classmethod
+    def round_decimal(cls, value: Decimal, n: int) -> Decimal:
+        """Rounds the value to n decimal places (rounding half to even)."""
         if n < 0:
             raise RuntimeError(error_messages.ROUND_TO_NEGATIVE_DECIMAL_PLACES)
 
         try:
-            decimal_value = value.quantize(Decimal(f"1.{'0' * n}"))
-            return f"{decimal_value:.{n}f}"
+            return _EXACT_CONTEXT.quantize(value, _quantum(n))
         except decimal.InvalidOperation as exc:
             raise ValueError(error_messages.PRECISION_TOO_LOW) from exc
 
+    @classmethod
+    def shift(cls, value: Decimal, n: int) -> Decimal:
+        """Returns value * 10^n (exactly)."""
+        if n == 0:
+            return value
+        return _EXACT_CONTEXT.scaleb(value, n)
+
+    @classmethod
+    def sqrt_of_sum_of_squares(cls, values: list[Decimal]) -> Decimal:
+        """
+        Returns sqrt(v_1^2 + v_2^2 + ...), e.g. to combine uncertainties.
+
+        The sum of squares is computed exactly. The square root is precise at least
+        down to the smallest exponent of the given values or `_min_precision` digits,
+        whichever is more precise.
+        """
+        nonzero = [v for v in values if v != 0]
+        if len(nonzero) == 0:
+            return Decimal(0)
+
+        max_exponent = max(v.adjusted() for v in nonzero)
+        min_exponent = min(v.as_tuple().exponent for v in nonzero)
+        digits_range = max_exponent - min_exponent + 2
+
+        total = Decimal(0)
+        for v in nonzero:
+            total = _EXACT_CONTEXT.add(total, _EXACT_CONTEXT.multiply(v, v))
+
+        if digits_range > _min_precision:
+            return _new_context(digits_range).sqrt(total)
+        return _sqrt_context.sqrt(total)
+
+    @classmethod
+    def rounds_to_zero(cls, value: Decimal, min_exponent: int) -> bool:
+        """
+        Returns whether the value is rounded to zero when only keeping the digits
+        down to 10^min_exponent (rounding half to even as in `round_to_n_decimal_places`),
+        i.e. whether |value| <= 0.5 * 10^min_exponent.
+
+        Only the exponent and the digits of the value are compared, no arithmetic is needed.
+        """
+        if value == 0:
+            return True
+
+        exponent = value.adjusted()
+        if exponent >= min_exponent:
+            return False
+        if exponent < min_exponent - 1:
+            return True
+
+        # |value| = d.ddd * 10^(min_exponent - 1)
+        digits = value.as_tuple().digits
+        return digits[0] < 5 or (digits[0] == 5 and not any(digits[1:]))
+
     @classmethod
     def number_to_word(cls, number: int) -> str:
         if 0 <= number <= 19:
@@ -81,3 +202,9 @@ class Helpers:
     @classmethod
     def capitalize(cls, s: str) -> str:
         return s[0].upper() + s[1:]
+
+
+@lru_cache(maxsize=None)
+def _quantum(n: int) -> Decimal:
+    """Returns 10^(-n) to be used with `Decimal.quantize()`."""
+    return Decimal((0, (1,), -n))
@@ -1,6 +1,9 @@
+from typing import List, Union
+
 from application.stringifier import Stringifier
 from application.helpers import Helpers
 from application.latex_ifelse import LatexIfElseBuilder
+from application.latex_csname import LatexCsnameBuilder
 from application import error_messages
 from domain.result import Result
 
@@ -10,25 +13,35 @@ class LatexCommandifier:
     into a LaTeX command (e.g. \\newcommand{\\resultImportant}{\\qty{1.23}{\\m}}).
     """
 
-    def __init__(self, stringifier: Stringifier):
+    def __init__(self, stringifier: Stringifier, keyword_dispatch: str = "ifthenelse"):
         self.s = stringifier
+        self.keyword_dispatch = keyword_dispatch
 
     def result_to_latex_cmd(self, result: Result) -> str:
         """
         Returns the result as LaTeX command to be used in a .tex file.
         """
-        builder = LatexIfElseBuilder()
+        builder: Union[LatexIfElseBuilder, LatexCsnameBuilder]
+        if self.keyword_dispatch == "csname":
+            builder = LatexCsnameBuilder()
+        else:
+            builder = LatexIfElseBuilder()
 
         cmd_name = f"{self.s.config.identifier}{Helpers.capitalize(result.name)}"
-        latex_str = rf"\newcommand*{{\{cmd_name}}}[1][]{{" + "\n"
+        unit = result.unit
+
+        # The digits of the value and the uncertainties are only rounded once
+        # and then shared by all variants that print them in the same notation
+        parts = self.s.create_number_parts(result.value, result.uncertainties)
+        value_parts = self.s.create_number_parts(result.value, [], parts)
 
         # Default case (full result) & value
-        builder.add_branch("", self.result_to_latex_str(result))
-        builder.add_branch("value", self.result_to_latex_str_value(result))
+        builder.add_branch("", self.s.assemble_str(parts, unit))
+        builder.add_branch("value", self.s.assemble_str(value_parts, ""))
 
         # Without uncertainty
         if len(result.uncertainties) > 0:
-            builder.add_branch("withoutUncert", self.result_to_latex_str_without_uncert(result))
+            builder.add_branch("withoutUncert", self.s.assemble_str(value_parts, unit))
 
         # Single uncertainties
         for i, u in enumerate(result.uncertainties):
@@ -37,24 +50,23 @@ class LatexCommandifier:
             else:
                 uncertainty_name = u.name if u.name != "" else Helpers.number_to_word(i + 1)
                 uncertainty_name = f"uncert{Helpers.capitalize(uncertainty_name)}"
-            uncertainty_latex_str = self.s.create_str(u.uncertainty, [], result.unit)
+            uncertainty_latex_str = self.s.create_str(u.uncertainty, [], unit)
             builder.add_branch(uncertainty_name, uncertainty_latex_str)
 
         # Total uncertainty and short result
         if len(result.uncertainties) >= 2:
-            short_result = result.get_short_result()
-            if short_result is None:
+            total_uncertainty = result.total_uncertainty
+            if total_uncertainty is None:
                 raise RuntimeError(error_messages.SHORT_RESULT_IS_NONE)
-            uncertainty_latex_str = self.s.create_str(
-                short_result.uncertainties[0].uncertainty, [], result.unit
-            )
+            uncertainty_latex_str = self.s.create_str(total_uncertainty.uncertainty, [], unit)
             builder.add_branch("uncertTotal", uncertainty_latex_str)
-            builder.add_branch("short", self.result_to_latex_str(short_result))
+            short_parts = self.s.create_number_parts(result.value, [total_uncertainty], parts)
+            builder.add_branch("short", self.s.assemble_str(short_parts, unit))
 
         # Unit
-        if result.unit != "":
-            builder.add_branch("unit", rf"\unit{{{result.unit}}}")
-            builder.add_branch("withoutUnit", self.result_to_latex_str_without_unit(result))
+        if unit != "":
+            builder.add_branch("unit", rf"\unit{{{unit}}}")
+            builder.add_branch("withoutUnit", self.s.assemble_str(parts, ""))
 
         # Error message
         keywords = builder.keywords
@@ -65,10 +77,14 @@ class LatexCommandifier:
             error_message = "This variable can only be used without keywords."
         builder.add_else(rf"\scriptsize{{\textbf{{{error_message}}}}}")
 
-        latex_str += builder.build()
-        latex_str += "\n}"
+        return builder.build_command(cmd_name)
 
-        return latex_str
+    def results_to_latex_cmds(self, results: List[Result]) -> List[str]:
+        """
+        Returns the LaTeX commands of multiple results, e.g. to render
+        a chunk of results in a worker process.
+        """
+        return [self.result_to_latex_cmd(result) for result in results]
 
     def result_to_latex_str(self, result: Result) -> str:
         """
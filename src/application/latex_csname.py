@@ -0,0 +1,38 @@
+class LatexCsnameBuilder:
+    """
+    Alternative to `LatexIfElseBuilder` that dispatches on the keyword in
+    constant time: every branch is stored in its own macro (named after the
+    command and the keyword), such that `\\resultName[keyword]` only has to look
+    up a single macro via `\\csname` instead of comparing the keyword against
+    every branch of an `\\ifthenelse` chain.
+    """
+
+    def __init__(self):
+        self.keywords: list[str] = []
+        self._branches: list[tuple[str, str]] = []
+        self._else_body: str = ""
+
+    def add_branch(self, keyword: str, body: str):
+        self._branches.append((keyword, body))
+        if keyword != "":
+            self.keywords.append(keyword)
+
+    def add_else(self, body: str):
+        self._else_body = body
+
+    def build_command(self, cmd_name: str) -> str:
+        lines = [
+            rf"\expandafter\def\csname {cmd_name}@{keyword}\endcsname{{{body}}}"
+            for keyword, body in self._branches
+        ]
+        # The \expandafter closes the conditional before the branch is executed
+        lines += [
+            rf"\newcommand*{{\{cmd_name}}}[1][]{{%",
+            rf"    \ifcsname {cmd_name}@#1\endcsname",
+            rf"        \csname {cmd_name}@#1\expandafter\endcsname",
+            r"    \else",
+            rf"        {self._else_body}%",
+            r"    \fi",
+            r"}",
+        ]
+        return "\n".join(lines)
@@ -1,33 +1,29 @@
 class LatexIfElseBuilder:
     def __init__(self):
-        self.latex: str = ""
+        self._lines: list[str] = []
         self._num_parentheses_to_close: int = 0
         self.keywords: list[str] = []
 
     def add_branch(self, keyword: str, body: str):
         # Condition
-        if self.latex == "":
-            self.latex += rf"    \ifthenelse{{\equal{{#1}}{{{keyword}}}}}{{"
+        if len(self._lines) == 0:
+            self._lines.append(rf"    \ifthenelse{{\equal{{#1}}{{{keyword}}}}}{{")
         else:
-            self.latex += "\n"
-            self.latex += rf"    }}{{\ifthenelse{{\equal{{#1}}{{{keyword}}}}}{{"
+            self._lines.append(rf"    }}{{\ifthenelse{{\equal{{#1}}{{{keyword}}}}}{{")
             self._num_parentheses_to_close += 1
 
         if keyword != "":
             self.keywords.append(keyword)
 
         # Body
-        self.latex += "\n"
-        self.latex += rf"        {body}"
+        self._lines.append(rf"        {body}")
 
     def add_else(self, body: str):
-        self.latex += "\n"
-        self.latex += r"    }{"
-        self.latex += rf"{body}"
+        self._lines.append(rf"    }}{{{body}")
         self._num_parentheses_to_close += 1
 
     def build(self) -> str:
-        for _ in range(self._num_parentheses_to_close):
-            self.latex += "}"
+        return "\n".join(self._lines) + "}" * self._num_parentheses_to_close
 
-        return self.latex
+    def build_command(self, cmd_name: str) -> str:
+        return "\n".join([rf"\newcommand*{{\{cmd_name}}}[1][]{{", self.build(), "}"])
@@ -0,0 +1,132 @@
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from typing import ContextManager, Dict, List, NamedTuple, Tuple
+
+
+class StageStats(NamedTuple):
+    name: str
+    count: int
+    total_s: float
+    mean_s: float
+    p50_s: float
+    p90_s: float
+    p99_s: float
+    max_s: float
+
+
+class Profiler:
+    """
+    Collects the durations of the stages (e.g. parsing, rounding, exporting)
+    that results pass through. Disabled by default; if disabled, `stage()`
+    returns a shared no-op context manager such that the overhead is negligible.
+
+    Every measured stage is kept as an event, such that percentiles can be
+    computed and the events can be dumped in the Chrome trace format
+    (viewable with `chrome://tracing` or https://ui.perfetto.dev).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        # (stage name, start in ns, duration in ns, thread id)
+        self._events: List[Tuple[str, int, int, int]] = []
+
+    def configure(self, enabled: bool):
+        """Enables or disables the profiler and discards all collected events."""
+        self.enabled = enabled
+        self.clear()
+
+    def clear(self):
+        self._events = []
+
+    def stage(self, name: str) -> ContextManager:
+        """
+        Returns a context manager that measures the duration of the
+        enclosed block as an event of the stage with the given name.
+        """
+        if not self.enabled:
+            return _NO_STAGE
+        return _Stage(self._events, name)
+
+    def stats(self) -> List[StageStats]:
+        """Returns statistics for every stage, in the order they were first seen."""
+        durations: Dict[str, List[int]] = {}
+        for name, _, duration, _ in self._events:
+            durations.setdefault(name, []).append(duration)
+
+        stats = []
+        for name, values in durations.items():
+            values.sort()
+            total = sum(values)
+            stats.append(
+                StageStats(
+                    name,
+                    len(values),
+                    total / 1e9,
+                    total / len(values) / 1e9,
+                    _percentile(values, 50) / 1e9,
+                    _percentile(values, 90) / 1e9,
+                    _percentile(values, 99) / 1e9,
+                    values[-1] / 1e9,
+                )
+            )
+        return stats
+
+    def report(self) -> str:
+        """Returns the statistics of all stages as a human-readable table."""
+        lines = [
+            f"{'stage':<16}{'count':>8}{'total [ms]':>12}{'mean [ms]':>12}"
+            f"{'p50 [ms]':>12}{'p90 [ms]':>12}{'p99 [ms]':>12}{'max [ms]':>12}"
+        ]
+        for s in self.stats():
+            lines.append(
+                f"{s.name:<16}{s.count:>8}{s.total_s * 1e3:>12.3f}{s.mean_s * 1e3:>12.3f}"
+                f"{s.p50_s * 1e3:>12.3f}{s.p90_s * 1e3:>12.3f}{s.p99_s * 1e3:>12.3f}"
+                f"{s.max_s * 1e3:>12.3f}"
+            )
+        return "\n".join(lines)
+
+    def dump_chrome_trace(self, filepath: str):
+        """Writes all events as JSON file in the Chrome trace event format."""
+        pid = os.getpid()
+        events = [
+            {
+                "name": name,
+                "cat": "resultwizard",
+                "ph": "X",  # complete event, i.e. with a duration
+                "ts": start / 1e3,  # in microseconds
+                "dur": duration / 1e3,
+                "pid": pid,
+                "tid": tid,
+            }
+            for name, start, duration, tid in self._events
+        ]
+        with open(filepath, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+
+class _Stage:
+    __slots__ = ("_events", "_name", "_start")
+
+    def __init__(self, events: List[Tuple[str, int, int, int]], name: str):
+        self._events = events
+        self._name = name
+        self._start = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter_ns() - self._start
+        self._events.append((self._name, self._start, duration, threading.get_ident()))
+
+
+_NO_STAGE = nullcontext()
+
+
+def _percentile(sorted_values: List[int], percent: int) -> int:
+    """Returns the percentile of the sorted values (nearest-rank method)."""
+    rank = -(-percent * len(sorted_values) // 100)  # ceil
+    return sorted_values[max(rank, 1) - 1]
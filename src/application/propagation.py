@@ -0,0 +1,87 @@
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from application import error_messages
+
+# Relative step size of the central differences. The cube root of the machine
+# epsilon balances the truncation error against the rounding error.
+_RELATIVE_STEP = float(np.finfo(float).eps) ** (1 / 3)  # pylint: disable=no-member
+
+
+# pylint: disable-next=too-many-locals
+def propagate_uncertainties(
+    func: Callable[..., Any],
+    values: Sequence[Any],
+    uncertainties: Sequence[List[Tuple[Any, str]]],
+    jacobian: Union[Callable[..., Sequence[Any]], None] = None,
+) -> Tuple[np.ndarray, List[Tuple[np.ndarray, str]]]:
+    """
+    Computes `func(*values)` and its uncertainties via first-order (linear) error
+    propagation, assuming the inputs are independent. For every kind (name) of
+    uncertainty, this is:
+
+        sigma_f = sqrt(sum_i (df/dx_i * sigma_i)^2)
+
+    `values` holds one array (or number) per argument of `func` and `uncertainties`
+    the (array, name) tuples of every argument. `func` has to work element-wise
+    on whole arrays, like NumPy expressions do. The partial derivatives are then
+    computed for all elements at once: either by `jacobian` (returning one array
+    per argument) or numerically with central differences.
+
+    Returns the derived values and their uncertainties (one array per name, in the
+    order of first appearance). All arrays have the broadcast shape of the inputs.
+    """
+    arrays = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in values])
+    derived = np.asarray(func(*arrays), dtype=float)
+    shape = np.broadcast_shapes(derived.shape, arrays[0].shape)
+
+    needed = [i for i, u in enumerate(uncertainties) if len(u) > 0]
+    if jacobian is not None:
+        derivatives = list(jacobian(*arrays))
+        if len(derivatives) != len(arrays):
+            raise ValueError(
+                error_messages.PROPAGATION_JACOBIAN_LENGTH.format(
+                    expected=len(arrays), actual=len(derivatives)
+                )
+            )
+    else:
+        derivatives = [None] * len(arrays)
+        for i in needed:
+            derivatives[i] = _central_difference(func, arrays, i)
+
+    squared_sums: Dict[str, np.ndarray] = {}
+    for i in needed:
+        derivative = np.asarray(derivatives[i], dtype=float)
+        for sigma, name in uncertainties[i]:
+            contribution = np.square(derivative * np.asarray(sigma, dtype=float))
+            squared_sums[name] = squared_sums.get(name, 0.0) + contribution
+
+    propagated = [(np.broadcast_to(np.sqrt(s), shape), n) for n, s in squared_sums.items()]
+
+    if not all(np.all(np.isfinite(a)) for a in [derived] + [sigma for sigma, _ in propagated]):
+        raise ValueError(error_messages.PROPAGATION_NOT_FINITE)
+
+    return np.broadcast_to(derived, shape), propagated
+
+
+def _central_difference(func: Callable[..., Any], arrays: List[np.ndarray], i: int) -> np.ndarray:
+    """Returns the partial derivative of `func` with respect to its i-th argument."""
+    x = arrays[i]
+    # The step has to scale with x, also for small x. Otherwise (e.g. with an
+    # absolute step for |x| < 1) it's larger than x itself for tiny inputs.
+    # Only where this gives no step at all (x = 0) fall back to an absolute one.
+    step = _RELATIVE_STEP * np.abs(x)
+    step = np.where(step > 0, step, _RELATIVE_STEP)
+    upper = x + step
+    lower = x - step
+
+    upper_args = list(arrays)
+    upper_args[i] = upper
+    lower_args = list(arrays)
+    lower_args[i] = lower
+
+    # Divide by the actual distance, which differs from 2 * step due to rounding
+    f_upper = np.asarray(func(*upper_args), dtype=float)
+    f_lower = np.asarray(func(*lower_args), dtype=float)
+    return (f_upper - f_lower) / (upper - lower)
@@ -0,0 +1,79 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple, Union
+
+
+class RenderCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class RenderCache:
+    """
+    A bounded least-recently-used (LRU) cache for rendered strings of results,
+    e.g. the console string or the LaTeX command of a result.
+
+    Keys must capture everything the rendered string depends on, i.e. the content
+    of the result (see `Result.content_key()`) and the rendering configuration.
+    Once the cache holds `maxsize` entries, the least recently used one is evicted.
+
+    The cache is thread-safe. Rendering (see `get_or_render()`) happens without
+    holding the lock, so two threads might render the same string at the same time.
+    """
+
+    def __init__(self, maxsize: int):
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def resize(self, maxsize: int):
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def get_or_render(self, key: Hashable, render: Callable[[], str]) -> str:
+        """
+        Returns the cached string for the given key. If there is none,
+        `render` is called and its return value is cached.
+        """
+        rendered = self.get(key)
+        if rendered is None:
+            rendered = render()
+            self.put(key, rendered)
+        return rendered
+
+    def get(self, key: Hashable) -> Union[str, None]:
+        """Returns the cached string for the given key or None on a cache miss."""
+        with self._lock:
+            rendered = self._entries.get(key)
+            if rendered is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return rendered
+
+    def put(self, key: Hashable, rendered: str):
+        with self._lock:
+            if self.maxsize > 0:
+                self._entries[key] = rendered
+                self._evict()
+
+    def info(self) -> RenderCacheInfo:
+        with self._lock:
+            return RenderCacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _evict(self):
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
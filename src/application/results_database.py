@@ -0,0 +1,162 @@
+import importlib.metadata
+import json
+import sqlite3
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Iterator, List, Tuple, Union
+
+from application import error_messages
+from domain.result import Result
+from domain.uncertainty import Uncertainty
+from domain.value import Value
+
+_SCHEMA_VERSION = 1
+
+# Increase whenever the rendered LaTeX commands change for the same result and
+# settings, such that commands stored by an older version are rendered again
+_RENDER_FORMAT_VERSION = 1
+
+
+class ResultsDatabase:
+    """
+    Persists results in an SQLite database such that they survive restarts
+    of the Python interpreter (e.g. of a Jupyter kernel).
+
+    Every result is stored in its rounded state, i.e. with the exact decimal
+    digits and the exponents determined by the `Rounder`. Loading a result
+    therefore doesn't require rounding it again. Results keep the position
+    of their first insertion, just like in a dict.
+
+    The rendered LaTeX command of a result is stored as well, together with
+    a key for the settings it was rendered with, such that an export after
+    a restart doesn't have to render the results again. The key also contains
+    the version of ResultWizard (and of the rendering format), so commands
+    rendered by another version are not reused.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # Results may be added from other threads than the one that opened the database
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, _SCHEMA_VERSION):
+            self._connection.close()
+            raise ValueError(
+                error_messages.RESULTS_DATABASE_VERSION.format(path=path, version=version)
+            )
+
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " name TEXT PRIMARY KEY,"
+            " result TEXT NOT NULL,"
+            " result_group TEXT,"
+            " render_key TEXT,"
+            " rendered TEXT)"
+        )
+        self._connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._render_key_prefix = f"{_RENDER_FORMAT_VERSION}/{_library_version()}/"
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Groups all writes inside the `with` block into one transaction,
+        which is much faster than committing every single write."""
+        self._connection.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    def save(self, name: str, result: Result, group: Union[str, None]):
+        self._connection.execute(
+            "INSERT INTO results (name, result, result_group) VALUES (?, ?, ?)"
+            " ON CONFLICT(name) DO UPDATE SET result = excluded.result,"
+            " result_group = excluded.result_group, render_key = NULL, rendered = NULL",
+            (name, json.dumps(_result_to_json(result)), group),
+        )
+
+    def save_rendered(self, rendered: List[Tuple[str, str]], render_key: str):
+        """Stores the rendered strings, given as (name, rendered string) pairs."""
+        with self.transaction():
+            self._connection.executemany(
+                "UPDATE results SET render_key = ?, rendered = ? WHERE name = ?",
+                [
+                    (self._render_key_prefix + render_key, result_str, name)
+                    for name, result_str in rendered
+                ],
+            )
+
+    def load(self) -> Iterator[Tuple[str, Result, Union[str, None], Union[Tuple[str, str], None]]]:
+        """
+        Yields the name, the result, the group and the rendered string along
+        with its render key (if any) of all stored results. Strings rendered
+        by another version of ResultWizard are left out.
+        """
+        rows = self._connection.execute(
+            "SELECT name, result, result_group, render_key, rendered FROM results ORDER BY rowid"
+        )
+        for name, result, group, render_key, rendered in rows:
+            stored_rendered = None
+            if rendered is not None and render_key.startswith(self._render_key_prefix):
+                stored_rendered = (render_key[len(self._render_key_prefix) :], rendered)
+            yield name, _result_from_json(json.loads(result)), group, stored_rendered
+
+    def clear(self):
+        self._connection.execute("DELETE FROM results")
+
+    def close(self):
+        self._connection.close()
+
+
+def _value_to_json(value: Value) -> list:
+    number, is_exact, min_exponent, max_exponent = value.content_key()
+    return [str(number), is_exact, min_exponent, max_exponent]
+
+
+def _value_from_json(data: list) -> Value:
+    number, is_exact, min_exponent, max_exponent = data
+    return Value.from_content_key((Decimal(number), is_exact, min_exponent, max_exponent))
+
+
+def _result_to_json(result: Result) -> dict:
+    data = {
+        "name": result.name,
+        "value": _value_to_json(result.value),
+        "unit": result.unit,
+        "uncertainties": [[_value_to_json(u.uncertainty), u.name] for u in result.uncertainties],
+        "sigfigs": result.sigfigs,
+        "decimal_places": result.decimal_places,
+    }
+    if result.total_uncertainty is not None:
+        data["total_uncertainty"] = _value_to_json(result.total_uncertainty.uncertainty)
+    return data
+
+
+def _result_from_json(data: dict) -> Result:
+    result = Result(
+        data["name"],
+        _value_from_json(data["value"]),
+        data["unit"],
+        [Uncertainty(_value_from_json(value), name) for value, name in data["uncertainties"]],
+        data["sigfigs"],
+        data["decimal_places"],
+    )
+
+    # The total uncertainty is calculated again, but not rounded
+    if result.total_uncertainty is not None:
+        _, _, min_exponent, max_exponent = data["total_uncertainty"]
+        result.total_uncertainty.uncertainty.restore_rounding(min_exponent, max_exponent)
+
+    return result
+
+
+def _library_version() -> str:
+    try:
+        return importlib.metadata.version("resultwizard")
+    except importlib.metadata.PackageNotFoundError:
+        # e.g. when running from the source tree without installing the package
+        return "unknown"
@@ -1,5 +1,4 @@
 from typing import List
-from decimal import Decimal
 
 from dataclasses import dataclass
 from domain.result import Result
@@ -9,7 +8,7 @@ from application.helpers import Helpers
 from application import error_messages
 
 
-@dataclass
+@dataclass(frozen=True)
 class RoundingConfig:
     sigfigs: int
     decimal_places: int
@@ -125,10 +124,10 @@ class Rounder:
                 if u.uncertainty.is_exact():
                     continue
 
-                shift = Decimal(f"1e{-Helpers.get_exponent(u.uncertainty.get())}")
-                normalized_value = abs(u.uncertainty.get()) * shift
+                shift = -Helpers.get_exponent(u.uncertainty.get())
+                normalized_value = Helpers.shift(u.uncertainty.get_abs(), shift)
 
-                if round(normalized_value, 1) >= 3.0:
+                if Helpers.round_decimal(normalized_value, 1) >= 3:
                     u.uncertainty.set_sigfigs(1)
                 else:
                     u.uncertainty.set_sigfigs(2)
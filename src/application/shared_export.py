@@ -0,0 +1,167 @@
+import json
+import os
+from typing import Dict, List, Set, Tuple
+
+from application.file_writer import write_file_if_changed
+
+if os.name == "nt":
+    import msvcrt  # pylint: disable=import-error
+else:
+    import fcntl
+
+
+class FileLock:
+    """
+    An exclusive lock across processes, based on a lock file next to the
+    locked file. Blocks until the lock is acquired. The lock is released
+    by the operating system if the process dies while holding it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """Acquires the lock. If not `blocking`, returns False right away
+        (instead of waiting) if another process holds the lock."""
+        # pylint: disable-next=consider-using-with
+        self._file = open(self.path, "a+b")
+        try:
+            if os.name == "nt":
+                self._file.seek(0)
+                mode = msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK
+                msvcrt.locking(self._file.fileno(), mode, 1)
+            else:
+                flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+                fcntl.flock(self._file.fileno(), flags)
+        except OSError:
+            self._file.close()
+            self._file = None
+            if blocking:
+                raise
+            return False
+        return True
+
+    def release(self):
+        assert self._file is not None
+        if os.name == "nt":
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+
+# The locks that mark this process as alive, by fragments directory and process id
+# (a forked child has to join the run on its own)
+_alive_locks: Dict[Tuple[str, int], FileLock] = {}
+
+
+class SharedExport:
+    """
+    Lets multiple processes export to the same file without overwriting
+    each other's results.
+
+    Every process writes its results (the rendered LaTeX commands by result name
+    and the names of the uncertainties) to its own fragment file in a hidden
+    directory next to the target file. Then, while holding a lock on the target,
+    it merges all fragments, such that the target contains the union of the
+    results of all processes. Processes only wait for each other while merging.
+
+    If multiple processes export a result with the same name, the one of the
+    most recently written fragment is used.
+
+    Processes that export while others are still running belong to the same
+    run. Every process holds a lock on its own `.alive` file as long as it is
+    running. When a process exports for the first time and no other process
+    is alive anymore, a new run starts and the fragments of the previous run
+    are removed, such that results of earlier runs don't linger.
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        directory, filename = os.path.split(os.path.abspath(filepath))
+        self.fragments_dir = os.path.join(directory, f".{filename}.parts")
+        self.lock_path = os.path.join(directory, f".{filename}.lock")
+
+    def write_fragment(self, content: str):
+        """Writes the fragment of this process, see `fragment_content()`."""
+        self._join_run()
+        write_file_if_changed(self._own_path(".json"), content)
+
+    def _join_run(self):
+        """Marks this process as alive. Removes the fragments of the previous run
+        if this process is the first one of a new run."""
+        key = (self.fragments_dir, os.getpid())
+        alive_lock = _alive_locks.get(key)
+        if alive_lock is not None and os.path.exists(alive_lock.path):
+            return
+
+        with FileLock(self.lock_path):
+            os.makedirs(self.fragments_dir, exist_ok=True)
+            if not self._any_process_alive():
+                for entry in os.scandir(self.fragments_dir):
+                    if entry.name.endswith((".json", ".alive")):
+                        os.remove(entry.path)
+
+            alive_lock = FileLock(self._own_path(".alive"))
+            alive_lock.acquire()
+            previous = _alive_locks.pop(key, None)
+            if previous is not None:
+                previous.release()
+            _alive_locks[key] = alive_lock
+
+    def _any_process_alive(self) -> bool:
+        for entry in os.scandir(self.fragments_dir):
+            if entry.name.endswith(".alive"):
+                lock = FileLock(entry.path)
+                if not lock.acquire(blocking=False):
+                    return True
+                lock.release()
+        return False
+
+    def _own_path(self, extension: str) -> str:
+        # Imported here since it is only needed for shared exports
+        import socket  # pylint: disable=import-outside-toplevel
+
+        return os.path.join(self.fragments_dir, f"{socket.gethostname()}-{os.getpid()}{extension}")
+
+    def merge_fragments(self) -> Tuple[Set[str], List[str]]:
+        """
+        Returns the union of the uncertainty names and the rendered commands
+        of all fragments. Commands are ordered by fragment (by filename) and
+        within a fragment in the order they were declared in.
+        """
+        fragments = []
+        for entry in os.scandir(self.fragments_dir):
+            if entry.name.endswith(".json"):
+                with open(entry.path, "r", encoding="utf-8") as file:
+                    fragments.append((entry.name, entry.stat().st_mtime_ns, json.load(file)))
+
+        uncertainty_names: Set[str] = set()
+        commands: Dict[str, str] = {}
+        for _, _, fragment in sorted(fragments, key=lambda f: f[0]):
+            uncertainty_names.update(fragment["uncertainty_names"])
+            commands.update((name, "") for name, _ in fragment["commands"])
+
+        # The most recently written fragment wins
+        for _, _, fragment in sorted(fragments, key=lambda f: (f[1], f[0])):
+            commands.update(fragment["commands"])
+
+        return uncertainty_names, list(commands.values())
+
+
+def fragment_content(uncertainty_names: Set[str], commands: List[Tuple[str, str]]) -> str:
+    """
+    Returns the content of a fragment file, given the uncertainty names and
+    the (result name, rendered command) pairs of all results of this process.
+    """
+    return json.dumps({"uncertainty_names": sorted(uncertainty_names), "commands": commands})
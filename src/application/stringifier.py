@@ -1,7 +1,6 @@
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, NamedTuple, Tuple, Union
 from typing import Protocol, ClassVar
-from decimal import Decimal
 
 # for why we use a Protocol instead of a ABC class, see
 # https://github.com/microsoft/pyright/issues/2601#issuecomment-977053380
@@ -11,13 +10,27 @@ from domain.uncertainty import Uncertainty
 from application.helpers import Helpers
 
 
-@dataclass
+@dataclass(frozen=True)
 class StringifierConfig:
     min_exponent_for_non_scientific_notation: int
     max_exponent_for_non_scientific_notation: int
     identifier: str
 
 
+class NumberParts(NamedTuple):
+    """
+    The rounded digits of a value and its uncertainties, i.e. everything of the
+    string that doesn't depend on the unit. The same parts are used for multiple
+    strings, e.g. with and without unit.
+    """
+
+    sign: str
+    value_rounded: str
+    uncertainties_rounded: List[str]
+    use_scientific_notation: bool
+    exponent: int
+
+
 class Stringifier(Protocol):
     """
     Provides methods to convert results to strings of customizable pattern.
@@ -57,15 +70,38 @@ class Stringifier(Protocol):
 
         This string does not yet contain "\newcommand*{}".
         """
+        return self.assemble_str(self.create_number_parts(value, uncertainties), unit)
+
+    def create_number_parts(
+        self,
+        value: Value,
+        uncertainties: List[Uncertainty],
+        value_parts: Union[NumberParts, None] = None,
+    ) -> NumberParts:
+        """
+        Rounds the value and the uncertainties to strings, see `assemble_str()`.
+
+        `value_parts` may be the parts of the same value (with other uncertainties).
+        If the value is printed in the same notation, its digits are taken from there
+        instead of rounding the value again.
+        """
         use_scientific_notation = self._should_use_scientific_notation(value, uncertainties)
-        should_use_parentheses = len(uncertainties) > 0 and (use_scientific_notation or unit != "")
 
-        sign = self._value_to_sign_str(value)
-        value_rounded, exponent, factor = self._value_to_str(value, use_scientific_notation)
+        if (
+            value_parts is not None
+            and value_parts.use_scientific_notation == use_scientific_notation
+        ):
+            sign = value_parts.sign
+            value_rounded = value_parts.value_rounded
+            exponent = value_parts.exponent
+            shift = -exponent if use_scientific_notation else 0
+        else:
+            sign = self._value_to_sign_str(value)
+            value_rounded, exponent, shift = self._value_to_str(value, use_scientific_notation)
 
         uncertainties_rounded = []
         for u in uncertainties:
-            u_rounded = self._uncertainty_to_str(u, use_scientific_notation, exponent, factor)
+            u_rounded = self._uncertainty_to_str(u, use_scientific_notation, exponent, shift)
             u_rounded = f" {self.plus_minus} {self.value_prefix}{u_rounded}{self.value_suffix}"
             if u.name != "":
                 u_rounded += self.uncertainty_name_prefix
@@ -73,14 +109,22 @@ class Stringifier(Protocol):
                 u_rounded += self.uncertainty_name_suffix
             uncertainties_rounded.append(u_rounded)
 
-        # Assemble everything together
+        return NumberParts(
+            sign, value_rounded, uncertainties_rounded, use_scientific_notation, exponent
+        )
+
+    def assemble_str(self, parts: NumberParts, unit: str) -> str:
+        """Returns the string of the rounded value and uncertainties with the given unit."""
+        should_use_parentheses = len(parts.uncertainties_rounded) > 0 and (
+            parts.use_scientific_notation or unit != ""
+        )
         return self._assemble_str_parts(
-            sign,
-            value_rounded,
-            uncertainties_rounded,
+            parts.sign,
+            parts.value_rounded,
+            parts.uncertainties_rounded,
             should_use_parentheses,
-            use_scientific_notation,
-            exponent,
+            parts.use_scientific_notation,
+            parts.exponent,
             unit,
         )
 
@@ -112,23 +156,21 @@ class Stringifier(Protocol):
     def _value_to_sign_str(self, value: Value) -> str:
         return self.negative_sign if value.get() < 0 else self.positive_sign
 
-    def _value_to_str(
-        self, value: Value, use_scientific_notation: bool
-    ) -> Tuple[str, int, Decimal]:
+    def _value_to_str(self, value: Value, use_scientific_notation: bool) -> Tuple[str, int, int]:
         exponent = value.get_exponent()
-        factor = Decimal(f"1e{-exponent}") if use_scientific_notation else Decimal("1.0")
+        shift = -exponent if use_scientific_notation else 0
 
-        value_normalized = value.get_abs() * factor
+        value_normalized = Helpers.shift(value.get_abs(), shift)
         decimal_places = (
             value.get_sig_figs() - 1 if use_scientific_notation else value.get_decimal_place()
         )
 
-        return Helpers.round_to_n_decimal_places(value_normalized, decimal_places), exponent, factor
+        return Helpers.round_to_n_decimal_places(value_normalized, decimal_places), exponent, shift
 
     def _uncertainty_to_str(
-        self, u: Uncertainty, use_scientific_notation: bool, exponent: int, factor: Decimal
+        self, u: Uncertainty, use_scientific_notation: bool, exponent: int, shift: int
     ) -> str:
-        uncertainty_normalized = u.uncertainty.get_abs() * factor
+        uncertainty_normalized = Helpers.shift(u.uncertainty.get_abs(), shift)
         decimal_places = (
             exponent - u.uncertainty.get_min_exponent()
             if use_scientific_notation
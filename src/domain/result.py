@@ -1,8 +1,8 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Union
 from copy import copy
-from decimal import Decimal
 
+from application.helpers import Helpers
 from domain.uncertainty import Uncertainty
 from domain.value import Value
 
@@ -12,8 +12,21 @@ class Result:
     """
     A general-purpose result, i.e. a value that was somehow measured or calculated,
     along with a unit and optional uncertainties (list might be empty).
+
+    Results are slotted (no per-instance `__dict__`) as there might be
+    hundreds of thousands of them in the cache.
     """
 
+    __slots__ = (
+        "name",
+        "value",
+        "unit",
+        "uncertainties",
+        "sigfigs",
+        "decimal_places",
+        "_total_uncertainty",
+    )
+
     name: str
     value: Value
     unit: str
@@ -21,19 +34,31 @@ class Result:
     sigfigs: Union[int, None]
     decimal_places: Union[int, None]
 
-    total_uncertainty: Union[Uncertainty, None] = field(init=False)
-
     def __post_init__(self):
+        self._total_uncertainty: Union[Uncertainty, None] = None
         if len(self.uncertainties) >= 2:
-            self.total_uncertainty = self._calculate_total_uncertainty()
-        else:
-            self.total_uncertainty = None
+            self._total_uncertainty = self._calculate_total_uncertainty()
+
+    @property
+    def total_uncertainty(self) -> Union[Uncertainty, None]:
+        return self._total_uncertainty
 
     def _calculate_total_uncertainty(self) -> Uncertainty:
-        total = Decimal("0")
-        for u in self.uncertainties:
-            total += u.uncertainty.get() ** 2
-        return Uncertainty(Value(total.sqrt()))
+        total = Helpers.sqrt_of_sum_of_squares([u.uncertainty.get() for u in self.uncertainties])
+        return Uncertainty(Value(total))
+
+    def content_key(self) -> tuple:
+        """Returns a hashable snapshot of everything that determines how this result is printed.
+
+        Two results with the same content key are rendered to the same strings.
+        """
+        return (
+            self.name,
+            self.value.content_key(),
+            self.unit,
+            tuple(u.content_key() for u in self.uncertainties),
+            self.total_uncertainty.content_key() if self.total_uncertainty else None,
+        )
 
     def get_short_result(self) -> Union["Result", None]:
         if self.total_uncertainty is None:
@@ -11,8 +11,26 @@ class Uncertainty:
     We don't use the word "error" to distinguish between errors in our code,
     and uncertainties in the physical sense. In reality, these words might be used
     interchangeably.
+
+    Uncertainties are immutable (apart from the rounding state of their value)
+    and slotted to keep the memory footprint of many results small.
     """
 
+    __slots__ = ("_uncertainty", "_name")
+
     def __init__(self, uncertainty: Value, name: str = ""):
-        self.uncertainty = uncertainty
-        self.name = name
+        self._uncertainty = uncertainty
+        self._name = name
+
+    @property
+    def uncertainty(self) -> Value:
+        return self._uncertainty
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def content_key(self) -> tuple:
+        """Returns a hashable snapshot of everything that determines how
+        this uncertainty is printed."""
+        return (self.uncertainty.content_key(), self.name)
@@ -19,6 +19,8 @@ class Value:
     and not "3.14".
     """
 
+    __slots__ = ("_value", "_is_exact", "_max_exponent", "_min_exponent")
+
     _value: Decimal
     _is_exact: bool
     _max_exponent: int
@@ -42,8 +44,7 @@ class Value:
 
             # Check if the value is too small to be rounded to the specified number of decimal
             # places:
-            rounded = Helpers.round_to_n_decimal_places(self._value, -min_exponent)
-            if Decimal(rounded) == 0 and self._value != 0:
+            if self._value != 0 and Helpers.rounds_to_zero(self._value, min_exponent):
                 raise DecimalPlacesError()
 
     def get_min_exponent(self) -> int:
@@ -59,7 +60,7 @@ class Value:
         return self._value
 
     def get_abs(self) -> Decimal:
-        return abs(self._value)
+        return self._value.copy_abs()
 
     def get_exponent(self) -> int:
         return self._max_exponent
@@ -67,6 +68,31 @@ class Value:
     def get_sig_figs(self) -> int:
         return self._max_exponent - self._min_exponent + 1
 
+    def content_key(self) -> tuple:
+        """Returns a hashable snapshot of everything that determines how this value is printed."""
+        return (
+            self._value,
+            self._is_exact,
+            getattr(self, "_min_exponent", None),
+            self._max_exponent,
+        )
+
+    @classmethod
+    def from_content_key(cls, key: tuple) -> "Value":
+        """Restores a value including its rounding state from its `content_key()`."""
+        value, is_exact, min_exponent, max_exponent = key
+        restored = cls.__new__(cls)
+        restored._value = value
+        restored._is_exact = is_exact
+        restored.restore_rounding(min_exponent, max_exponent)
+        return restored
+
+    def restore_rounding(self, min_exponent: Union[int, None], max_exponent: int):
+        """Restores a rounding state previously obtained via `content_key()`."""
+        if min_exponent is not None:
+            self._min_exponent = min_exponent
+        self._max_exponent = max_exponent
+
     def get_decimal_place(self) -> int:
         if self._min_exponent is None:
             # This should not happen as `_min_exponent` should be set
@@ -1,3 +1,48 @@
-from api.config import config_init, config
-from api.res import res
-from api.export import export
+import importlib
+
+# Type checkers treat this as True. It is not imported from typing since
+# importing typing alone takes longer than importing this package.
+TYPE_CHECKING = False
+
+# The public functions by the module they are defined in. The modules are only
+# imported once one of their functions is used for the first time (PEP 562),
+# such that `import resultwizard` itself is fast.
+_LAZY_ATTRIBUTES = {
+    "config_init": "api.config",
+    "config": "api.config",
+    "config_scope": "api.config",
+    "res": "api.res",
+    "res_array": "api.res",
+    "batch": "api.res",
+    "propagate": "api.propagation",
+    "export": "api.export",
+    "export_sharded": "api.export",
+    "flush": "api.export",
+    "render_cache_info": "api.rendering",
+    "profile_report": "api.profiling",
+    "profile_dump": "api.profiling",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # later accesses don't go through __getattr__ anymore
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from api.config import config_init, config, config_scope
+    from api.res import res, res_array, batch
+    from api.propagation import propagate
+    from api.export import export, export_sharded, flush
+    from api.rendering import render_cache_info
+    from api.profiling import profile_report, profile_dump
@@ -0,0 +1,48 @@
+import threading
+
+import pytest
+
+import resultwizard as wiz
+from application.background_writer import BackgroundWriter
+
+
+class TestBackgroundWriter:
+
+    def test_latest_snapshot_wins(self):
+        written = []
+        release = threading.Event()
+
+        def write(filepath: str, content: str):
+            release.wait()
+            written.append((filepath, content))
+
+        writer = BackgroundWriter(write)
+        writer.submit("a.tex", "first")  # picked up by the thread, blocks in `write`
+        for i in range(10):
+            writer.submit("a.tex", f"snapshot {i}")
+        release.set()
+        writer.flush()
+
+        assert written[-1] == ("a.tex", "snapshot 9")
+        assert len(written) <= 2
+
+    def test_flush_raises_background_error(self):
+        def write(filepath: str, content: str):
+            raise OSError(f"cannot write {filepath}")
+
+        writer = BackgroundWriter(write)
+        writer.submit("a.tex", "content")
+
+        with pytest.raises(OSError, match="cannot write a.tex"):
+            writer.flush()
+        writer.flush()  # the error is only raised once
+
+    def test_writes_file(self, tmp_path):
+        filepath = tmp_path / "results.tex"
+        wiz.config_init(export_auto_to=str(filepath), export_auto_async=True)
+        try:
+            wiz.res("async", 42.0)
+            wiz.flush()
+            assert r"\newcommand*{\resultAsync}" in filepath.read_text(encoding="utf-8")
+        finally:
+            wiz.config_init()
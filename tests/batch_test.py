@@ -0,0 +1,56 @@
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+import resultwizard as wiz
+import api.res
+
+
+@pytest.fixture
+def export_calls(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(api.res, "_export", lambda path, **kwargs: calls.append(path))
+    wiz.config_init(
+        print_auto=True,
+        export_auto_to=str(tmp_path / "results.tex"),
+        ignore_result_overwrite=True,
+    )
+    yield calls
+    wiz.config_init()
+
+
+class TestBatch:
+
+    def test_exports_once_on_exit(self, export_calls, capsys):
+        with wiz.batch():
+            for i in range(5):
+                wiz.res(f"batch {i}", 1.0 + i)
+            assert len(export_calls) == 0
+            assert capsys.readouterr().out == ""
+
+        assert len(export_calls) == 1
+        assert capsys.readouterr().out.count("\n") == 5
+
+    def test_exports_on_exception(self, export_calls):
+        with pytest.raises(RuntimeError):
+            with wiz.batch():
+                wiz.res("batch a", 1.0)
+                raise RuntimeError()
+
+        assert len(export_calls) == 1
+
+    def test_nested_batches_export_once(self, export_calls, capsys):
+        with wiz.batch(print_results=False):
+            with wiz.batch():
+                wiz.res("batch a", 1.0)
+            wiz.res_array("batch {i}", [1.0, 2.0])
+            assert len(export_calls) == 0
+
+        assert len(export_calls) == 1
+        assert capsys.readouterr().out == ""
+
+    def test_without_batch_exports_every_time(self, export_calls):
+        wiz.res("batch a", 1.0)
+        wiz.res("batch b", 2.0)
+
+        assert len(export_calls) == 2
@@ -0,0 +1,87 @@
+from decimal import Decimal
+
+from application.cache import ResultsCache
+from domain.result import Result
+from domain.uncertainty import Uncertainty
+from domain.value import Value
+
+
+def _result(name: str, value: str, uncertainty_name: str | None = None) -> Result:
+    uncertainties = []
+    if uncertainty_name is not None:
+        uncertainties = [Uncertainty(Value(Decimal("0.1")), uncertainty_name)]
+    return Result(name, Value(Decimal(value), 0), "", uncertainties, None, None)
+
+
+class TestResultsCacheRendering:
+
+    def test_only_dirty_results_are_rendered(self):
+        cache = ResultsCache()
+        cache.configure(False)
+        rendered_names = []
+
+        def render(result: Result) -> str:
+            rendered_names.append(result.name)
+            return f"{result.name}={result.value.get()}"
+
+        cache.add("a", _result("a", "1"))
+        cache.add("b", _result("b", "2"))
+        assert cache.get_all_rendered(render, "key") == ["a=1", "b=2"]
+
+        cache.add("c", _result("c", "3"))
+        cache.add("a", _result("a", "4"))
+        assert cache.get_all_rendered(render, "key") == ["a=4", "b=2", "c=3"]
+
+        assert rendered_names == ["a", "b", "a", "c"]
+
+    def test_changed_render_key_renders_everything_again(self):
+        cache = ResultsCache()
+        cache.add("a", _result("a", "1"))
+
+        assert cache.get_all_rendered(lambda r: "old", "key 1") == ["old"]
+        assert cache.get_all_rendered(lambda r: "new", "key 1") == ["old"]
+        assert cache.get_all_rendered(lambda r: "new", "key 2") == ["new"]
+
+    def test_clear_removes_rendered_strings(self):
+        cache = ResultsCache()
+        cache.add("a", _result("a", "1"))
+        assert cache.get_all_rendered(lambda r: "old", "key") == ["old"]
+
+        cache.clear()
+        assert len(cache) == 0
+
+        cache.add("a", _result("a", "1"))
+        assert cache.get_all_rendered(lambda r: "new", "key") == ["new"]
+
+    def test_snapshot_has_uncertainty_names_of_the_same_results(self):
+        cache = ResultsCache()
+        cache.add("a", _result("a", "1", "sys"))
+
+        uncertainty_names, rendered = cache.get_named_rendered_snapshot(lambda r: r.name, "key")
+        cache.add("b", _result("b", "2", "stat"))
+
+        assert uncertainty_names == {"sys"}
+        assert list(rendered) == [("a", "a")]
+
+
+class TestResultsCacheNameCollisions:
+
+    def test_collision_of_different_names_is_reported(self, capsys):
+        cache = ResultsCache()
+        cache.configure(False)
+
+        cache.add("aB", _result("aB", "1"), original_name="a_b")
+        cache.add("aB", _result("aB", "2"), original_name="aB")
+
+        assert "'a_b' will be overwritten" in capsys.readouterr().out
+        assert cache.get_original_name("aB") == "aB"
+
+    def test_redeclaring_the_same_name_is_no_collision(self, capsys):
+        cache = ResultsCache()
+        cache.configure(False)
+
+        cache.add("aB", _result("aB", "1"), original_name="a_b")
+        cache.add("aB", _result("aB", "2"), original_name="a_b")
+
+        assert capsys.readouterr().out == ""
+        assert cache.get_original_name("aB") == "a_b"
@@ -0,0 +1,104 @@
+from decimal import Decimal
+import pytest
+
+from api import parsers
+from application.columnar_store import ColumnarResultsStore
+from application.rounder import Rounder, RoundingConfig
+from domain.result import Result
+from domain.value import Value
+
+
+def _result(name: str, value, uncerts, unit: str = "", sigfigs=None) -> Result:
+    result = Result(
+        name,
+        parsers.parse_value(value),
+        unit,
+        parsers.parse_uncertainties(uncerts),
+        sigfigs,
+        None,
+    )
+    Rounder.round_result(result, RoundingConfig(-1, -1, 2, -1))
+    return result
+
+
+class TestColumnarResultsStore:
+
+    @pytest.mark.parametrize(
+        "value, uncerts",
+        [
+            (1.2345, []),
+            ("3.14000", []),
+            (-42, [0.5]),
+            (Decimal("1e-400"), [(Decimal("3e-401"), "sys")]),
+            (1.0e10, [(0.01e10, "sys"), (0.0294999e10, "stat")]),
+            ("103.1570e-30", ["0.5e-30", (0.2e-30, "stat")]),
+            ("12345678901234567890.123", []),
+        ],
+    )
+    def test_round_trip(self, value, uncerts):
+        result = _result("a", value, uncerts, unit=r"\m")
+        store = ColumnarResultsStore()
+        store["a"] = result
+
+        assert store["a"].content_key() == result.content_key()
+
+    def test_shadowing_keeps_order(self):
+        store = ColumnarResultsStore()
+        store["a"] = _result("a", 1.0, [0.1, 0.2])
+        store["b"] = _result("b", 2.0, [])
+        store["a"] = _result("a", 3.0, [(0.1, "sys")])
+
+        assert list(store.keys()) == ["a", "b"]
+        assert store["a"].content_key() == _result("a", 3.0, [(0.1, "sys")]).content_key()
+        assert store.get_uncertainty_names() == {"sys"}
+
+    def test_sigfigs_and_units_are_kept(self):
+        store = ColumnarResultsStore()
+        store["a"] = _result("a", 1.23456, [], unit=r"\kg", sigfigs=4)
+
+        assert store["a"].sigfigs == 4
+        assert store["a"].decimal_places is None
+        assert store["a"].unit == r"\kg"
+
+    def test_exponent_outside_int32(self):
+        result = Result("a", Value(Decimal("1e-3000000000"), -3000000000), "", [], None, None)
+        store = ColumnarResultsStore()
+        store["a"] = result
+
+        assert store["a"].value.get() == Decimal("1e-3000000000")
+        assert list(store.values())[0].content_key() == result.content_key()
+
+    def test_overwriting_reuses_memory(self):
+        # pylint: disable=protected-access
+        store = ColumnarResultsStore()
+        store["b"] = _result("b", 2.0, [0.1])
+        for i in range(1000):
+            uncerts = [0.1, 0.2, 0.3] if i % 2 == 0 else [(0.1, "sys")]
+            store["a"] = _result("a", float(i), uncerts)
+
+        assert len(store._rows) == 2
+        assert len(store._uncerts) <= 8
+        assert store["a"].content_key() == _result("a", 999.0, [(0.1, "sys")]).content_key()
+        assert store["b"].content_key() == _result("b", 2.0, [0.1]).content_key()
+
+    def test_deleted_rows_are_reused(self):
+        # pylint: disable=protected-access
+        store = ColumnarResultsStore()
+        for i in range(100):
+            store[f"a{i}"] = _result(f"a{i}", float(i), [0.1, 0.2])
+            if i > 0:
+                del store[f"a{i - 1}"]
+
+        assert list(store.keys()) == ["a99"]
+        assert len(store._rows) == 2
+        assert len(store._uncerts) <= 8
+        assert store["a99"].content_key() == _result("a99", 99.0, [0.1, 0.2]).content_key()
+
+    def test_clear(self):
+        store = ColumnarResultsStore()
+        store["a"] = _result("a", 1.0, [(0.1, "sys")])
+        store.clear()
+        store["b"] = _result("b", 2.0, [])
+
+        assert list(store.keys()) == ["b"]
+        assert store.get_uncertainty_names() == set()
@@ -0,0 +1,110 @@
+# pylint: disable=redefined-outer-name
+
+import asyncio
+import threading
+
+import pytest
+
+import resultwizard as wiz
+import api.config as c
+from api.latexer import get_latexer
+
+
+@pytest.fixture
+def fresh_config():
+    wiz.config_init(ignore_result_overwrite=True)
+    yield
+    wiz.config_init()
+
+
+def _latex(name: str) -> str:
+    return wiz.res(name, 1.23456).to_latex_str()
+
+
+@pytest.mark.usefixtures("fresh_config")
+class TestConfigScope:
+
+    def test_applies_only_inside_block(self):
+        with wiz.config_scope(sigfigs=4):
+            assert _latex("a") == r"\num{1.235}"
+        assert _latex("a") == r"\num{1.2}"
+
+    def test_nested_scopes(self):
+        with wiz.config_scope(sigfigs=4):
+            with wiz.config_scope(decimal_places=1):
+                assert _latex("a") == r"\num{1.2}"
+            assert _latex("a") == r"\num{1.235}"
+
+    def test_restores_on_exception(self):
+        with pytest.raises(RuntimeError):
+            with wiz.config_scope(sigfigs=4):
+                raise RuntimeError()
+        assert c.current_config() is c.configuration
+
+    def test_config_inside_scope_only_changes_scope(self):
+        with wiz.config_scope(sigfigs=4):
+            wiz.config(sigfigs=3)
+            assert _latex("a") == r"\num{1.23}"
+        assert _latex("a") == r"\num{1.2}"
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            with wiz.config_scope(sigfigs=0):
+                pass
+        with pytest.raises(ValueError):
+            wiz.config(sigfigs=0)
+        assert c.current_config().sigfigs == -1
+
+    def test_isolated_between_threads(self):
+        inside = threading.Event()
+        checked = threading.Event()
+        latex_in_thread = []
+
+        def other_thread():
+            inside.wait()
+            latex_in_thread.append(_latex("b"))
+            checked.set()
+
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        with wiz.config_scope(sigfigs=4):
+            inside.set()
+            checked.wait()
+        thread.join()
+
+        assert latex_in_thread == [r"\num{1.2}"]
+
+    def test_isolated_between_tasks(self):
+        async def declare(sigfigs: int) -> str:
+            with wiz.config_scope(sigfigs=sigfigs):
+                await asyncio.sleep(0)
+                return _latex(f"task {sigfigs}")
+
+        async def main():
+            return await asyncio.gather(declare(3), declare(5))
+
+        assert asyncio.run(main()) == [r"\num{1.23}", r"\num{1.2346}"]
+
+    def test_snapshots_are_hashable_and_reused(self):
+        with wiz.config_scope(sigfigs=4):
+            configuration = c.current_config()
+            assert configuration.to_rounding_config() is configuration.to_rounding_config()
+            assert hash(configuration) == hash(c.current_config())
+        assert configuration != c.current_config()
+
+
+@pytest.mark.usefixtures("fresh_config")
+class TestDerivedObjects:
+
+    def test_latexer_is_reused_until_config_changes(self):
+        latexer = get_latexer()
+        assert get_latexer() is latexer
+
+        wiz.config(sigfigs=3)
+        assert get_latexer() is not latexer
+
+    def test_scope_has_its_own_latexer(self):
+        latexer = get_latexer()
+        with wiz.config_scope(sigfigs=3):
+            assert get_latexer() is not latexer
+        assert get_latexer() is latexer
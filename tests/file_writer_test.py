@@ -0,0 +1,52 @@
+import os
+import stat
+
+import pytest
+
+from application.file_writer import write_file_if_changed
+
+
+class TestWriteFileIfChanged:
+
+    def test_writes_new_file(self, tmp_path):
+        filepath = tmp_path / "results.tex"
+
+        assert write_file_if_changed(str(filepath), "a\nb")
+        assert filepath.read_text(encoding="utf-8") == "a\nb"
+
+    def test_skips_unchanged_content(self, tmp_path):
+        filepath = tmp_path / "results.tex"
+        write_file_if_changed(str(filepath), "a\nb")
+        os.utime(filepath, (0, 0))
+
+        assert not write_file_if_changed(str(filepath), "a\nb")
+        assert os.path.getmtime(filepath) == 0
+
+    def test_replaces_changed_content_without_leftovers(self, tmp_path):
+        filepath = tmp_path / "results.tex"
+        write_file_if_changed(str(filepath), "old content")
+
+        assert write_file_if_changed(str(filepath), "new content")
+        assert filepath.read_text(encoding="utf-8") == "new content"
+        assert os.listdir(tmp_path) == ["results.tex"]
+
+    def test_keeps_permissions(self, tmp_path):
+        filepath = tmp_path / "results.tex"
+        write_file_if_changed(str(filepath), "old content")
+        os.chmod(filepath, 0o640)
+
+        assert write_file_if_changed(str(filepath), "new content")
+        assert stat.S_IMODE(os.stat(filepath).st_mode) == 0o640
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+    def test_keeps_symlink(self, tmp_path):
+        (tmp_path / "build").mkdir()
+        target = tmp_path / "build" / "results.tex"
+        target.write_text("old content", encoding="utf-8")
+        link = tmp_path / "results.tex"
+        os.symlink(target, link)
+
+        assert write_file_if_changed(str(link), "new content")
+        assert link.is_symlink()
+        assert target.read_text(encoding="utf-8") == "new content"
+        assert sorted(os.listdir(tmp_path / "build")) == ["results.tex"]
@@ -0,0 +1,95 @@
+import decimal
+from decimal import Decimal
+import pytest
+
+from application.helpers import Helpers
+
+
+class TestExponent:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("0", 0),
+            ("1", 0),
+            ("-1", 0),
+            ("9.99", 0),
+            ("10", 1),
+            ("0.001", -3),
+            ("0.00999", -3),
+            ("999.99999999999", 2),
+            # More nines than a float has digits: treated like the float 1000.0
+            ("999.9999999999999999", 3),
+            ("1e-400", -400),
+            ("-3.2e500", 500),
+            # Floats that stand for powers of ten are slightly below them
+            (1e-6, -6),
+            (1e-7, -7),
+            (-1e-9, -9),
+            (0.1, -1),
+            (1e22, 22),
+            (1e-300, -300),
+        ],
+    )
+    def test_get_exponent(self, value, expected):
+        assert Helpers.get_exponent(Decimal(value)) == expected
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [("0", 0), ("0.0042", 4), ("-7.5", 7), ("31e-400", 3), (1e-6, 1), (1e-7, 1)],
+    )
+    def test_get_first_digit(self, value, expected):
+        assert Helpers.get_first_digit(Decimal(value)) == expected
+
+
+class TestRounding:
+    @pytest.mark.parametrize(
+        "value, n, expected",
+        [
+            ("1.005", 2, "1.00"),
+            ("1.015", 2, "1.02"),
+            ("42", 0, "42"),
+            ("0.00000012", 7, "0.0000001"),
+        ],
+    )
+    def test_round_to_n_decimal_places(self, value, n, expected):
+        assert Helpers.round_to_n_decimal_places(Decimal(value), n) == expected
+
+    @pytest.mark.parametrize(
+        "value, min_exponent, expected",
+        [
+            ("0", -2, True),
+            ("0.004", -2, True),
+            ("0.005", -2, True),  # half to even
+            ("0.0051", -2, False),
+            ("-0.006", -2, False),
+            ("0.01", -2, False),
+            ("40", 2, True),
+            ("50", 2, True),
+            ("50.1", 2, False),
+            ("1e-400", -399, True),
+        ],
+    )
+    def test_rounds_to_zero(self, value, min_exponent, expected):
+        assert Helpers.rounds_to_zero(Decimal(value), min_exponent) == expected
+
+
+class TestDecimalContext:
+    def test_uses_private_context(self):
+        context = decimal.getcontext()
+        precision = context.prec
+        context.prec = 2
+        try:
+            # would need more than 2 digits in the user's context
+            assert Helpers.round_to_n_decimal_places(Decimal("12345.6789"), 3) == "12345.679"
+            assert Helpers.shift(Decimal("1.23456789"), 3) == Decimal("1234.56789")
+            assert Helpers.sqrt_of_sum_of_squares(
+                [Decimal("3e-400"), Decimal("4e-400")]
+            ) == Decimal("5e-400")
+            assert decimal.getcontext().prec == 2
+        finally:
+            context.prec = precision
+
+    def test_sqrt_of_sum_of_squares_is_precise_for_large_exponent_ranges(self):
+        # sqrt(1e120 + 1e60) = 1e60 + 0.5 - ...
+        total = Helpers.sqrt_of_sum_of_squares([Decimal("1e60"), Decimal("1e30")])
+        assert Helpers.round_to_n_decimal_places(total, 0) == "1" + "0" * 60
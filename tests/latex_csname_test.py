@@ -0,0 +1,48 @@
+from decimal import Decimal
+
+from application.latex_commandifier import LatexCommandifier
+from application.latex_stringifier import LatexStringifier
+from application.rounder import Rounder, RoundingConfig
+from application.stringifier import StringifierConfig
+from domain.result import Result
+from domain.uncertainty import Uncertainty
+from domain.value import Value
+
+
+def _result() -> Result:
+    uncertainties = [
+        Uncertainty(Value(Decimal("0.1")), "sys"),
+        Uncertainty(Value(Decimal("0.2")), "stat"),
+    ]
+    result = Result("a", Value(Decimal("1.2")), r"\m", uncertainties, None, None)
+    Rounder.round_result(result, RoundingConfig(-1, -1, 2, -1))
+    return result
+
+
+def _latexer(keyword_dispatch: str) -> LatexCommandifier:
+    return LatexCommandifier(LatexStringifier(StringifierConfig(-2, 3, "result")), keyword_dispatch)
+
+
+class TestLatexCsnameDispatch:
+
+    def test_one_macro_per_keyword(self):
+        cmd = _latexer("csname").result_to_latex_cmd(_result())
+
+        assert r"\expandafter\def\csname resultA@\endcsname{" in cmd
+        for keyword in ["value", "withoutUncert", "uncertSys", "uncertTotal", "short", "unit"]:
+            assert rf"\csname resultA@{keyword}\endcsname" in cmd
+        assert r"\newcommand*{\resultA}[1][]{%" in cmd
+        assert r"\ifcsname resultA@#1\endcsname" in cmd
+        assert r"\ifthenelse" not in cmd
+
+    def test_same_branches_and_error_message_as_ifthenelse(self):
+        csname_cmd = _latexer("csname").result_to_latex_cmd(_result())
+        ifthenelse_cmd = _latexer("ifthenelse").result_to_latex_cmd(_result())
+
+        error_message = ifthenelse_cmd.split("}{", maxsplit=-1)[-1].rstrip("}\n")
+        assert r"\scriptsize{\textbf{Use one of these keywords" in error_message
+        assert error_message in csname_cmd
+
+        for line in ifthenelse_cmd.splitlines():
+            if line.startswith("        "):
+                assert "{" + line.strip() + "}" in csname_cmd
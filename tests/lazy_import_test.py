@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+import pytest
+
+import resultwizard as wiz
+
+
+def _run(code: str) -> str:
+    """Runs the code in a fresh interpreter and returns what it printed."""
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return completed.stdout.strip()
+
+
+class TestLazyImport:
+
+    def test_import_does_not_load_submodules(self):
+        code = "import sys, resultwizard; print('api.config' in sys.modules)"
+        assert _run(code) == "False"
+
+    def test_config_is_created_on_first_use(self):
+        code = (
+            "import resultwizard as wiz, api.config as c;"
+            "print(c.configuration is None);"
+            "wiz.res('a', 1.0);"
+            "print(c.configuration is None)"
+        )
+        assert _run(code).splitlines() == ["True", "False"]
+
+    @pytest.mark.parametrize("module", ["api.res", "api.export", "api.rendering", "api.latexer"])
+    def test_submodules_can_be_imported_first(self, module: str):
+        assert _run(f"import {module}; print('ok')") == "ok"
+
+    def test_public_attributes(self):
+        assert "res" in dir(wiz)
+        assert wiz.res is wiz.res
+        with pytest.raises(AttributeError):
+            wiz.no_such_function  # pylint: disable=pointless-statement
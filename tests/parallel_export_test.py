@@ -0,0 +1,91 @@
+# pylint: disable=redefined-outer-name,protected-access
+
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+import pytest
+
+import resultwizard as wiz
+import api.rendering
+
+NUM_RESULTS = 600
+
+
+@pytest.fixture
+def add_results():
+    wiz.config_init(print_auto=False, ignore_result_overwrite=True)
+
+    def add():
+        # Shadowing the results marks them as dirty such that they are rendered again
+        api.rendering._render_cache.clear()
+        for i in range(NUM_RESULTS):
+            wiz.res(f"parallel {i}", 1.0 + i / 7, 0.01 + i / 1000, r"\m", sigfigs=3)
+
+    yield add
+    wiz.config_init()
+
+
+class _SynchronousExecutor(Executor):
+    """Runs the submitted functions right away and counts them."""
+
+    def __init__(self):
+        self.num_submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.num_submitted += 1
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def _read(path) -> str:
+    with open(path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
+class TestParallelExport:
+
+    def test_same_output_with_executor(self, add_results, tmp_path):
+        (tmp_path / "serial").mkdir()
+        (tmp_path / "parallel").mkdir()
+        add_results()
+        wiz.export(str(tmp_path / "serial" / "results.tex"))
+
+        add_results()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            wiz.export(str(tmp_path / "parallel" / "results.tex"), executor=executor)
+
+        assert _read(tmp_path / "serial" / "results.tex") == _read(
+            tmp_path / "parallel" / "results.tex"
+        )
+
+    def test_same_output_with_workers(self, add_results, tmp_path):
+        (tmp_path / "serial").mkdir()
+        (tmp_path / "parallel").mkdir()
+        add_results()
+        wiz.export(str(tmp_path / "serial" / "results.tex"))
+
+        add_results()
+        wiz.export(str(tmp_path / "parallel" / "results.tex"), workers=2)
+
+        assert _read(tmp_path / "serial" / "results.tex") == _read(
+            tmp_path / "parallel" / "results.tex"
+        )
+
+    def test_invalid_workers(self, tmp_path):
+        with pytest.raises(ValueError):
+            wiz.export(str(tmp_path / "results.tex"), workers=0)
+
+    def test_executor_without_known_number_of_workers(self, add_results, tmp_path):
+        (tmp_path / "serial").mkdir()
+        (tmp_path / "parallel").mkdir()
+        add_results()
+        wiz.export(str(tmp_path / "serial" / "results.tex"))
+
+        add_results()
+        executor = _SynchronousExecutor()
+        wiz.export(str(tmp_path / "parallel" / "results.tex"), executor=executor)
+
+        assert executor.num_submitted == -(-NUM_RESULTS // api.rendering._MIN_CHUNK_SIZE)
+        assert _read(tmp_path / "serial" / "results.tex") == _read(
+            tmp_path / "parallel" / "results.tex"
+        )
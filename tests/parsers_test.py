@@ -57,6 +57,28 @@ class TestNameParser:
         with pytest.raises(ValueError):
             parsers.parse_name(name)
 
+    def test_long_name(self):
+        assert parsers.parse_name("a_b1" * 10_000) == "aB" + "OneAB" * 9_999 + "One"
+
+    def test_memoized_name_still_warns_about_ignored_chars(self, capsys):
+        for _ in range(2):
+            assert parsers.parse_name("a$b") == "ab"
+            assert "$" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        "index, expected",
+        [
+            (0, "aZero"),
+            (999, "aNineHundredNinetyNine"),
+            (1000, "aOneThousand"),
+            (1021, "aOneThousandTwentyOne"),
+            (1_020_001, "aOneMillionTwentyThousandOne"),
+            (1_000_004, "aOneMillionFour"),
+        ],
+    )
+    def test_format_index(self, index: int, expected: str):
+        assert parsers.parse_name(f"a {parsers.format_index(index)}") == expected
+
 
 class TestValueParser:
 
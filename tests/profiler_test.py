@@ -0,0 +1,64 @@
+import io
+import json
+
+import resultwizard as wiz
+from application.profiler import Profiler
+
+
+class TestProfiler:
+
+    def test_disabled_profiler_collects_nothing(self):
+        profiler = Profiler()
+        with profiler.stage("parse"):
+            pass
+        assert not profiler.stats()
+
+    def test_stats(self):
+        profiler = Profiler()
+        profiler.configure(True)
+        for _ in range(10):
+            with profiler.stage("parse"):
+                pass
+        with profiler.stage("round"):
+            pass
+
+        stats = profiler.stats()
+        assert [(s.name, s.count) for s in stats] == [("parse", 10), ("round", 1)]
+        parse = stats[0]
+        assert 0 <= parse.p50_s <= parse.p90_s <= parse.p99_s <= parse.max_s <= parse.total_s
+
+    def test_configure_discards_events(self):
+        profiler = Profiler()
+        profiler.configure(True)
+        with profiler.stage("parse"):
+            pass
+        profiler.configure(True)
+        assert not profiler.stats()
+
+    def test_chrome_trace(self, tmp_path):
+        profiler = Profiler()
+        profiler.configure(True)
+        with profiler.stage("export"):
+            pass
+
+        path = tmp_path / "trace.json"
+        profiler.dump_chrome_trace(str(path))
+        with open(path, "r", encoding="utf-8") as file:
+            events = json.load(file)["traceEvents"]
+        assert len(events) == 1
+        assert events[0]["name"] == "export"
+        assert events[0]["ph"] == "X"
+
+
+class TestProfiledPipeline:
+
+    def test_stages(self):
+        wiz.config_init(print_auto=True, profile=True)
+        try:
+            wiz.res("profiled", 1.234, 0.1)
+            wiz.export(io.StringIO())
+
+            stages = {s.name for s in wiz.profile_report()}
+            assert {"parse", "round", "print", "stringify", "export"} <= stages
+        finally:
+            wiz.config_init()
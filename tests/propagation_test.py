@@ -0,0 +1,115 @@
+# pylint: disable=protected-access
+
+import pytest
+
+import resultwizard as wiz
+from api.res import _res_cache
+
+np = pytest.importorskip("numpy")
+
+# pylint: disable-next=wrong-import-position
+from application.propagation import propagate_uncertainties
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    _res_cache.clear()
+    yield
+    _res_cache.clear()
+
+
+def _uncertainties(name: str) -> dict:
+    return {u.name: float(u.uncertainty.get()) for u in _res_cache.cache[name].uncertainties}
+
+
+class TestPropagateUncertainties:
+
+    def test_uncertainties_with_the_same_name_are_combined(self):
+        a = np.array([2.0, 3.0])
+        derived, propagated = propagate_uncertainties(
+            lambda a, b: a * b, [a, 4.0], [[(0.1, "sys"), (0.2 * a, "stat")], [(0.5, "sys")]]
+        )
+
+        np.testing.assert_allclose(derived, [8.0, 12.0])
+        assert [u_name for _, u_name in propagated] == ["sys", "stat"]
+        np.testing.assert_allclose(propagated[0][0], np.hypot(4.0 * 0.1, a * 0.5))
+        np.testing.assert_allclose(propagated[1][0], 4.0 * 0.2 * a)
+
+    def test_numerical_derivatives_match_jacobian(self):
+        x = np.linspace(0.1, 3.0, 50)
+        uncertainties = [[(0.01, "")]]
+        _, numerical = propagate_uncertainties(np.sin, [x], uncertainties)
+        _, exact = propagate_uncertainties(np.sin, [x], uncertainties, lambda x: [np.cos(x)])
+
+        np.testing.assert_allclose(numerical[0][0], exact[0][0], rtol=1e-8)
+
+    def test_numerical_derivatives_for_small_inputs(self):
+        values = [np.array([1.0, 2.0, 0.0]), np.array([1e-9, 3e-12, 1e-10])]
+        uncertainties = [[(0.01, "")], [(1e-11, "")]]
+        _, numerical = propagate_uncertainties(lambda u, i: u / i, values, uncertainties)
+        _, exact = propagate_uncertainties(
+            lambda u, i: u / i, values, uncertainties, lambda u, i: [1 / i, -u / i**2]
+        )
+
+        np.testing.assert_allclose(numerical[0][0], exact[0][0], rtol=1e-8)
+
+    def test_numerical_derivatives_at_zero(self):
+        _, propagated = propagate_uncertainties(lambda x: x**2 + 3 * x, [0.0], [[(0.1, "")]])
+
+        np.testing.assert_allclose(propagated[0][0], 0.3, rtol=1e-8)
+
+    @pytest.mark.filterwarnings("ignore:invalid value:RuntimeWarning")
+    def test_not_finite(self):
+        with pytest.raises(ValueError, match="not finite"):
+            propagate_uncertainties(np.log, [[1.0, -1.0]], [[(0.1, "")]])
+
+    def test_jacobian_length(self):
+        with pytest.raises(ValueError, match="one partial derivative"):
+            propagate_uncertainties(lambda a, b: a * b, [1.0, 2.0], [[], []], lambda a, b: [b])
+
+
+class TestPropagate:
+
+    def test_declares_rounded_results(self):
+        voltages = np.array([1.0, 2.0])
+        currents = np.array([0.1, 0.2])
+        results = wiz.propagate(
+            "resistance {i}",
+            lambda u, i: u / i,
+            [voltages, currents],
+            [(0.01, "sys"), [(0.001, "sys"), (0.002, "stat")]],
+            unit=r"\ohm",
+        )
+
+        assert len(results) == 2
+        assert list(_res_cache.cache.keys()) == ["resistanceZero", "resistanceOne"]
+        assert _uncertainties("resistanceZero") == pytest.approx(
+            {"sys": np.hypot(0.01 / 0.1, 1.0 / 0.1**2 * 0.001), "stat": 1.0 / 0.1**2 * 0.002}
+        )
+        assert (
+            results[0].to_latex_str() == r"\qty{10.00 \pm 0.14\UncertSys \pm 0.20\UncertStat}{\ohm}"
+        )
+
+    def test_results_as_inputs(self):
+        a = wiz.res("a", 2.0, [(0.1, "sys"), (0.2, "stat")])
+        b = wiz.res_array("b {i}", [3.0, 4.0], [(np.array([0.3, 0.4]), "sys")])
+        wiz.propagate("c {i}", lambda a, b: a * b, [a, b])
+
+        assert _uncertainties("cZero") == pytest.approx(
+            {"sys": np.hypot(3.0 * 0.1, 2.0 * 0.3), "stat": 3.0 * 0.2}
+        )
+
+    def test_vanishing_uncertainty_is_left_out(self):
+        wiz.propagate("square {i}", np.square, [[0.0, 1.0]], [0.1])
+
+        assert _res_cache.cache["squareZero"].uncertainties == []
+        assert _uncertainties("squareOne") == pytest.approx({"": 0.2})
+
+    def test_uncerts_length_mismatch(self):
+        with pytest.raises(ValueError, match="one entry per element"):
+            wiz.propagate("x", lambda a, b: a * b, [1.0, 2.0], [0.1])
+
+    def test_uncerts_of_result_input(self):
+        a = wiz.res("a", 2.0, 0.1)
+        with pytest.raises(ValueError, match="must be None"):
+            wiz.propagate("x", np.square, [a], [0.1])
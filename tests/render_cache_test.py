@@ -0,0 +1,31 @@
+from application.render_cache import RenderCache
+
+
+class TestRenderCache:
+
+    def test_hits_and_misses(self):
+        cache = RenderCache(maxsize=10)
+
+        assert cache.get_or_render("a", lambda: "A") == "A"
+        assert cache.get_or_render("a", lambda: "other") == "A"
+        assert cache.get_or_render("b", lambda: "B") == "B"
+
+        info = cache.info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = RenderCache(maxsize=2)
+        cache.get_or_render("a", lambda: "A")
+        cache.get_or_render("b", lambda: "B")
+        cache.get_or_render("a", lambda: "A")  # "b" is now least recently used
+        cache.get_or_render("c", lambda: "C")
+
+        assert cache.get_or_render("a", lambda: "new") == "A"
+        assert cache.get_or_render("b", lambda: "new") == "new"
+
+    def test_size_zero_disables_caching(self):
+        cache = RenderCache(maxsize=0)
+        cache.get_or_render("a", lambda: "A")
+
+        assert cache.get_or_render("a", lambda: "new") == "new"
+        assert cache.info().currsize == 0
@@ -0,0 +1,79 @@
+# pylint: disable=protected-access
+
+from array import array
+import pytest
+
+import resultwizard as wiz
+from api.res import _res_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    _res_cache.clear()
+    yield
+    _res_cache.clear()
+
+
+class TestResArray:
+
+    def test_name_template_and_values(self):
+        results = wiz.res_array("channel {i}", [1.234, 5.678, 9.1011], [0.1, 0.2, 0.3])
+
+        assert len(results) == 3
+        assert list(_res_cache.cache.keys()) == ["channelZero", "channelOne", "channelTwo"]
+
+    def test_same_as_res(self):
+        printable = wiz.res_array(
+            ["a", "b"], array("d", [1.234, 42.0]), [(array("d", [0.1, 0.5]), "sys")]
+        )
+        expected = wiz.res("a", 1.234, (0.1, "sys"))
+
+        assert printable[0].to_latex_str() == expected.to_latex_str()
+
+    def test_buffer_protocol(self):
+        wiz.res_array("x{}", memoryview(array("d", [1.0, 2.0])), sys=[0.1, 0.1], stat=[0.2, 0.2])
+
+        results = _res_cache.get_all_results()
+        assert [u.name for u in results[1].uncertainties] == ["sys", "stat"]
+
+    def test_per_element_sigfigs(self):
+        wiz.res_array("x{}", [1.23456, 1.23456], sigfigs=[2, 4])
+
+        results = _res_cache.get_all_results()
+        assert results[0].value.get_sig_figs() == 2
+        assert results[1].value.get_sig_figs() == 4
+
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError, match="same length"):
+            wiz.res_array("x{}", [1.0, 2.0], [0.1])
+
+    def test_invalid_array_names_the_field(self):
+        with pytest.raises(TypeError, match="`sys` must be a list"):
+            wiz.res_array("x{}", [1.0, 2.0], sys="0.1")
+        with pytest.raises(TypeError, match="Each uncertainty array must be a list"):
+            wiz.res_array("x{}", [1.0, 2.0], [(0.1, 0.2), ("0.1", "sys")])
+
+    def test_format_spec_beyond_999_is_rejected_up_front(self):
+        wiz.res_array("x {i:03d}", [1.0] * 1000)
+        assert len(_res_cache) == 1000
+
+        with pytest.raises(ValueError, match="Format specs"):
+            wiz.res_array("y {i:03d}", [1.0] * 1001)
+        assert len(_res_cache) == 1000
+
+    def test_name_template_beyond_999(self):
+        wiz.res_array("x{}", [1.0] * 1022)
+
+        names = list(_res_cache.cache.keys())
+        assert len(set(names)) == 1022
+        assert names[999] == "xNineHundredNinetyNine"
+        assert names[1000] == "xOneThousand"
+        assert names[1021] == "xOneThousandTwentyOne"
+
+    def test_integral_sigfigs(self):
+        np = pytest.importorskip("numpy")
+        wiz.res_array("x{}", [1.23456, 1.23456], sigfigs=np.int64(3))
+        wiz.res_array("y{}", [1.23456, 1.23456], decimal_places=[np.int32(1), np.int64(2)])
+
+        results = _res_cache.get_all_results()
+        assert [r.value.get_sig_figs() for r in results] == [3, 3, 2, 3]
@@ -0,0 +1,115 @@
+from decimal import Decimal
+
+from application import results_database
+from application.cache import ResultsCache
+from application.results_database import ResultsDatabase
+from application.rounder import Rounder, RoundingConfig
+from domain.result import Result
+from domain.uncertainty import Uncertainty
+from domain.value import Value
+
+
+def _result(name: str, value: str, *uncertainties: str) -> Result:
+    result = Result(
+        name,
+        Value(Decimal(value)),
+        r"\m",
+        [Uncertainty(Value(Decimal(u)), f"u{i}") for i, u in enumerate(uncertainties)],
+        None,
+        None,
+    )
+    Rounder.round_result(result, RoundingConfig(-1, -1, 2, -1))
+    return result
+
+
+def _persistent_cache(path) -> ResultsCache:
+    cache = ResultsCache()
+    cache.configure(True, persist_to=str(path))
+    return cache
+
+
+class TestResultsDatabase:
+
+    def test_round_trip(self, tmp_path):
+        results = [
+            _result("a", "1.23456"),
+            _result("b", "-0.000123", "0.0000045"),
+            _result("c", "99.96", "0.04", "0.0996"),
+            Result("d", Value(Decimal("3.14"), -2), "", [], None, None),
+        ]
+        database = ResultsDatabase(str(tmp_path / "results.db"))
+        for result in results:
+            database.save(result.name, result, None)
+        database.close()
+
+        loaded = list(ResultsDatabase(str(tmp_path / "results.db")).load())
+        assert [r.content_key() for _, r, _, _ in loaded] == [r.content_key() for r in results]
+
+    def test_shadowing_keeps_position(self, tmp_path):
+        database = ResultsDatabase(str(tmp_path / "results.db"))
+        database.save("a", _result("a", "1"), None)
+        database.save("b", _result("b", "2"), None)
+        database.save("a", _result("a", "3"), "group")
+
+        loaded = [(name, r.value.get(), group) for name, r, group, _ in database.load()]
+        assert loaded == [("a", Decimal("3"), "group"), ("b", Decimal("2"), None)]
+
+
+class TestPersistentResultsCache:
+
+    def test_results_survive_restart(self, tmp_path, capsys):
+        cache = _persistent_cache(tmp_path / "results.db")
+        cache.add("a", _result("a", "1.5", "0.1", "0.2"), "chapter")
+        cache.add("b", _result("b", "2.5"))
+
+        restarted = _persistent_cache(tmp_path / "results.db")
+        assert [r.content_key() for r in restarted.get_all_results()] == [
+            r.content_key() for r in cache.get_all_results()
+        ]
+        assert restarted.get_group("a") == "chapter"
+
+        # Declaring the loaded results again doesn't warn
+        restarted.add("a", _result("a", "1.6"))
+        assert capsys.readouterr().out == ""
+        restarted.add("a", _result("a", "1.7"))
+        assert "already exists" in capsys.readouterr().out
+
+    def test_results_are_loaded_lazily(self, tmp_path):
+        _persistent_cache(tmp_path / "results.db").add("a", _result("a", "1"))
+
+        restarted = _persistent_cache(tmp_path / "results.db")
+        assert len(restarted.cache) == 0
+        assert len(restarted) == 1
+
+    def test_rendered_strings_survive_restart(self, tmp_path):
+        cache = _persistent_cache(tmp_path / "results.db")
+        cache.add("a", _result("a", "1"))
+        cache.add("b", _result("b", "2"))
+        assert cache.get_all_rendered(lambda r: f"old {r.name}", "key") == ["old a", "old b"]
+
+        restarted = _persistent_cache(tmp_path / "results.db")
+        restarted.add("b", _result("b", "3"))
+        assert restarted.get_all_rendered(lambda r: f"new {r.name}", "key") == ["old a", "new b"]
+
+        restarted = _persistent_cache(tmp_path / "results.db")
+        assert restarted.get_all_rendered(lambda r: "other", "other key") == ["other", "other"]
+
+    def test_rendered_strings_of_other_versions_are_not_reused(self, tmp_path, monkeypatch):
+        cache = _persistent_cache(tmp_path / "results.db")
+        cache.add("a", _result("a", "1"))
+        assert cache.get_all_rendered(lambda r: "old", "key") == ["old"]
+
+        monkeypatch.setattr(results_database, "_library_version", lambda: "99.0.0")
+        restarted = _persistent_cache(tmp_path / "results.db")
+        assert restarted.get_all_rendered(lambda r: "new", "key") == ["new"]
+
+        monkeypatch.setattr(results_database, "_RENDER_FORMAT_VERSION", 99)
+        restarted = _persistent_cache(tmp_path / "results.db")
+        assert restarted.get_all_rendered(lambda r: "newer", "key") == ["newer"]
+
+    def test_clear_removes_persisted_results(self, tmp_path):
+        cache = _persistent_cache(tmp_path / "results.db")
+        cache.add("a", _result("a", "1"))
+        cache.clear()
+
+        assert len(_persistent_cache(tmp_path / "results.db")) == 0
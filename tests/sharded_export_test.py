@@ -0,0 +1,87 @@
+import pytest
+
+import resultwizard as wiz
+import api.res
+
+
+@pytest.fixture
+def results():
+    wiz.config_init(ignore_result_overwrite=True)
+    api.res._res_cache.clear()  # pylint: disable=protected-access
+    wiz.res("mechanics speed", 1.2, 0.1, r"\m")
+    wiz.res("mechanics speed fast", 3.4, [(0.1, "sys")], r"\m")
+    wiz.res("optics lens", 5.6)
+    wiz.res("other", 7.8)
+    wiz.res("mechanics appendix", 9.1, group="appendix")
+    yield
+    wiz.config_init()
+
+
+def _read(path) -> str:
+    with open(path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
+@pytest.mark.usefixtures("results")
+class TestShardedExport:
+
+    def test_groups(self, tmp_path):
+        wiz.export_sharded(str(tmp_path), prefixes=["mechanics", "optics"])
+
+        files = sorted(p.name for p in tmp_path.iterdir())
+        assert files == ["appendix.tex", "index.tex", "mechanics.tex", "optics.tex", "results.tex"]
+
+        mechanics = _read(tmp_path / "mechanics.tex")
+        assert r"\resultMechanicsSpeed}" in mechanics
+        assert r"\resultMechanicsSpeedFast}" in mechanics
+        assert r"\resultMechanicsAppendix}" not in mechanics
+        assert r"\resultMechanicsAppendix}" in _read(tmp_path / "appendix.tex")
+        assert r"\resultOther}" in _read(tmp_path / "results.tex")
+
+        index = _read(tmp_path / "index.tex")
+        assert r"\usepackage{siunitx}" in index
+        assert r"\sisetup{input-digits=0123456789\UncertSys}" in index
+        assert r"\newcommand" not in index
+
+    def test_only_changed_shards_are_written(self, tmp_path):
+        wiz.export_sharded(str(tmp_path), prefixes=["mechanics", "optics"])
+        mtimes = {p.name: p.stat().st_mtime_ns for p in tmp_path.iterdir()}
+
+        wiz.res("optics lens", 6.5)
+        wiz.export_sharded(str(tmp_path), prefixes=["mechanics", "optics"])
+
+        changed = sorted(
+            p.name for p in tmp_path.iterdir() if p.stat().st_mtime_ns != mtimes[p.name]
+        )
+        assert changed == ["optics.tex"]
+
+    def test_files_of_removed_groups_are_deleted(self, tmp_path):
+        wiz.export_sharded(str(tmp_path), prefixes=["mechanics", "optics"])
+        (tmp_path / "notes.tex").write_text("not written by ResultWizard", encoding="utf-8")
+
+        wiz.export_sharded(str(tmp_path), prefixes=["mechanics"])
+
+        files = sorted(p.name for p in tmp_path.iterdir())
+        assert files == ["appendix.tex", "index.tex", "mechanics.tex", "notes.tex", "results.tex"]
+        assert r"\input{optics}" not in _read(tmp_path / "index.tex")
+        assert r"\resultOpticsLens}" in _read(tmp_path / "results.tex")
+
+    def test_invalid_groups_in_index_are_ignored(self, tmp_path):
+        wiz.export_sharded(str(tmp_path))
+        index = _read(tmp_path / "index.tex").replace(
+            r"%   \input{results}", r"%   \input{results}" + "\n" + r"%   \input{../outside}"
+        )
+        (tmp_path / "index.tex").write_text(index, encoding="utf-8")
+        outside = tmp_path.parent / "outside.tex"
+        outside.write_text("", encoding="utf-8")
+
+        try:
+            wiz.export_sharded(str(tmp_path))
+            assert outside.exists()
+        finally:
+            outside.unlink()
+
+    @pytest.mark.parametrize("group", ["a b", "chapter/1", "index", ""])
+    def test_invalid_group(self, group):
+        with pytest.raises(ValueError):
+            wiz.res("invalid group", 1.0, group=group)
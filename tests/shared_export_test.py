@@ -0,0 +1,75 @@
+import multiprocessing
+import os
+
+import resultwizard as wiz
+
+
+def _declare_results(filepath: str, job: int, barrier=None):
+    wiz.config_init(export_auto_to=filepath, export_shared=True)
+    for i in range(20):
+        wiz.res(f"job {job} result {i}", job + i / 10, [(0.01, f"uncert{job}")])
+    if barrier is not None:
+        # Keep running until all jobs have exported, such that they belong to the same run
+        barrier.wait()
+
+
+def _run_jobs(context, filepath: str, jobs: range):
+    barrier = context.Barrier(len(jobs))
+    processes = [
+        context.Process(target=_declare_results, args=(filepath, job, barrier)) for job in jobs
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+
+def _read(path) -> str:
+    with open(path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
+class TestSharedExport:
+
+    def test_union_of_all_processes(self, tmp_path):
+        filepath = str(tmp_path / "results.tex")
+        # Spawned processes don't inherit the results declared by other tests
+        context = multiprocessing.get_context("spawn")
+        _run_jobs(context, filepath, range(4))
+
+        content = _read(filepath)
+        for word in ["Zero", "One", "Two", "Three"]:
+            assert rf"\newcommand*{{\resultJob{word}ResultNineteen}}" in content
+            assert rf"\NewDocumentCommand{{\UncertUncert{word}}}" in content
+        assert content.count(r"\newcommand*") == 4 * 20
+
+    def test_same_as_normal_export_for_single_process(self, tmp_path):
+        (tmp_path / "shared").mkdir()
+        (tmp_path / "normal").mkdir()
+        try:
+            wiz.config_init(ignore_result_overwrite=True)
+            wiz.res("shared a", 1.23, 0.04, r"\m")
+            wiz.export(str(tmp_path / "normal" / "results.tex"))
+
+            wiz.config_init(ignore_result_overwrite=True, export_shared=True)
+            wiz.export(str(tmp_path / "shared" / "results.tex"))
+        finally:
+            wiz.config_init()
+
+        assert _read(tmp_path / "shared" / "results.tex") == _read(
+            tmp_path / "normal" / "results.tex"
+        )
+
+    def test_fragments_of_previous_runs_are_removed(self, tmp_path):
+        filepath = str(tmp_path / "results.tex")
+        context = multiprocessing.get_context("spawn")
+        _run_jobs(context, filepath, range(2))
+        _run_jobs(context, filepath, range(2, 3))
+
+        content = _read(filepath)
+        assert r"\resultJobTwoResultNineteen" in content
+        assert r"\resultJobZero" not in content
+        assert r"\resultJobOne" not in content
+        fragments = [f for f in os.listdir(tmp_path / ".results.tex.parts") if f.endswith(".json")]
+        assert len(fragments) == 1
@@ -0,0 +1,45 @@
+import io
+
+import pytest
+
+import resultwizard as wiz
+
+
+@pytest.fixture
+def results():
+    wiz.config_init(print_auto=False, ignore_result_overwrite=True)
+    wiz.res("stream a", 1.2345, 0.012, r"\m")
+    wiz.res("stream b", 42.0, sys=0.3, stat=0.1)
+    yield
+    wiz.config_init()
+
+
+@pytest.mark.usefixtures("results")
+class TestStreamExport:
+
+    def test_same_output_as_file(self, tmp_path):
+        path = tmp_path / "results.tex"
+        wiz.export(str(path))
+
+        stream = io.StringIO()
+        wiz.export(stream)
+
+        with open(path, "r", encoding="utf-8") as file:
+            assert stream.getvalue() == file.read()
+
+    def test_input_name_of_stream_without_name(self):
+        stream = io.StringIO()
+        wiz.export(stream)
+        assert r"\input{results}" in stream.getvalue()
+
+    def test_input_name_of_open_file(self, tmp_path):
+        with open(tmp_path / "my_results.tex", "w", encoding="utf-8") as file:
+            wiz.export(file)
+
+        with open(tmp_path / "my_results.tex", "r", encoding="utf-8") as file:
+            assert r"\input{my_results}" in file.read()
+
+    def test_no_messages_printed(self, capsys):
+        stream = io.StringIO()
+        wiz.export(stream)
+        assert capsys.readouterr().out == ""
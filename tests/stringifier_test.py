@@ -0,0 +1,77 @@
+from decimal import Decimal
+
+import pytest
+
+from application.latex_better_siunitx_stringifier import LatexBetterSiunitxStringifier
+from application.latex_commandifier import LatexCommandifier
+from application.latex_stringifier import LatexStringifier
+from application.rounder import Rounder, RoundingConfig
+from application.stringifier import Stringifier, StringifierConfig
+from domain.result import Result
+from domain.uncertainty import Uncertainty
+from domain.value import Value
+
+STRINGIFIERS = [LatexStringifier, LatexBetterSiunitxStringifier]
+
+
+def _result(value: str | float, uncertainties: list) -> Result:
+    uncerts = [Uncertainty(Value(Decimal(u)), name) for u, name in uncertainties]
+    result = Result("a", Value(Decimal(value)), r"\m", uncerts, None, None)
+    Rounder.round_result(result, RoundingConfig(-1, -1, 2, -1))
+    return result
+
+
+# The second result uses scientific notation only because of its uncertainty
+RESULTS = [
+    _result("1.2345", [("0.1", "sys"), ("0.2", "stat")]),
+    _result("1234", [("213", "sys"), ("0.2", "stat")]),
+    _result("0.000123", [("0.0000123", "")]),
+]
+
+
+class TestNumberParts:
+
+    @pytest.mark.parametrize("stringifier_class", STRINGIFIERS)
+    @pytest.mark.parametrize("result", RESULTS)
+    def test_reused_value_digits(self, stringifier_class, result: Result):
+        s: Stringifier = stringifier_class(StringifierConfig(-2, 3, "result"))
+        parts = s.create_number_parts(result.value, result.uncertainties)
+
+        assert s.create_number_parts(result.value, [], parts) == s.create_number_parts(
+            result.value, []
+        )
+        assert s.assemble_str(parts, result.unit) == s.create_str(
+            result.value, result.uncertainties, result.unit
+        )
+
+    @pytest.mark.parametrize("stringifier_class", STRINGIFIERS)
+    @pytest.mark.parametrize("result", RESULTS)
+    def test_command_contains_all_variants(self, stringifier_class, result: Result):
+        latexer = LatexCommandifier(stringifier_class(StringifierConfig(-2, 3, "result")))
+        cmd = latexer.result_to_latex_cmd(result)
+
+        assert latexer.result_to_latex_str(result) in cmd
+        assert latexer.result_to_latex_str_value(result) in cmd
+        assert latexer.result_to_latex_str_without_uncert(result) in cmd
+        assert latexer.result_to_latex_str_without_unit(result) in cmd
+        short_result = result.get_short_result()
+        if short_result is not None:
+            assert latexer.result_to_latex_str(short_result) in cmd
+
+
+class TestFloatPowersOfTen:
+
+    @pytest.mark.parametrize(
+        "value, uncertainties, expected",
+        [
+            (1e-6, [], r"1.0 \cdot 10^{-6}"),
+            (1e-7, [], r"1.0 \cdot 10^{-7}"),
+            (9.999999, [(1e-6, "")], r"9.9999990 \pm \num{0.0000010}"),
+            (3.2, [(1e-7, "")], r"3.20000000 \pm \num{0.00000010}"),
+        ],
+    )
+    def test_rounded_like_the_power_of_ten(self, value, uncertainties, expected):
+        result = _result(value, uncertainties)
+        s = LatexStringifier(StringifierConfig(-2, 3, "result"))
+
+        assert s.create_str(result.value, result.uncertainties, "") == expected
@@ -0,0 +1,85 @@
+# pylint: disable=redefined-outer-name
+
+import io
+import threading
+from decimal import Decimal
+
+import pytest
+
+import resultwizard as wiz
+from application.cache import ResultsCache
+from domain.result import Result
+from domain.value import Value
+
+NUM_WRITERS = 8
+NUM_EXPORTERS = 4
+RESULTS_PER_WRITER = 150
+
+
+@pytest.fixture
+def fresh_config():
+    wiz.config_init(ignore_result_overwrite=True, render_cache_size=100)
+    yield
+    wiz.config_init()
+
+
+def _run_threads(targets) -> list:
+    errors = []
+
+    def run(target):
+        try:
+            target()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            errors.append(exc)
+
+    threads = [threading.Thread(target=run, args=(target,)) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+class TestThreadSafety:
+
+    @pytest.mark.usefixtures("fresh_config")
+    def test_register_and_export_concurrently(self):
+        writers_done = threading.Event()
+        num_writers_done = []
+
+        def writer(w: int):
+            def run():
+                for i in range(RESULTS_PER_WRITER):
+                    wiz.res(f"stress {w} {i}", 1.0 + i, [(0.1, "sys"), (0.2, "stat")], r"\m")
+                num_writers_done.append(w)
+                if len(num_writers_done) == NUM_WRITERS:
+                    writers_done.set()
+
+            return run
+
+        def exporter():
+            while not writers_done.is_set():
+                wiz.export(io.StringIO())
+
+        targets = [writer(w) for w in range(NUM_WRITERS)] + [exporter] * NUM_EXPORTERS
+        assert not _run_threads(targets)
+
+        stream = io.StringIO()
+        wiz.export(stream)
+        content = stream.getvalue()
+        for w in ["Zero", "Seven"]:
+            for i in ["Zero", "OneHundredFortyNine"]:
+                assert rf"\newcommand*{{\resultStress{w}{i}}}" in content
+
+    def test_result_changed_while_rendering_stays_dirty(self):
+        cache = ResultsCache()
+        cache.configure(False)
+        cache.add("a", Result("a", Value(Decimal("1"), 0), "", [], None, None))
+
+        def render(result: Result) -> str:
+            # Another thread replaces the result while it is being rendered
+            cache.add("a", Result("a", Value(Decimal("2"), 0), "", [], None, None))
+            return str(result.value.get())
+
+        assert cache.get_all_rendered(render, "key") == ["1"]
+        assert cache.get_all_rendered(lambda r: str(r.value.get()), "key") == ["2"]